@@ -1,167 +1,9 @@
 # -*- coding: utf-8 -*-
-from setuptools import setup, find_packages  # type: ignore
+"""兼容旧工具链的安装入口。
 
-setup(
-    name="jarvis-ai-assistant",
-    version="0.7.2",
-    author="skyfire",
-    author_email="skyfireitdiy@hotmail.com",
-    description="An AI assistant that uses various tools to interact with the system",
-    long_description=open("README.md", encoding="utf-8").read(),
-    long_description_content_type="text/markdown",
-    url="https://github.com/skyfireitdiy/Jarvis",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    include_package_data=True,
-    package_data={
-        "jarvis": ["jarvis_data/**/*"],
-    },
-    install_requires=[
-        "requests==2.32.3",
-        "colorama==0.4.6",
-        "prompt_toolkit==3.0.50",
-        "pygments==2.19.1",
-        "fuzzywuzzy==0.18.0",
-        "fastapi==0.115.12",
-        "uvicorn==0.33.0",
-        "rich==14.0.0",
-        "python-Levenshtein==0.25.1",
-        "tiktoken==0.7.0",
-        "pillow==10.2.0",
-        "openai==1.78.1",
-        "tabulate==0.9.0",
-        "pyte==0.8.2",
-        "pyyaml>=5.3.1",
-        "jsonnet>=0.20.0",
-        "ddgs==9.0.2",
-        "lxml==6.0.0",
-        "markdownify>=1.1.0",
-        "typer",
-        "plotext==5.2.8",
-        "packaging",
-        "tree-sitter",
-        "tree-sitter-python",
-        "tree-sitter-javascript",
-        "tree-sitter-typescript",
-        "tree-sitter-rust",
-        "tree-sitter-go",
-        "tree-sitter-java",
-        "tree-sitter-cpp",
-        "tree-sitter-c",
-        "tree-sitter-json",
-        "tree-sitter-yaml",
-        "tree-sitter-markdown",
-        "tree-sitter-html",
-        "tree-sitter-css",
-        "tree-sitter-bash",
-        "tree-sitter-ruby",
-        "tree-sitter-php",
-        "tree-sitter-sql",
-    ],
-    extras_require={
-        "dev": ["pytest", "ruff", "mypy", "build", "twine"],
-        "rag": [
-            "langchain",
-            "langchain-community",
-            "langchain-huggingface",
-            "chromadb",
-            "diskcache",
-            "sentence-transformers==2.7.0",
-            "torch>=2.6",
-            "unstructured[md]",
-            "rank-bm25",
-            "pathspec",
-        ],
-        "clang16": ["clang==16.*"],
-        "clang17": ["clang==17.*"],
-        "clang18": ["clang==18.*"],
-        "clang19": ["clang==19.*"],
-        "clang20": ["clang==20.*"],
-        "clang21": ["clang==21.*"],
-        "tree-sitter-python": ["tree-sitter", "tree-sitter-python"],
-        "tree-sitter-javascript": ["tree-sitter", "tree-sitter-javascript"],
-        "tree-sitter-typescript": ["tree-sitter", "tree-sitter-typescript"],
-        "tree-sitter-rust": ["tree-sitter", "tree-sitter-rust"],
-        "tree-sitter-go": ["tree-sitter", "tree-sitter-go"],
-        "tree-sitter-java": ["tree-sitter", "tree-sitter-java"],
-        "tree-sitter-cpp": ["tree-sitter", "tree-sitter-cpp"],
-        "tree-sitter-c": ["tree-sitter", "tree-sitter-c"],
-        "tree-sitter-json": ["tree-sitter", "tree-sitter-json"],
-        "tree-sitter-yaml": ["tree-sitter", "tree-sitter-yaml"],
-        "tree-sitter-markdown": ["tree-sitter", "tree-sitter-markdown"],
-        "tree-sitter-html": ["tree-sitter", "tree-sitter-html"],
-        "tree-sitter-css": ["tree-sitter", "tree-sitter-css"],
-        "tree-sitter-bash": ["tree-sitter", "tree-sitter-bash"],
-        "tree-sitter-ruby": ["tree-sitter", "tree-sitter-ruby"],
-        "tree-sitter-php": ["tree-sitter", "tree-sitter-php"],
-        "tree-sitter-sql": ["tree-sitter", "tree-sitter-sql"],
-        "tree-sitter-all": [
-            "tree-sitter",
-            "tree-sitter-python",
-            "tree-sitter-javascript",
-            "tree-sitter-typescript",
-            "tree-sitter-rust",
-            "tree-sitter-go",
-            "tree-sitter-java",
-            "tree-sitter-cpp",
-            "tree-sitter-c",
-            "tree-sitter-json",
-            "tree-sitter-yaml",
-            "tree-sitter-markdown",
-            "tree-sitter-html",
-            "tree-sitter-css",
-            "tree-sitter-bash",
-            "tree-sitter-ruby",
-            "tree-sitter-php",
-            "tree-sitter-sql",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "jarvis=jarvis.jarvis_agent.jarvis:main",
-            "jvs=jarvis.jarvis_agent.jarvis:main",
-            "jarvis-code-agent=jarvis.jarvis_code_agent.code_agent:main",
-            "jca=jarvis.jarvis_code_agent.code_agent:main",
-            "jarvis-smart-shell=jarvis.jarvis_smart_shell.main:main",
-            "jss=jarvis.jarvis_smart_shell.main:main",
-            "jarvis-platform-manager=jarvis.jarvis_platform_manager.main:main",
-            "jpm=jarvis.jarvis_platform_manager.main:main",
-            "jarvis-git-commit=jarvis.jarvis_git_utils.git_commiter:main",
-            "jgc=jarvis.jarvis_git_utils.git_commiter:main",
-            "jarvis-code-review=jarvis.jarvis_code_analysis.code_review:main",
-            "jcr=jarvis.jarvis_code_analysis.code_review:main",
-            "jarvis-git-squash=jarvis.jarvis_git_squash.main:main",
-            "jgs=jarvis.jarvis_git_squash.main:main",
-            "jarvis-multi-agent=jarvis.jarvis_multi_agent.main:main",
-            "jma=jarvis.jarvis_multi_agent.main:main",
-            "jarvis-agent=jarvis.jarvis_agent.main:main",
-            "ja=jarvis.jarvis_agent.main:main",
-            "jarvis-tool=jarvis.jarvis_tools.cli.main:main",
-            "jt=jarvis.jarvis_tools.cli.main:main",
-            "jarvis-memory-organizer=jarvis.jarvis_memory_organizer.memory_organizer:main",
-            "jmo=jarvis.jarvis_memory_organizer.memory_organizer:main",
-            "jarvis-methodology=jarvis.jarvis_methodology.main:main",
-            "jm=jarvis.jarvis_methodology.main:main",
-            "jarvis-rag=jarvis.jarvis_rag.cli:main",
-            "jrg=jarvis.jarvis_rag.cli:main",
-            "jarvis-stats=jarvis.jarvis_stats.cli:main",
-            "jst=jarvis.jarvis_stats.cli:main",
-            "jarvis-sec=jarvis.jarvis_sec.cli:main",
-            "jsec=jarvis.jarvis_sec.cli:main",
-            "jarvis-c2rust=jarvis.jarvis_c2rust.cli:main",
-            "jc2r=jarvis.jarvis_c2rust.cli:main",
-        ],
-    },
-    python_requires=">=3.9,<3.13",
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: POSIX :: Linux",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-    ],
-)
+包元数据、依赖与入口点统一维护在 pyproject.toml 中，
+此文件仅保留以支持 `python setup.py` 风格的旧调用方式。
+"""
+from setuptools import setup  # type: ignore
+
+setup()
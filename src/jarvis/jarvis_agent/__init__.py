@@ -489,10 +489,10 @@ class Agent:
         platform_name = get_normal_platform_name(model_group)
         model_name = get_normal_model_name(model_group)
 
-        maybe_model = PlatformRegistry().create_platform(platform_name)
+        maybe_model = PlatformRegistry.get_global_platform_registry().create_platform(platform_name)
         if maybe_model is None:
             print(f"⚠️ 平台 {platform_name} 不存在，将使用普通模型")
-            maybe_model = PlatformRegistry().get_normal_platform()
+            maybe_model = PlatformRegistry.get_global_platform_registry().get_normal_platform()
 
         # 在此处收敛为非可选类型，确保后续赋值满足类型检查
         self.model = maybe_model
@@ -1285,7 +1285,7 @@ class Agent:
 
     def _create_temp_model(self, system_prompt: str) -> BasePlatform:
         """创建一个用于执行一次性任务的临时模型实例，以避免污染主会话。"""
-        temp_model = PlatformRegistry().create_platform(
+        temp_model = PlatformRegistry.get_global_platform_registry().create_platform(
             self.model.platform_name()  # type: ignore
         )
         if not temp_model:
@@ -1338,12 +1338,16 @@ class Agent:
         if len(all_tools) <= threshold:
             return
 
-        # 为工具选择构建提示
-        tools_prompt_part = ""
-        tool_names = []
-        for i, tool in enumerate(all_tools, 1):
-            tool_names.append(tool["name"])
-            tools_prompt_part += f"{i}. {tool['name']}: {tool['description']}\n"
+        # 任务过于简短时跳过筛选：额外的大模型往返开销远超收益，直接使用全部工具
+        if len(task.strip()) < 20:
+            return
+
+        # 为工具选择构建提示（列表累积 + join，避免循环内字符串拼接）
+        tool_names = [tool["name"] for tool in all_tools]
+        tools_prompt_part = "".join(
+            f"{i}. {tool['name']}: {tool['description']}\n"
+            for i, tool in enumerate(all_tools, 1)
+        )
 
         selection_prompt = f"""
 用户任务是：
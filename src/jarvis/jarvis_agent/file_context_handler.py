@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Tuple, List, Dict, Optional, Callable
 
 
@@ -190,6 +191,15 @@ def format_symbols_output(filepath: str, symbols: List[Dict[str, Any]]) -> str:
     return "\n".join(output_lines)
 
 
+def _extract_symbols_if_text(abs_path: str) -> List[Dict[str, Any]]:
+    """
+    Extract symbols for a path if it is an existing text file, else return [].
+    """
+    if os.path.isfile(abs_path) and is_text_file(abs_path):
+        return extract_symbols_from_file(abs_path)
+    return []
+
+
 def file_context_handler(user_input: str, agent_: Any) -> Tuple[str, bool]:
     """
     Extracts file paths from the input, extracts symbols from those files,
@@ -220,17 +230,21 @@ def file_context_handler(user_input: str, agent_: Any) -> Tuple[str, bool]:
 
     added_context = ""
 
-    for abs_path in file_paths:
-        if os.path.isfile(abs_path) and is_text_file(abs_path):
-            # Extract symbols from the file
-            symbols = extract_symbols_from_file(abs_path)
-            
-            if symbols:
-                # Remove all original path tokens that map to this absolute path to avoid redundancy
-                for _raw in abs_to_raws.get(abs_path, []):
-                    user_input = user_input.replace(f"'{_raw}'", "")
-                # Append the formatted symbols output
-                added_context += format_symbols_output(abs_path, symbols)
+    # 多文件时并行提取符号：文件打开/读取为I/O密集，线程池摊薄磁盘延迟；
+    # 结果按原始顺序回收，输出顺序与串行版本一致
+    if len(file_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            symbol_lists = list(executor.map(_extract_symbols_if_text, file_paths))
+    else:
+        symbol_lists = [_extract_symbols_if_text(file_paths[0])]
+
+    for abs_path, symbols in zip(file_paths, symbol_lists):
+        if symbols:
+            # Remove all original path tokens that map to this absolute path to avoid redundancy
+            for _raw in abs_to_raws.get(abs_path, []):
+                user_input = user_input.replace(f"'{_raw}'", "")
+            # Append the formatted symbols output
+            added_context += format_symbols_output(abs_path, symbols)
 
     if added_context:
         user_input = user_input.strip() + added_context
@@ -29,6 +29,7 @@ import subprocess
 from pathlib import Path
 import signal
 import yaml  # type: ignore
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 from rich.table import Table
 from rich.console import Console
 
@@ -263,7 +264,7 @@ def handle_restore_option(restore_path: Optional[str], config_file: Optional[str
             cfg_path = Path(os.path.expanduser(os.path.expandvars(config_file)))
             if cfg_path.is_file():
                 with open(cfg_path, "r", encoding="utf-8", errors="ignore") as cf:
-                    cfg_data = yaml.safe_load(cf) or {}
+                    cfg_data = yaml_safe_load(cf) or {}
                 if isinstance(cfg_data, dict):
                     val = cfg_data.get("JARVIS_DATA_PATH")
                     if isinstance(val, str) and val.strip():
@@ -466,7 +467,7 @@ def handle_builtin_config_selector(
                             with open(
                                 fpath, "r", encoding="utf-8", errors="ignore"
                             ) as fh:
-                                data = yaml.safe_load(fh) or {}
+                                data = yaml_safe_load(fh) or {}
                             if isinstance(data, dict):
                                 name = data.get("name") or data.get("title") or name
                                 desc = data.get("description") or data.get("desc") or ""
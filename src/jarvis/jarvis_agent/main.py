@@ -4,6 +4,7 @@ from typing import Optional
 
 import typer
 import yaml  # type: ignore[import-untyped]
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 
 from jarvis.jarvis_agent import Agent
 from jarvis.jarvis_utils.input import get_multiline_input
@@ -28,7 +29,7 @@ def load_config(config_path: str) -> dict:
 
     with open(config_path, "r", encoding="utf-8", errors="ignore") as f:
         try:
-            config = yaml.safe_load(f)
+            config = yaml_safe_load(f)
             return config if config else {}
         except yaml.YAMLError as e:
             print(f"❌ 配置文件解析失败: {str(e)}")
@@ -40,9 +40,12 @@ class AgentRunLoop:
             try:
                 self.conversation_rounds += 1
                 if self.conversation_rounds % self.tool_reminder_rounds == 0:
-                    self.agent.session.addon_prompt = join_prompts(
-                        [self.agent.session.addon_prompt, self.agent.get_tool_usage_prompt()]
-                    )
+                    reminder = self.agent.get_tool_usage_prompt()
+                    # 提醒最多追加一次：已在附加提示中等待发送时不再重复拼接
+                    if reminder and reminder not in (self.agent.session.addon_prompt or ""):
+                        self.agent.session.addon_prompt = join_prompts(
+                            [self.agent.session.addon_prompt, reminder]
+                        )
                 # 基于轮次的自动总结判断：达到阈值后执行一次总结与历史清理
                 if self.conversation_rounds >= self.auto_summary_rounds:
                     summary_text = self.agent._summarize_and_clear_history()
@@ -150,9 +153,13 @@ class AgentRunLoop:
                         # 如果连续5次没有工具调用，添加工具使用提示
                         if ag._no_tool_call_count >= 5:
                             tool_usage_prompt = ag.get_tool_usage_prompt()
-                            ag.session.addon_prompt = join_prompts(
-                                [ag.session.addon_prompt, tool_usage_prompt]
-                            )
+                            # 同一份提醒已在等待发送时不再重复追加
+                            if tool_usage_prompt and tool_usage_prompt not in (
+                                ag.session.addon_prompt or ""
+                            ):
+                                ag.session.addon_prompt = join_prompts(
+                                    [ag.session.addon_prompt, tool_usage_prompt]
+                                )
                             # 重置计数器，避免重复添加
                             ag._no_tool_call_count = 0
 
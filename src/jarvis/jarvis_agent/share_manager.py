@@ -2,7 +2,7 @@
 """分享管理模块，负责工具和方法论的分享功能"""
 import os
 import subprocess
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Tuple
 from abc import ABC, abstractmethod
 
 from prompt_toolkit import prompt
@@ -16,10 +16,11 @@ def parse_selection(selection_str: str, max_value: int) -> List[int]:
 
     例如: "1,2,3,4-9,20" -> [1, 2, 3, 4, 5, 6, 7, 8, 9, 20]
     """
-    selected: Set[int] = set()
-    parts = selection_str.split(",")
+    # 先解析为(lo, hi)区间，合并后再展开；
+    # 分配与哈希开销只和区间数量相关，而不是选中序号的总数
+    intervals: List[Tuple[int, int]] = []
 
-    for part in parts:
+    for part in selection_str.split(","):
         part = part.strip()
         if "-" in part:
             # 处理范围选择
@@ -27,20 +28,37 @@ def parse_selection(selection_str: str, max_value: int) -> List[int]:
                 start_str, end_str = part.split("-")
                 start_num = int(start_str.strip())
                 end_num = int(end_str.strip())
-                if 1 <= start_num <= max_value and 1 <= end_num <= max_value:
-                    selected.update(range(start_num, end_num + 1))
             except ValueError:
                 continue
+            if (
+                1 <= start_num <= max_value
+                and 1 <= end_num <= max_value
+                and start_num <= end_num
+            ):
+                intervals.append((start_num, end_num))
         else:
             # 处理单个数字
             try:
                 num = int(part)
-                if 1 <= num <= max_value:
-                    selected.add(num)
             except ValueError:
                 continue
+            if 1 <= num <= max_value:
+                intervals.append((num, num))
+
+    if not intervals:
+        return []
+
+    # 合并重叠或相邻的区间
+    intervals.sort()
+    merged: List[Tuple[int, int]] = [intervals[0]]
+    for lo, hi in intervals[1:]:
+        last_lo, last_hi = merged[-1]
+        if lo <= last_hi + 1:
+            merged[-1] = (last_lo, max(last_hi, hi))
+        else:
+            merged.append((lo, hi))
 
-    return sorted(list(selected))
+    return [i for lo, hi in merged for i in range(lo, hi + 1)]
 
 
 class ShareManager(ABC):
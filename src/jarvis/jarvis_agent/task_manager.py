@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """任务管理模块，负责加载和选择预定义任务"""
+import hashlib
+import json
 import os
-from typing import Dict
+import tempfile
+from typing import Dict, Optional
 
 import yaml  # type: ignore
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 from prompt_toolkit import prompt
 from rich.table import Table
 from rich.console import Console
@@ -17,6 +21,72 @@ from jarvis.jarvis_utils.config import get_data_dir
 from jarvis.jarvis_utils.fzf import fzf_select
 
 
+def _task_cache_path(source_path: str) -> str:
+    """返回某个pre-command文件对应的JSON缓存路径。
+
+    缓存统一放在数据目录下，避免往用户项目里写sidecar文件。
+    """
+    digest = hashlib.md5(os.path.abspath(source_path).encode("utf-8")).hexdigest()
+    return os.path.join(get_data_dir(), "cache", f"pre-command-{digest}.json")
+
+
+def _read_task_cache(cache_path: str, source_mtime: int) -> Optional[Dict[str, str]]:
+    """读取JSON缓存，源文件未变化（mtime一致）时返回缓存的任务表。"""
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("mtime") == source_mtime and isinstance(
+            cached.get("tasks"), dict
+        ):
+            return cached["tasks"]
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_task_cache(
+    cache_path: str, source_mtime: int, tasks: Dict[str, str]
+) -> None:
+    """写入JSON缓存，先写临时文件再rename保证崩溃安全；失败时静默放弃。"""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"mtime": source_mtime, "tasks": tasks}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _load_task_file(source_path: str) -> Dict[str, str]:
+    """加载单个pre-command文件，优先走JSON缓存。
+
+    JSON解码比YAML解析快数倍，文件未修改时直接用缓存，
+    只有首次或修改后才做一次完整YAML解析并刷新缓存。
+    """
+    source_mtime = os.stat(source_path).st_mtime_ns
+    cache_path = _task_cache_path(source_path)
+    cached_tasks = _read_task_cache(cache_path, source_mtime)
+    if cached_tasks is not None:
+        return cached_tasks
+
+    with open(source_path, "r", encoding="utf-8", errors="ignore") as f:
+        raw_tasks = yaml_safe_load(f)
+    tasks: Dict[str, str] = {}
+    if isinstance(raw_tasks, dict):
+        # YAML解析出的键值通常已是str，类型命中时跳过str()的重复分配；
+        # 用字典推导式让CPython在C层一次性构建结果字典
+        tasks = {
+            (name if type(name) is str else str(name)): (
+                desc if type(desc) is str else str(desc)
+            )
+            for name, desc in raw_tasks.items()
+            if desc
+        }
+    _write_task_cache(cache_path, source_mtime, tasks)
+    return tasks
+
+
 class TaskManager:
     """任务管理器，负责预定义任务的加载和选择"""
 
@@ -31,14 +101,7 @@ class TaskManager:
         if os.path.exists(pre_command_path):
             print(f"ℹ️ 从{pre_command_path}加载预定义任务...")
             try:
-                with open(
-                    pre_command_path, "r", encoding="utf-8", errors="ignore"
-                ) as f:
-                    user_tasks = yaml.safe_load(f)
-                if isinstance(user_tasks, dict):
-                    for name, desc in user_tasks.items():
-                        if desc:
-                            tasks[str(name)] = str(desc)
+                tasks.update(_load_task_file(pre_command_path))
                 print(f"✅ 预定义任务加载完成 {pre_command_path}")
             except (yaml.YAMLError, OSError):
                 print(f"❌ 预定义任务加载失败 {pre_command_path}")
@@ -49,14 +112,7 @@ class TaskManager:
             abs_path = os.path.abspath(pre_command_path)
             print(f"ℹ️ 从{abs_path}加载预定义任务...")
             try:
-                with open(
-                    pre_command_path, "r", encoding="utf-8", errors="ignore"
-                ) as f:
-                    local_tasks = yaml.safe_load(f)
-                if isinstance(local_tasks, dict):
-                    for name, desc in local_tasks.items():
-                        if desc:
-                            tasks[str(name)] = str(desc)
+                tasks.update(_load_task_file(pre_command_path))
                 print(f"✅ 预定义任务加载完成 {pre_command_path}")
             except (yaml.YAMLError, OSError):
                 print(f"❌ 预定义任务加载失败 {pre_command_path}")
@@ -112,6 +168,11 @@ class TaskManager:
                 if not choice_str:
                     return ""
 
+                # 先做数字预检，避免把非法输入交给int()走异常控制流
+                if not choice_str.isdigit():
+                    print("⚠️ 无效的选择。请输入列表中的一个号码。")
+                    continue
+
                 choice = int(choice_str)
                 if choice == 0:
                     return ""
@@ -134,5 +195,3 @@ class TaskManager:
 
             except (KeyboardInterrupt, EOFError):
                 return ""
-            except ValueError as val_err:
-                print(f"❌ 选择任务失败: {str(val_err)}")
@@ -86,6 +86,17 @@ class OptimizeStats:
             self.errors = []
 
 
+def _first_line(diag: object) -> str:
+    """取诊断文本的首行作为错误摘要。
+
+    用split("\n", 1)在首个换行处截断，避免为一条摘要把整段cargo
+    诊断splitlines成完整列表。
+    """
+    if isinstance(diag, str) and diag:
+        return diag.split("\n", 1)[0]
+    return "failed"
+
+
 def _run_cmd(cmd: List[str], cwd: Path, env: Optional[Dict[str, str]] = None, timeout: Optional[int] = None) -> Tuple[int, str, str]:
     p = subprocess.Popen(
         cmd,
@@ -413,7 +424,7 @@ class Optimizer:
                             # 循环最小修复
                             fixed = self._build_fix_loop(targets)
                             if not fixed:
-                                first = (diag_full.splitlines()[0] if isinstance(diag_full, str) and diag_full else "failed")
+                                first = _first_line(diag_full)
                                 self.stats.errors.append(f"test after unsafe_cleanup failed: {first}")
                                 # 回滚到快照并结束
                                 try:
@@ -433,7 +444,7 @@ class Optimizer:
                         if not ok:
                             fixed = self._build_fix_loop(targets)
                             if not fixed:
-                                first = (diag_full.splitlines()[0] if isinstance(diag_full, str) and diag_full else "failed")
+                                first = _first_line(diag_full)
                                 self.stats.errors.append(f"test after structure_opt failed: {first}")
                                 try:
                                     self._reset_to_snapshot()
@@ -452,7 +463,7 @@ class Optimizer:
                         if not ok:
                             fixed = self._build_fix_loop(targets)
                             if not fixed:
-                                first = (diag_full.splitlines()[0] if isinstance(diag_full, str) and diag_full else "failed")
+                                first = _first_line(diag_full)
                                 self.stats.errors.append(f"test after visibility_opt failed: {first}")
                                 try:
                                     self._reset_to_snapshot()
@@ -471,7 +482,7 @@ class Optimizer:
                         if not ok:
                             fixed = self._build_fix_loop(targets)
                             if not fixed:
-                                first = (diag_full.splitlines()[0] if isinstance(diag_full, str) and diag_full else "failed")
+                                first = _first_line(diag_full)
                                 self.stats.errors.append(f"test after doc_opt failed: {first}")
                                 try:
                                     self._reset_to_snapshot()
@@ -810,7 +821,7 @@ class Optimizer:
         if not ok:
             fixed = self._build_fix_loop(target_files)
             if not fixed:
-                first = (diag.splitlines()[0] if isinstance(diag, str) and diag else "failed")
+                first = _first_line(diag)
                 self.stats.errors.append(f"codeagent test failed: {first}")
                 try:
                     self._reset_to_snapshot()
@@ -8,7 +8,8 @@
 """
 
 import os
-import yaml
+from jarvis.jarvis_utils.yaml_compat import safe_dump as yaml_safe_dump
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -41,7 +42,7 @@ class BuildValidationConfig:
         
         try:
             with open(self.config_path, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = yaml_safe_load(f) or {}
             return self._config
         except Exception as e:
             # 配置文件损坏时，返回空配置
@@ -54,7 +55,7 @@ class BuildValidationConfig:
         try:
             self._ensure_config_dir()
             with open(self.config_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(self._config, f, allow_unicode=True, default_flow_style=False)
+                yaml_safe_dump(self._config, f, allow_unicode=True, default_flow_style=False)
             return True
         except Exception as e:
             print(f"❌ 保存构建验证配置失败: {e}")
@@ -8,6 +8,7 @@ import os
 import subprocess
 import sys
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 import typer
@@ -68,6 +69,49 @@ def _format_build_error(result: BuildResult, max_len: int = 2000) -> str:
     return full_error
 
 
+# diff预览的高亮上限（字符数）：超过则只高亮开头，避免全量高亮阻塞输出
+_DIFF_DISPLAY_LIMIT = 512 * 1024
+
+# CodeAgent默认工具集：main()每轮都会新建CodeAgent，固定为模块级元组避免重复构建
+_BASE_TOOLS = (
+    "execute_script",
+    "search_web",
+    "ask_user",
+    "read_code",
+    "save_memory",
+    "retrieve_memory",
+    "clear_memory",
+    "edit_file",
+    "rewrite_file",
+    "lsp_client",  # LSP客户端工具，用于获取代码补全、悬停等信息
+)
+
+# 代码工程师系统提示词：内容不变，模块导入时构建一次，所有CodeAgent实例共享
+_CODE_SYSTEM_PROMPT = """
+<code_engineer_guide>
+你是Jarvis代码工程师，负责代码分析和修改。核心原则：自主决策、高效精准、修改审慎、工具精通。
+
+工作流程：
+1. 分析项目结构，定位目标文件
+2. 理解需求，选择最小影响方案
+3. 代码分析（禁止虚构）：
+   - 符号分析：优先使用 lsp_client（document_symbols/get_symbol_info/search_symbol/definition/references）
+   - 内容搜索：全文搜索工具
+   - 代码阅读：read_code 工具
+   - 工具优先级：lsp_client > 全文搜索 > read_code
+4. 设计最小变更方案
+5. 先读后写，保持代码风格
+
+工具使用：
+- 符号分析：lsp_client（基于符号名，无需行列号）
+- 文件编辑：edit_file（部分修改）或 rewrite_file（全文件重写）
+
+要点：工具优先验证结论，拒绝臆测；影响最小且可回退；保持项目风格一致。
+</code_engineer_guide>
+
+"""
+
+
 class CodeAgent(Agent):
     """Jarvis系统的代码修改代理。
 
@@ -93,18 +137,11 @@ class CodeAgent(Agent):
 
         # 检测 git username 和 email 是否已设置
         self._check_git_config()
-        base_tools = [
-            "execute_script",
-            "search_web",
-            "ask_user",
-            "read_code",
-            "save_memory",
-            "retrieve_memory",
-            "clear_memory",
-            "edit_file",
-            "rewrite_file",
-            "lsp_client",  # LSP客户端工具，用于获取代码补全、悬停等信息
-        ]
+
+        # 提交工具在Agent生命周期内复用，避免每次提交都重新实例化
+        self._git_commiter = GitCommitTool()
+        # Agent会在运行期向use_tools追加工具，因此这里传入元组的列表拷贝
+        base_tools = list(_BASE_TOOLS)
 
         if append_tools:
             additional_tools = [
@@ -192,29 +229,7 @@ class CodeAgent(Agent):
 
     def _get_system_prompt(self) -> str:
         """获取代码工程师的系统提示词"""
-        return """
-<code_engineer_guide>
-你是Jarvis代码工程师，负责代码分析和修改。核心原则：自主决策、高效精准、修改审慎、工具精通。
-
-工作流程：
-1. 分析项目结构，定位目标文件
-2. 理解需求，选择最小影响方案
-3. 代码分析（禁止虚构）：
-   - 符号分析：优先使用 lsp_client（document_symbols/get_symbol_info/search_symbol/definition/references）
-   - 内容搜索：全文搜索工具
-   - 代码阅读：read_code 工具
-   - 工具优先级：lsp_client > 全文搜索 > read_code
-4. 设计最小变更方案
-5. 先读后写，保持代码风格
-
-工具使用：
-- 符号分析：lsp_client（基于符号名，无需行列号）
-- 文件编辑：edit_file（部分修改）或 rewrite_file（全文件重写）
-
-要点：工具优先验证结论，拒绝臆测；影响最小且可回退；保持项目风格一致。
-</code_engineer_guide>
-
-"""
+        return _CODE_SYSTEM_PROMPT
 
     def _read_project_rules(self) -> Optional[str]:
         """读取 .jarvis/rules 内容，如果存在则返回字符串，否则返回 None"""
@@ -458,8 +473,7 @@ class CodeAgent(Agent):
 
         if has_uncommitted_changes():
 
-            git_commiter = GitCommitTool()
-            git_commiter.execute({"prefix": prefix, "suffix": suffix, "agent": self, "model_group": getattr(self.model, "model_group", None)})
+            self._git_commiter.execute({"prefix": prefix, "suffix": suffix, "agent": self, "model_group": getattr(self.model, "model_group", None)})
 
     def _init_env(self, prefix: str, suffix: str) -> None:
         """初始化环境，组合以下功能：
@@ -703,15 +717,20 @@ class CodeAgent(Agent):
                 stderr=subprocess.DEVNULL,
                 check=True,
             )
-            git_commiter = GitCommitTool()
-            git_commiter.execute({"prefix": prefix, "suffix": suffix, "agent": self, "model_group": getattr(self.model, "model_group", None)})
+            self._git_commiter.execute({"prefix": prefix, "suffix": suffix, "agent": self, "model_group": getattr(self.model, "model_group", None)})
 
             # 在用户接受commit后，根据配置决定是否保存记忆
             if self.force_save_memory:
                 self.memory_manager.prompt_memory_save()
         elif start_commit:
             if user_confirm("是否要重置到初始提交？", True):
-                os.system(f"git reset --hard {str(start_commit)}")  # 确保转换为字符串
+                # 直接调用git，避免为单条命令fork一个shell
+                subprocess.run(
+                    ["git", "reset", "--hard", str(start_commit)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=False,
+                )
                 print("ℹ️ 已重置到初始提交")
 
     def run(self, user_input: str, prefix: str = "", suffix: str = "") -> Optional[str]:
@@ -848,13 +867,42 @@ class CodeAgent(Agent):
                         status_map[parts[1]] = status
         return status_map
 
-    def _get_file_diff(self, file_path: str) -> str:
-        """获取单文件的diff，包含新增文件内容；失败时返回空字符串"""
+    def _get_file_diff(self, file_path: str, head_exists: Optional[bool] = None) -> str:
+        """获取单文件的diff；失败时返回空字符串
+
+        注意：未跟踪文件需要调用方预先执行 git add -N，本方法不再自行
+        add/reset，便于批量预览时把索引操作合并为一次。
+        """
+        if head_exists is None:
+            head_exists = bool(get_latest_commit_hash())
+        cmd = ["git", "diff"] + (["HEAD"] if head_exists else []) + ["--", file_path]
+        res = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            check=False,
+        )
+        if res.returncode == 0:
+            return res.stdout or ""
+        return ""
+
+    def _build_per_file_patch_preview(self, modified_files: List[str]) -> str:
+        """构建按文件的补丁预览"""
+        status_map = self._build_name_status_map()
+        lines: List[str] = []
         head_exists = bool(get_latest_commit_hash())
-        try:
-            # 为了让未跟踪文件也能展示diff，临时 -N 该文件
-            subprocess.run(["git", "add", "-N", "--", file_path], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            cmd = ["git", "diff"] + (["HEAD"] if head_exists else []) + ["--", file_path]
+
+        def _get_files_numstat() -> Dict[str, Tuple[int, int]]:
+            """一次git diff --numstat获取所有文件的新增/删除行数"""
+            numstat: Dict[str, Tuple[int, int]] = {}
+            cmd = (
+                ["git", "diff", "--numstat"]
+                + (["HEAD"] if head_exists else [])
+                + ["--"]
+                + modified_files
+            )
             res = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -863,53 +911,55 @@ class CodeAgent(Agent):
                 errors="replace",
                 check=False,
             )
-            if res.returncode == 0:
-                return res.stdout or ""
-            return ""
-        finally:
-            subprocess.run(["git", "reset", "--", file_path], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-    def _build_per_file_patch_preview(self, modified_files: List[str]) -> str:
-        """构建按文件的补丁预览"""
-        status_map = self._build_name_status_map()
-        lines: List[str] = []
+            def to_int(x: str) -> int:
+                try:
+                    return int(x)
+                except Exception:
+                    # 二进制或无法解析时显示为0
+                    return 0
 
-        def _get_file_numstat(file_path: str) -> Tuple[int, int]:
-            """获取单文件的新增/删除行数，失败时返回(0,0)"""
-            head_exists = bool(get_latest_commit_hash())
-            try:
-                # 让未跟踪文件也能统计到新增行数
-                subprocess.run(["git", "add", "-N", "--", file_path], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                cmd = ["git", "diff", "--numstat"] + (["HEAD"] if head_exists else []) + ["--", file_path]
-                res = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
-                    check=False,
-                )
-                if res.returncode == 0 and res.stdout:
-                    for line in res.stdout.splitlines():
-                        parts = line.strip().split("\t")
-                        if len(parts) >= 3:
-                            add_s, del_s = parts[0], parts[1]
-
-                            def to_int(x: str) -> int:
-                                try:
-                                    return int(x)
-                                except Exception:
-                                    # 二进制或无法解析时显示为0
-                                    return 0
-
-                            return to_int(add_s), to_int(del_s)
-            finally:
-                subprocess.run(["git", "reset", "--", file_path], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return (0, 0)
+            if res.returncode == 0 and res.stdout:
+                for line in res.stdout.splitlines():
+                    parts = line.strip().split("\t")
+                    if len(parts) >= 3:
+                        numstat[parts[2]] = (to_int(parts[0]), to_int(parts[1]))
+            return numstat
 
+        # 让未跟踪文件也能统计和展示diff：批量 -N 一次，结束后批量reset，
+        # 避免每个文件一对add/reset子进程
+        subprocess.run(
+            ["git", "add", "-N", "--"] + modified_files,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            numstat_map = _get_files_numstat()
+            lines.extend(
+                self._render_file_previews(modified_files, status_map, numstat_map, head_exists)
+            )
+        finally:
+            subprocess.run(
+                ["git", "reset", "--"] + modified_files,
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        return "\n".join(lines)
+
+    def _render_file_previews(
+        self,
+        modified_files: List[str],
+        status_map: dict,
+        numstat_map: Dict[str, Tuple[int, int]],
+        head_exists: bool,
+    ) -> List[str]:
+        """按文件渲染补丁预览片段"""
+        lines: List[str] = []
         for f in modified_files:
             status = status_map.get(f, "")
-            adds, dels = _get_file_numstat(f)
+            adds, dels = numstat_map.get(f, (0, 0))
             total_changes = adds + dels
 
             # 删除文件：不展示diff，仅提示（附带删除行数信息如果可用）
@@ -926,13 +976,13 @@ class CodeAgent(Agent):
                 continue
 
             # 其它情况：展示该文件的diff
-            file_diff = self._get_file_diff(f)
+            file_diff = self._get_file_diff(f, head_exists)
             if file_diff.strip():
                 lines.append(f"文件: {f}\n```diff\n{file_diff}\n```")
             else:
                 # 当无法获取到diff（例如重命名或特殊状态），避免空输出
                 lines.append(f"- {f} 变更已记录（无可展示的文本差异）")
-        return "\n".join(lines)
+        return lines
 
     def _update_context_for_modified_files(self, modified_files: List[str]) -> None:
         """更新上下文管理器：当文件被修改后，更新符号表和依赖图"""
@@ -1296,7 +1346,17 @@ class CodeAgent(Agent):
 
         if diff:
             start_hash = get_latest_commit_hash()
-            PrettyOutput.print(diff, OutputType.CODE, lang="diff")  # 保留语法高亮
+            if len(diff) > _DIFF_DISPLAY_LIMIT:
+                # 语法高亮需要对整个diff做一遍完整解析，超大diff会在任何
+                # 输出出现前阻塞数秒；只高亮开头部分，其余以摘要提示
+                head = diff[:_DIFF_DISPLAY_LIMIT]
+                cut = head.rfind("\n")
+                if cut > 0:
+                    head = head[:cut]
+                PrettyOutput.print(head, OutputType.CODE, lang="diff")  # 保留语法高亮
+                print(f"⚠️ diff过大（共{len(diff)}字符），预览仅展示开头部分，完整内容请用git diff查看")
+            else:
+                PrettyOutput.print(diff, OutputType.CODE, lang="diff")  # 保留语法高亮
             modified_files = get_diff_file_list()
             
             # 更新上下文管理器
@@ -1345,9 +1405,8 @@ class CodeAgent(Agent):
 
                 StatsManager.increment("code_modifications", group="code_agent")
 
-                # 获取提交信息
-                end_hash = get_latest_commit_hash()
-                commits = get_commits_between(start_hash, end_hash)
+                # 获取提交信息：终点直接用HEAD，省去一次rev-parse子进程
+                commits = get_commits_between(start_hash, "HEAD")
 
                 # 添加提交信息到final_ret（按文件展示diff；删除文件仅提示）
                 if commits:
@@ -1373,8 +1432,9 @@ class CodeAgent(Agent):
                     # 静态分析
                     final_ret = self._handle_static_analysis(modified_files, build_validation_result, config, self, final_ret)
                 else:
-                    # 如果没有获取到commits，尝试直接从end_hash获取commit信息
+                    # 如果没有获取到commits，尝试直接从最新提交获取commit信息
                     commit_info = ""
+                    end_hash = get_latest_commit_hash()
                     if end_hash:
                         try:
                             result = subprocess.run(
@@ -1454,65 +1514,88 @@ class CodeAgent(Agent):
         results = []
         # 记录每个文件的检查结果
         file_results = []  # [(file_path, tool_name, status, message), ...]
-        
+
         # 按工具分组，相同工具可以批量执行
         grouped = group_commands_by_tool(commands)
-        
+
+        # 展平任务列表；各lint子进程相互独立，并行执行把墙钟时间
+        # 从各命令耗时之和压缩到最慢一条的耗时
+        tasks: List[Tuple[str, str, str]] = []
         for tool_name, file_commands in grouped.items():
             for file_path, command in file_commands:
-                file_name = os.path.basename(file_path)
-                try:
-                    # 检查文件是否存在
-                    abs_file_path = os.path.join(self.root_dir, file_path) if not os.path.isabs(file_path) else file_path
-                    if not os.path.exists(abs_file_path):
-                        file_results.append((file_name, tool_name, "跳过", "文件不存在"))
-                        continue
-                    
-                    # 打印执行的命令
-                    print(f"ℹ️ 执行: {command}")
-                    
-                    # 执行命令
-                    result = subprocess.run(
-                        command,
-                        shell=True,
-                        cwd=self.root_dir,
-                        capture_output=True,
-                        text=True,
-                        encoding="utf-8",
-                        errors="replace",
-                        timeout=30,  # 30秒超时
-                    )
-                    
-                    # 只记录有错误或警告的结果
-                    if result.returncode != 0:
-                        output = result.stdout + result.stderr
-                        if output.strip():  # 有输出才记录
-                            results.append((tool_name, file_path, command, result.returncode, output))
-                            file_results.append((file_name, tool_name, "失败", "发现问题"))
-                            # 失败时打印检查结果
-                            output_preview = output[:2000] if len(output) > 2000 else output
-                            print(f"⚠️ 检查失败 ({file_name}):\n{output_preview}")
-                            if len(output) > 2000:
-                                print(f"⚠️ ... (输出已截断，共 {len(output)} 字符)")
-                        else:
-                            file_results.append((file_name, tool_name, "通过", ""))
-                    else:
-                        file_results.append((file_name, tool_name, "通过", ""))
-                
-                except subprocess.TimeoutExpired:
-                    results.append((tool_name, file_path, command, -1, "执行超时（30秒）"))
-                    file_results.append((file_name, tool_name, "超时", "执行超时（30秒）"))
-                    print(f"⚠️ 检查超时 ({file_name}): 执行超时（30秒）")
-                except FileNotFoundError:
-                    # 工具未安装，跳过
-                    file_results.append((file_name, tool_name, "跳过", "工具未安装"))
-                    continue
-                except Exception as e:
-                    # 其他错误，记录但继续
-                    print(f"⚠️ 执行lint命令失败: {command}, 错误: {e}")
-                    file_results.append((file_name, tool_name, "失败", f"执行失败: {str(e)[:50]}"))
-                    continue
-        
+                tasks.append((tool_name, file_path, command))
+
+        def _run_one(task: Tuple[str, str, str]):
+            """执行单条lint命令，返回(错误记录或None, 文件结果, 失败输出或None)"""
+            tool_name, file_path, command = task
+            file_name = os.path.basename(file_path)
+            try:
+                # 检查文件是否存在
+                abs_file_path = os.path.join(self.root_dir, file_path) if not os.path.isabs(file_path) else file_path
+                if not os.path.exists(abs_file_path):
+                    return None, (file_name, tool_name, "跳过", "文件不存在"), None
+
+                # 执行命令
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    cwd=self.root_dir,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    timeout=30,  # 30秒超时
+                )
+
+                # 只记录有错误或警告的结果
+                if result.returncode != 0:
+                    output = result.stdout + result.stderr
+                    if output.strip():  # 有输出才记录
+                        return (
+                            (tool_name, file_path, command, result.returncode, output),
+                            (file_name, tool_name, "失败", "发现问题"),
+                            output,
+                        )
+                return None, (file_name, tool_name, "通过", ""), None
+
+            except subprocess.TimeoutExpired:
+                return (
+                    (tool_name, file_path, command, -1, "执行超时（30秒）"),
+                    (file_name, tool_name, "超时", "执行超时（30秒）"),
+                    None,
+                )
+            except FileNotFoundError:
+                # 工具未安装，跳过
+                return None, (file_name, tool_name, "跳过", "工具未安装"), None
+            except Exception as e:
+                # 其他错误，记录但继续
+                print(f"⚠️ 执行lint命令失败: {command}, 错误: {e}")
+                return None, (file_name, tool_name, "失败", f"执行失败: {str(e)[:50]}"), None
+
+        for _, _, command in tasks:
+            print(f"ℹ️ 执行: {command}")
+
+        # 并行执行，按任务顺序回收结果，输出顺序与串行版本一致
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                outcomes = list(executor.map(_run_one, tasks))
+        else:
+            outcomes = [_run_one(task) for task in tasks]
+
+        for (_, file_path, _), (record, file_result, fail_output) in zip(tasks, outcomes):
+            file_name = os.path.basename(file_path)
+            if record:
+                results.append(record)
+            file_results.append(file_result)
+            if fail_output is not None:
+                # 失败时打印检查结果
+                output_preview = fail_output[:2000] if len(fail_output) > 2000 else fail_output
+                print(f"⚠️ 检查失败 ({file_name}):\n{output_preview}")
+                if len(fail_output) > 2000:
+                    print(f"⚠️ ... (输出已截断，共 {len(fail_output)} 字符)")
+            elif file_result[2] == "超时":
+                print(f"⚠️ 检查超时 ({file_name}): 执行超时（30秒）")
+
         # 一次性打印所有检查结果
         if file_results:
             total_files = len(file_results)
@@ -8,7 +8,7 @@
 """
 
 import os
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from .base import BuildSystem
 
@@ -18,6 +18,17 @@ class BuildSystemDetector:
     
     def __init__(self, project_root: str):
         self.project_root = project_root
+        # 根目录条目缓存：一次listdir代替每个检测器各自的stat
+        self._root_entries: Optional[Set[str]] = None
+
+    def _root_has(self, name: str) -> bool:
+        """判断项目根目录下是否存在指定条目（基于一次性目录列举的集合查询）"""
+        if self._root_entries is None:
+            try:
+                self._root_entries = set(os.listdir(self.project_root))
+            except OSError:
+                self._root_entries = set()
+        return name in self._root_entries
     
     def detect(self) -> Optional[BuildSystem]:
         """检测项目使用的构建系统（兼容旧接口，返回第一个检测到的）
@@ -56,37 +67,31 @@ class BuildSystemDetector:
     
     def _detect_rust(self) -> Optional[BuildSystem]:
         """检测Rust项目（Cargo.toml）"""
-        cargo_toml = os.path.join(self.project_root, "Cargo.toml")
-        if os.path.exists(cargo_toml):
+        if self._root_has("Cargo.toml"):
             return BuildSystem.RUST
         return None
     
     def _detect_go(self) -> Optional[BuildSystem]:
         """检测Go项目（go.mod）"""
-        go_mod = os.path.join(self.project_root, "go.mod")
-        if os.path.exists(go_mod):
+        if self._root_has("go.mod"):
             return BuildSystem.GO
         return None
     
     def _detect_java_maven(self) -> Optional[BuildSystem]:
         """检测Maven项目（pom.xml）"""
-        pom_xml = os.path.join(self.project_root, "pom.xml")
-        if os.path.exists(pom_xml):
+        if self._root_has("pom.xml"):
             return BuildSystem.JAVA_MAVEN
         return None
     
     def _detect_java_gradle(self) -> Optional[BuildSystem]:
         """检测Gradle项目（build.gradle或build.gradle.kts）"""
-        build_gradle = os.path.join(self.project_root, "build.gradle")
-        build_gradle_kts = os.path.join(self.project_root, "build.gradle.kts")
-        if os.path.exists(build_gradle) or os.path.exists(build_gradle_kts):
+        if self._root_has("build.gradle") or self._root_has("build.gradle.kts"):
             return BuildSystem.JAVA_GRADLE
         return None
     
     def _detect_nodejs(self) -> Optional[BuildSystem]:
         """检测Node.js项目（package.json）"""
-        package_json = os.path.join(self.project_root, "package.json")
-        if os.path.exists(package_json):
+        if self._root_has("package.json"):
             return BuildSystem.NODEJS
         return None
     
@@ -101,25 +106,22 @@ class BuildSystemDetector:
             "poetry.lock",
         ]
         for indicator in indicators:
-            if os.path.exists(os.path.join(self.project_root, indicator)):
+            if self._root_has(indicator):
                 return BuildSystem.PYTHON
         return None
     
     def _detect_c_cmake(self) -> Optional[BuildSystem]:
         """检测CMake项目（CMakeLists.txt）"""
-        cmake_lists = os.path.join(self.project_root, "CMakeLists.txt")
-        if os.path.exists(cmake_lists):
+        if self._root_has("CMakeLists.txt"):
             # 检查是否同时存在Makefile
-            makefile = os.path.join(self.project_root, "Makefile")
-            if os.path.exists(makefile):
+            if self._root_has("Makefile"):
                 return BuildSystem.C_MAKEFILE_CMAKE
             return BuildSystem.C_CMAKE
         return None
     
     def _detect_c_makefile(self) -> Optional[BuildSystem]:
         """检测Makefile项目"""
-        makefile = os.path.join(self.project_root, "Makefile")
-        if os.path.exists(makefile):
+        if self._root_has("Makefile"):
             return BuildSystem.C_MAKEFILE
         return None
 
@@ -179,6 +179,11 @@ class FileIgnorePatterns:
         )
 
 
+# 代码分析默认忽略集合：内容固定，模块导入时计算一次，
+# 避免每个被遍历目录都重新做一遍十几个集合的并集运算
+_CODE_ANALYSIS_IGNORE_DIRS: Set[str] = FileIgnorePatterns.get_code_analysis_ignore_dirs()
+
+
 class FileIgnoreFilter:
     """文件忽略过滤器。
     
@@ -199,8 +204,8 @@ class FileIgnoreFilter:
             custom_filter: 自定义过滤函数，接收目录名，返回True表示忽略
         """
         if ignore_dirs is None:
-            ignore_dirs = FileIgnorePatterns.get_code_analysis_ignore_dirs()
-        
+            ignore_dirs = _CODE_ANALYSIS_IGNORE_DIRS
+
         self.ignore_dirs = ignore_dirs
         self.ignore_hidden = ignore_hidden
         self.custom_filter = custom_filter
@@ -296,8 +301,8 @@ def should_ignore_dir(dir_name: str, ignore_dirs: Optional[Set[str]] = None) ->
         如果应该忽略返回True
     """
     if ignore_dirs is None:
-        ignore_dirs = FileIgnorePatterns.get_code_analysis_ignore_dirs()
-    
+        ignore_dirs = _CODE_ANALYSIS_IGNORE_DIRS
+
     # 隐藏目录
     if dir_name.startswith('.'):
         return True
@@ -321,8 +326,8 @@ def filter_walk_dirs(dirs: List[str], ignore_dirs: Optional[Set[str]] = None) ->
         过滤后的目录列表
     """
     if ignore_dirs is None:
-        ignore_dirs = FileIgnorePatterns.get_code_analysis_ignore_dirs()
-    
+        ignore_dirs = _CODE_ANALYSIS_IGNORE_DIRS
+
     return [
         d for d in dirs
         if not (d.startswith('.') or d in ignore_dirs)
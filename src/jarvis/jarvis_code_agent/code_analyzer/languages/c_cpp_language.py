@@ -137,17 +137,20 @@ class CppSymbolExtractor(TreeSitterExtractor):
 
 # --- C/C++ Dependency Analyzers ---
 
+# Match #include directives, compiled once at import time
+# Format: #include <header.h> or #include "header.h"
+_INCLUDE_RE = re.compile(r'#include\s+[<"]([^>"]+)[>"]')
+
+
 class CDependencyAnalyzer(DependencyAnalyzer):
     """Analyzes C include dependencies."""
 
     def analyze_imports(self, file_path: str, content: str) -> List[Dependency]:
         """Analyzes C #include statements."""
         dependencies: List[Dependency] = []
-        
-        # Match #include directives
-        # Format: #include <header.h> or #include "header.h"
-        include_pattern = re.compile(r'#include\s+[<"]([^>"]+)[>"]')
-        
+
+        include_pattern = _INCLUDE_RE
+
         for line_num, line in enumerate(content.split('\n'), start=1):
             match = include_pattern.search(line)
             if match:
@@ -75,27 +75,26 @@ class GoSymbolExtractor(TreeSitterExtractor):
 
 # --- Go Dependency Analyzer ---
 
+# Handle single import: import "package" (also: import alias "package")
+_SINGLE_IMPORT_RE = re.compile(r'import\s+(?:"([^"]+)"|`([^`]+)`|(\w+)\s+(?:"([^"]+)"|`([^`]+)`))')
+
+# Handle block import: import ( ... )
+_BLOCK_IMPORT_RE = re.compile(r'import\s*\(([^)]+)\)', re.DOTALL)
+
+# Extract a package path (optionally aliased) from one line of a block import
+_PKG_RE = re.compile(r'(?:"([^"]+)"|`([^`]+)`|(\w+)\s+(?:"([^"]+)"|`([^`]+)`))')
+
+
 class GoDependencyAnalyzer(DependencyAnalyzer):
     """Analyzes Go import dependencies."""
 
     def analyze_imports(self, file_path: str, content: str) -> List[Dependency]:
         """Analyzes Go import statements."""
         dependencies: List[Dependency] = []
-        
-        # Match import statements
-        # Format: import "package" or import ( "package1" "package2" )
-        # Also: import alias "package"
-        re.compile(
-            r'import\s+(?:\(([^)]+)\)|(?:"([^"]+)"|`([^`]+)`)|(\w+)\s+(?:"([^"]+)"|`([^`]+)`)))',
-            re.MULTILINE
-        )
-        
-        # Handle single import: import "package"
-        single_import = re.compile(r'import\s+(?:"([^"]+)"|`([^`]+)`|(\w+)\s+(?:"([^"]+)"|`([^`]+)`))')
-        
-        # Handle block import: import ( ... )
-        block_import = re.compile(r'import\s*\(([^)]+)\)', re.DOTALL)
-        
+
+        single_import = _SINGLE_IMPORT_RE
+        block_import = _BLOCK_IMPORT_RE
+
         # Try block import first
         block_match = block_import.search(content)
         if block_match:
@@ -105,7 +104,7 @@ class GoDependencyAnalyzer(DependencyAnalyzer):
                 if not line or line.startswith('//'):
                     continue
                 # Extract package path
-                pkg_match = re.search(r'(?:"([^"]+)"|`([^`]+)`|(\w+)\s+(?:"([^"]+)"|`([^`]+)`))', line)
+                pkg_match = _PKG_RE.search(line)
                 if pkg_match:
                     pkg = pkg_match.group(1) or pkg_match.group(2) or pkg_match.group(4) or pkg_match.group(5)
                     alias = pkg_match.group(3)
@@ -81,22 +81,25 @@ class JavaSymbolExtractor(TreeSitterExtractor):
 
 # --- Java Dependency Analyzer ---
 
+# Java import statements, compiled once at import time
+# import package.Class;
+# import package.*;
+# import static package.Class.method;
+_IMPORT_RE = re.compile(
+    r'import\s+(?:static\s+)?([\w.]+)(?:\.\*)?\s*;',
+    re.MULTILINE
+)
+
+
 class JavaDependencyAnalyzer(DependencyAnalyzer):
     """Analyzes Java import dependencies."""
 
     def analyze_imports(self, file_path: str, content: str) -> List[Dependency]:
         """Analyzes Java import statements."""
         dependencies: List[Dependency] = []
-        
-        # Java import statements
-        # import package.Class;
-        # import package.*;
-        # import static package.Class.method;
-        import_pattern = re.compile(
-            r'import\s+(?:static\s+)?([\w.]+)(?:\.\*)?\s*;',
-            re.MULTILINE
-        )
-        
+
+        import_pattern = _IMPORT_RE
+
         for line_num, line in enumerate(content.split('\n'), start=1):
             import_match = import_pattern.search(line)
             if import_match:
@@ -91,30 +91,34 @@ class JavaScriptSymbolExtractor(TreeSitterExtractor):
 
 # --- JavaScript Dependency Analyzer ---
 
+# ES6 import statements, compiled once at import time
+# import module from 'path'
+# import { symbol } from 'path'
+# import * as alias from 'path'
+_IMPORT_RE = re.compile(
+    r'import\s+(?:(?:\*\s+as\s+(\w+)|(\{[^}]*\})|(\w+))\s+from\s+)?["\']([^"\']+)["\']',
+    re.MULTILINE
+)
+
+# CommonJS require statements
+# const module = require('path')
+# require('path')
+_REQUIRE_RE = re.compile(
+    r'(?:const|let|var)\s+\w+\s*=\s*require\(["\']([^"\']+)["\']\)|require\(["\']([^"\']+)["\']\)',
+    re.MULTILINE
+)
+
+
 class JavaScriptDependencyAnalyzer(DependencyAnalyzer):
     """Analyzes JavaScript import/require dependencies."""
 
     def analyze_imports(self, file_path: str, content: str) -> List[Dependency]:
         """Analyzes JavaScript import and require statements."""
         dependencies: List[Dependency] = []
-        
-        # ES6 import statements
-        # import module from 'path'
-        # import { symbol } from 'path'
-        # import * as alias from 'path'
-        import_pattern = re.compile(
-            r'import\s+(?:(?:\*\s+as\s+(\w+)|(\{[^}]*\})|(\w+))\s+from\s+)?["\']([^"\']+)["\']',
-            re.MULTILINE
-        )
-        
-        # CommonJS require statements
-        # const module = require('path')
-        # require('path')
-        require_pattern = re.compile(
-            r'(?:const|let|var)\s+\w+\s*=\s*require\(["\']([^"\']+)["\']\)|require\(["\']([^"\']+)["\']\)',
-            re.MULTILINE
-        )
-        
+
+        import_pattern = _IMPORT_RE
+        require_pattern = _REQUIRE_RE
+
         for line_num, line in enumerate(content.split('\n'), start=1):
             # Check for ES6 imports
             import_match = import_pattern.search(line)
@@ -88,19 +88,23 @@ class RustSymbolExtractor(TreeSitterExtractor):
 
 # --- Rust Dependency Analyzer ---
 
+# Match use statements: use crate::module or use std::collections
+_USE_RE = re.compile(r'use\s+([^;]+);')
+
+# Match mod declarations: mod module_name;
+_MOD_RE = re.compile(r'mod\s+(\w+)\s*;')
+
+
 class RustDependencyAnalyzer(DependencyAnalyzer):
     """Analyzes Rust use and mod dependencies."""
 
     def analyze_imports(self, file_path: str, content: str) -> List[Dependency]:
         """Analyzes Rust use and mod statements."""
         dependencies: List[Dependency] = []
-        
-        # Match use statements: use crate::module or use std::collections
-        use_pattern = re.compile(r'use\s+([^;]+);')
-        
-        # Match mod declarations: mod module_name;
-        mod_pattern = re.compile(r'mod\s+(\w+)\s*;')
-        
+
+        use_pattern = _USE_RE
+        mod_pattern = _MOD_RE
+
         for line_num, line in enumerate(content.split('\n'), start=1):
             # Check for use statements
             use_match = use_pattern.search(line)
@@ -107,29 +107,33 @@ class TypeScriptSymbolExtractor(TreeSitterExtractor):
 
 # --- TypeScript Dependency Analyzer ---
 
+# ES6 import statements (same as JavaScript), compiled once at import time
+# import module from 'path'
+# import { symbol } from 'path'
+# import * as alias from 'path'
+# import type { Type } from 'path'
+_IMPORT_RE = re.compile(
+    r'import\s+(?:type\s+)?(?:(?:\*\s+as\s+(\w+)|(\{[^}]*\})|(\w+))\s+from\s+)?["\']([^"\']+)["\']',
+    re.MULTILINE
+)
+
+# CommonJS require statements
+_REQUIRE_RE = re.compile(
+    r'(?:const|let|var)\s+\w+\s*=\s*require\(["\']([^"\']+)["\']\)|require\(["\']([^"\']+)["\']\)',
+    re.MULTILINE
+)
+
+
 class TypeScriptDependencyAnalyzer(DependencyAnalyzer):
     """Analyzes TypeScript import dependencies."""
 
     def analyze_imports(self, file_path: str, content: str) -> List[Dependency]:
         """Analyzes TypeScript import statements."""
         dependencies: List[Dependency] = []
-        
-        # ES6 import statements (same as JavaScript)
-        # import module from 'path'
-        # import { symbol } from 'path'
-        # import * as alias from 'path'
-        # import type { Type } from 'path'
-        import_pattern = re.compile(
-            r'import\s+(?:type\s+)?(?:(?:\*\s+as\s+(\w+)|(\{[^}]*\})|(\w+))\s+from\s+)?["\']([^"\']+)["\']',
-            re.MULTILINE
-        )
-        
-        # CommonJS require statements
-        require_pattern = re.compile(
-            r'(?:const|let|var)\s+\w+\s*=\s*require\(["\']([^"\']+)["\']\)|require\(["\']([^"\']+)["\']\)',
-            re.MULTILINE
-        )
-        
+
+        import_pattern = _IMPORT_RE
+        require_pattern = _REQUIRE_RE
+
         for line_num, line in enumerate(content.split('\n'), start=1):
             # Check for ES6 imports
             import_match = import_pattern.search(line)
@@ -11,6 +11,7 @@ import os
 from typing import Dict, List, Tuple, Optional
 
 import yaml  # type: ignore
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 
 from jarvis.jarvis_utils.config import get_data_dir
 
@@ -125,7 +126,7 @@ def load_lint_tools_config() -> Dict[str, List[str]]:
         return {}
 
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f) or {}
+        config = yaml_safe_load(f) or {}
         return {k.lower(): v for k, v in config.items()}  # 确保key是小写
 
 
@@ -6,7 +6,7 @@ import tempfile
 from typing import Any, Dict, Optional
 
 import typer
-import yaml  # type: ignore
+from jarvis.jarvis_utils.yaml_compat import safe_dump as yaml_safe_dump
 
 from jarvis.jarvis_platform.registry import PlatformRegistry
 from jarvis.jarvis_utils.config import get_git_commit_prompt
@@ -227,7 +227,7 @@ commit信息
 
                 # Create a new platform instance
                 if platform_name:
-                    platform = PlatformRegistry().create_platform(platform_name)
+                    platform = PlatformRegistry.get_global_platform_registry().create_platform(platform_name)
                     if platform and model_name:
                         platform.set_model_name(model_name)
                     if platform and model_group:
@@ -237,7 +237,7 @@ commit信息
                             # 兼容早期实现
                             platform.model_group = model_group  # type: ignore
                 else:
-                    platform = PlatformRegistry().get_normal_platform()
+                    platform = PlatformRegistry.get_global_platform_registry().get_normal_platform()
 
                 # 跳过模型可用性校验：
                 # 为避免某些平台/代理不支持 get_model_list 接口导致的噪音日志（如 404），
@@ -382,12 +382,12 @@ commit信息
 
             PrettyOutput.print(f"提交哈希: {commit_hash}\n提交消息: {commit_message}", OutputType.SUCCESS)
 
+            commit_info = {"commit_hash": commit_hash, "commit_message": commit_message}
             return {
                 "success": True,
-                "stdout": yaml.safe_dump(
-                    {"commit_hash": commit_hash, "commit_message": commit_message},
-                    allow_unicode=True,
-                ),
+                # data为结构化结果，调用方可直接取用，无需再对stdout做yaml解析
+                "data": commit_info,
+                "stdout": yaml_safe_dump(commit_info, allow_unicode=True),
                 "stderr": "",
             }
         except Exception as e:
@@ -14,6 +14,7 @@ import os
 
 import typer
 import yaml  # type: ignore
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 
 from jarvis.jarvis_platform.registry import PlatformRegistry
 from jarvis.jarvis_utils.methodology import (
@@ -106,7 +107,7 @@ def extract_methodology(
             text_content = f.read()
 
         # 获取平台实例
-        platform = PlatformRegistry().get_normal_platform()
+        platform = PlatformRegistry.get_global_platform_registry().get_normal_platform()
 
         # 构建提取提示
         prompt = f"""请从以下文本中提取方法论：
@@ -156,7 +157,7 @@ def extract_methodology(
         yaml_content = response[methodologies_start:methodologies_end].strip()
 
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml_safe_load(yaml_content)
             extracted_methodologies = {
                 item["problem_type"]: item["content"] for item in data
             }
@@ -203,7 +204,7 @@ def extract_methodology_from_url(
     """从URL提取方法论"""
     try:
         # 获取平台实例
-        platform = PlatformRegistry().get_normal_platform()
+        platform = PlatformRegistry.get_global_platform_registry().get_normal_platform()
 
         platform.web = True
 
@@ -254,7 +255,7 @@ def extract_methodology_from_url(
         yaml_content = response[methodologies_start:methodologies_end].strip()
 
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml_safe_load(yaml_content)
             extracted_methodologies = {
                 item["problem_type"]: item["content"] for item in data
             }
@@ -9,6 +9,17 @@ from jarvis.jarvis_agent.output_handler import OutputHandler
 from jarvis.jarvis_tools.registry import ToolRegistry
 from jarvis.jarvis_utils.tag import ct, ot
 
+# SEND_MESSAGE 消息块提取正则：标签为常量，进程内编译一次即可
+_SEND_MSG_BLOCK_RE = re.compile(
+    rf"{re.escape(ot('SEND_MESSAGE'))}[ \t]*\n(.*?)(?:\n)?[ \t]*{re.escape(ct('SEND_MESSAGE'))}",
+    re.DOTALL,
+)
+# 兜底：起止标签与内容之间无显式换行的情况
+_SEND_MSG_INLINE_RE = re.compile(
+    rf"{re.escape(ot('SEND_MESSAGE'))}[ \t]*(.*?)[ \t]*{re.escape(ct('SEND_MESSAGE'))}",
+    re.DOTALL,
+)
+
 
 class MultiAgent(OutputHandler):
     def __init__(self, agents_config: List[Dict], main_agent_name: str, common_system_prompt: str = ""):
@@ -177,18 +188,9 @@ class MultiAgent(OutputHandler):
                 f"{ct_tag}"
             )
         # 尝试提取原始块并指出 JSON 问题
-        import re as _re
-        pattern = _re.compile(
-            rf"{_re.escape(ot_tag)}[ \t]*\n(.*?)(?:\n)?[ \t]*{_re.escape(ct_tag)}",
-            _re.DOTALL,
-        )
-        blocks = pattern.findall(normalized)
+        blocks = _SEND_MSG_BLOCK_RE.findall(normalized)
         if not blocks:
-            alt_pattern = _re.compile(
-                rf"{_re.escape(ot_tag)}[ \t]*(.*?)[ \t]*{_re.escape(ct_tag)}",
-                _re.DOTALL,
-            )
-            blocks = alt_pattern.findall(normalized)
+            blocks = _SEND_MSG_INLINE_RE.findall(normalized)
         if not blocks:
             return (
                 False,
@@ -278,19 +280,11 @@ class MultiAgent(OutputHandler):
         if ot_tag in normalized and ct_tag not in normalized:
             normalized += "\n" + ct_tag
 
-        # Use robust regex with DOTALL; escape tags to avoid regex meta issues
-        pattern = re.compile(
-            rf"{re.escape(ot_tag)}[ \t]*\n(.*?)(?:\n)?[ \t]*{re.escape(ct_tag)}",
-            re.DOTALL,
-        )
-        data = pattern.findall(normalized)
+        # Use robust module-level regex with DOTALL; tags are escaped at compile time
+        data = _SEND_MSG_BLOCK_RE.findall(normalized)
         # Fallback: handle cases without explicit newlines around closing tag
         if not data:
-            alt_pattern = re.compile(
-                rf"{re.escape(ot_tag)}[ \t]*(.*?)[ \t]*{re.escape(ct_tag)}",
-                re.DOTALL,
-            )
-            data = alt_pattern.findall(normalized)
+            data = _SEND_MSG_INLINE_RE.findall(normalized)
 
         ret = []
         for item in data:
@@ -3,6 +3,7 @@ from typing import Optional
 
 import typer
 import yaml  # type: ignore[import-untyped]
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 import os
 
 from jarvis.jarvis_multi_agent import MultiAgent
@@ -52,7 +53,7 @@ def cli(
 
     try:
         with open(config, "r", errors="ignore") as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml_safe_load(f)
 
         # 获取agents配置
         agents_config = config_data.get("agents", [])
@@ -1,12 +1,25 @@
 import os
+import tempfile
+import time
 from typing import Any, Dict, Generator, List, Tuple
 
 from jarvis.jarvis_platform.base import BasePlatform
 import json
 
 from jarvis.jarvis_utils import http
+from jarvis.jarvis_utils.json_compat import loads as json_loads
+from jarvis.jarvis_utils.config import get_data_dir
 from jarvis.jarvis_utils.utils import while_success
 
+# 模型列表的磁盘缓存有效期（秒）：服务端配置变化频率很低，
+# 缓存命中时启动阶段可以完全跳过一次HTTP往返
+_MODELS_CACHE_TTL = 3600
+
+
+def _models_cache_path() -> str:
+    """返回模型列表缓存文件路径（统一放在数据目录下）"""
+    return os.path.join(get_data_dir(), "cache", "ai8_models.json")
+
 
 class AI8Model(BasePlatform):
     """AI8 model implementation"""
@@ -146,7 +159,7 @@ class AI8Model(BasePlatform):
             for line in response_stream:
                 if line and line.startswith("data: "):
                     try:
-                        data = json.loads(line[6:])
+                        data = json_loads(line[6:])
                         if data.get("type") == "string":
                             chunk_data = data.get("data", "")
                             if chunk_data:
@@ -252,6 +265,18 @@ class AI8Model(BasePlatform):
             if self.models:
                 return list(self.models.keys())
 
+            # 优先读磁盘缓存：TTL内直接复用上次拉取并加工好的模型信息
+            cache_path = _models_cache_path()
+            try:
+                if time.time() - os.path.getmtime(cache_path) < _MODELS_CACHE_TTL:
+                    with open(cache_path, "r", encoding="utf-8") as f:
+                        cached = json.load(f)
+                    if isinstance(cached, dict) and cached:
+                        self.models = cached
+                        return list(self.models.keys())
+            except (OSError, ValueError):
+                pass
+
             response = while_success(
                 lambda: http.get(
                     f"{self.BASE_URL}/api/chat/tmpl", headers=self.headers
@@ -267,28 +292,39 @@ class AI8Model(BasePlatform):
             self.models = {model["value"]: model for model in data["data"]["models"]}
 
             for model in self.models.values():
-                # 添加标签
-                model_str = f"{model['label']}"
+                attr = model["attr"]
+                # 用列表收集片段后一次join，避免逐段+=产生中间字符串
+                parts = [f"{model['label']}"]
 
                 # 添加特性标记
                 features = []
-                if model["attr"].get("multimodal"):
+                if attr.get("multimodal"):
                     features.append("Multimodal")
-                if model["attr"].get("plugin"):
+                if attr.get("plugin"):
                     features.append("Plugin support")
-                if model["attr"].get("onlyImg"):
+                if attr.get("onlyImg"):
                     features.append("Image support")
-                if model["attr"].get("tag"):
-                    features.append(model["attr"]["tag"])
-                if model["attr"].get("integral"):
-                    features.append(model["attr"]["integral"])
+                if attr.get("tag"):
+                    features.append(attr["tag"])
+                if attr.get("integral"):
+                    features.append(attr["integral"])
                 # 添加备注
-                if model["attr"].get("note"):
-                    model_str += f" - {model['attr']['note']}"
+                if attr.get("note"):
+                    parts.append(f" - {attr['note']}")
                 if features:
-                    model_str += f" [{'|'.join(features)}]"
-
-                model["desc"] = model_str
+                    parts.append(f" [{'|'.join(features)}]")
+
+                model["desc"] = "".join(parts)
+
+            # 原子刷新磁盘缓存，失败时静默放弃（缓存只是加速手段）
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self.models, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
 
             return list(self.models.keys())
 
@@ -127,6 +127,8 @@ class BasePlatform(ABC):
             )
         else:
             response = ""
+            # 流式分片用列表累积、结束时一次join，避免逐片拼接的重复拷贝
+            response_parts: List[str] = []
 
             if not self.suppress_output:
                 if get_pretty_output():
@@ -189,7 +191,7 @@ class BasePlatform(ABC):
                             live.update(panel)
 
                         # Process first chunk
-                        response += first_chunk
+                        response_parts.append(first_chunk)
                         if first_chunk:
                             _update_panel_content(first_chunk)
 
@@ -211,7 +213,7 @@ class BasePlatform(ABC):
                         for s in chat_iterator:
                             if not s:
                                 continue
-                            response += s  # Accumulate the full response string
+                            response_parts.append(s)  # Accumulate the full response
                             buffer += s  # 累积到缓存
 
                             # 检查是否需要更新：缓存达到阈值或超过时间间隔
@@ -227,11 +229,13 @@ class BasePlatform(ABC):
                             if is_immediate_abort() and get_interrupt():
                                 # 中断时也要刷新剩余缓存
                                 _flush_buffer()
+                                response = "".join(response_parts)
                                 self._append_session_history(message, response)
                                 return response  # Return the partial response immediately
 
                         # 循环结束时，刷新所有剩余缓存内容
                         _flush_buffer()
+                        response = "".join(response_parts)
 
                         # At the end, display the entire response
                         text_content.plain = response
@@ -249,20 +253,24 @@ class BasePlatform(ABC):
                     )
                     for s in self.chat(message):
                         console.print(s, end="")
-                        response += s
+                        response_parts.append(s)
                         if is_immediate_abort() and get_interrupt():
+                            response = "".join(response_parts)
                             self._append_session_history(message, response)
                             return response
+                    response = "".join(response_parts)
                     console.print()
                     end_time = time.time()
                     duration = end_time - start_time
                     console.print(f"✓ 对话完成耗时: {duration:.2f}秒")
             else:
                 for s in self.chat(message):
-                    response += s
+                    response_parts.append(s)
                     if is_immediate_abort() and get_interrupt():
+                        response = "".join(response_parts)
                         self._append_session_history(message, response)
                         return response
+                response = "".join(response_parts)
         # Keep original think tag handling
         response = re.sub(
             ot("think") + r".*?" + ct("think"), "", response, flags=re.DOTALL
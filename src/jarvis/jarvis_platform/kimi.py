@@ -5,12 +5,18 @@ import json
 import mimetypes
 import os
 import time
-from typing import Dict, Generator, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, List, Optional, Tuple
 
 from jarvis.jarvis_platform.base import BasePlatform
 from jarvis.jarvis_utils import http
+from jarvis.jarvis_utils.json_compat import loads as json_loads
 from jarvis.jarvis_utils.utils import while_success
 
+# 常见图片扩展名直查表：批量上传时免去mimetypes的懒加载初始化和
+# 全表查找，未命中的扩展名才回退mimetypes.guess_type
+_IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff"}
+
 
 class KimiModel(BasePlatform):
     """Kimi 大模型平台实现类
@@ -38,6 +44,11 @@ class KimiModel(BasePlatform):
         if not self.api_key:
             print("⚠️ KIMI_API_KEY 未设置")
         self.auth_header = f"Bearer {self.api_key}"  # 认证头信息
+        # 所有JSON请求共用的头部，构造一次后各请求直接复用（不得原地修改）
+        self._json_headers = {
+            "Authorization": self.auth_header,
+            "Content-Type": "application/json",
+        }
         self.uploaded_files = []  # 存储已上传文件的信息
         self.chat_id = ""  # 当前会话ID
         self.first_chat = True  # 标记是否是第一次对话
@@ -58,10 +69,7 @@ class KimiModel(BasePlatform):
         payload = json.dumps(
             {"name": "Unnamed session", "is_example": False, "kimiplus_id": "kimi"}
         )
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
         try:
             response = while_success(
                 lambda: http.post(url, headers=headers, data=payload)
@@ -83,10 +91,7 @@ class KimiModel(BasePlatform):
             {"action": action, "name": os.path.basename(filename)}, ensure_ascii=False
         )
 
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
 
         response = while_success(
             lambda: http.post(url, headers=headers, data=payload)        )
@@ -99,12 +104,14 @@ class KimiModel(BasePlatform):
     def _upload_file(self, file_path: str, presigned_url: str) -> bool:
         """Upload file to presigned URL"""
         try:
-            with open(file_path, "rb") as f:
-                content = f.read()
-                response = while_success(
-                    lambda: http.put(presigned_url, data=content)
-                )
-                return response.status_code == 200
+            # 以文件对象作为请求体，requests按块读取流式发送，
+            # 大文件不再整体读入内存；每次重试重新打开以保证从头发送
+            def _put_once():
+                with open(file_path, "rb") as f:
+                    return http.put(presigned_url, data=f)
+
+            response = while_success(_put_once)
+            return response.status_code == 200
         except Exception as e:
             print(f"❌ 错误：上传文件失败：{e}")
             return False
@@ -123,10 +130,7 @@ class KimiModel(BasePlatform):
             ensure_ascii=False,
         )
 
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
 
         response = while_success(
             lambda: http.post(url, headers=headers, data=payload)        )
@@ -135,10 +139,7 @@ class KimiModel(BasePlatform):
     def _wait_for_parse(self, file_id: str) -> bool:
         """Wait for file parsing to complete"""
         url = "https://kimi.moonshot.cn/api/file/parse_process"
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
 
         max_retries = 30
         retry_count = 0
@@ -157,7 +158,7 @@ class KimiModel(BasePlatform):
                 # SSE格式的行通常以"data: "开头
                 if line.startswith("data: "):
                     try:
-                        data = json.loads(line[6:])
+                        data = json_loads(line[6:])
                         if data.get("event") == "resp":
                             status = data.get("file_info", {}).get("status")
                             if status == "parsed":
@@ -172,6 +173,67 @@ class KimiModel(BasePlatform):
 
         return False
 
+    def _upload_one(self, index: int, total: int, file_path: str) -> Optional[Dict]:
+        """上传单个文件并等待其就绪
+
+        参数:
+            index: 文件在本批次中的序号（从1开始，仅用于日志）
+            total: 本批次文件总数
+            file_path: 要上传的文件路径
+
+        返回:
+            成功时返回文件信息字典，失败时返回None
+        """
+        file_name = os.path.basename(file_path)
+        log_lines: List[str] = [f"处理文件 [{index}/{total}]: {file_name}"]
+        try:
+            ext = os.path.splitext(file_path)[1].lower()
+            if ext in _IMAGE_EXTS:
+                action = "image"
+            else:
+                mime_type, _ = mimetypes.guess_type(file_path)
+                action = (
+                    "image"
+                    if mime_type and mime_type.startswith("image/")
+                    else "file"
+                )
+
+            # 获取预签名URL
+            log_lines.append(f"获取上传URL: {file_name}")
+            presigned_data = self._get_presigned_url(file_path, action)
+
+            # 上传文件
+            log_lines.append(f"上传文件: {file_name}")
+            if self._upload_file(file_path, presigned_data["url"]):
+                # 获取文件信息
+                log_lines.append(f"获取文件信息: {file_name}")
+                file_info = self._get_file_info(presigned_data, file_name, action)
+
+                # 只有文件需要解析
+                if action == "file":
+                    log_lines.append(f"等待文件解析: {file_name}")
+                    if self._wait_for_parse(file_info["id"]):
+                        log_lines.append(f"文件处理完成: {file_name}")
+                    else:
+                        log_lines.append(f"文件解析失败: {file_name}")
+                        print(f"❌ {'\n'.join(log_lines)}")
+                        return None
+                else:
+                    log_lines.append(f"图片处理完成: {file_name}")
+            else:
+                log_lines.append(f"文件上传失败: {file_name}")
+                print(f"❌ {'\n'.join(log_lines)}")
+                return None
+
+            # 成功路径统一输出本文件的处理日志
+            print(f"ℹ️ {'\n'.join(log_lines)}")
+            return file_info
+
+        except Exception as e:
+            log_lines.append(f"处理文件出错 {file_path}: {str(e)}")
+            print(f"❌ {'\n'.join(log_lines)}")
+            return None
+
     def upload_files(self, file_list: List[str]) -> bool:
         """Upload file list and return file information"""
         if not file_list:
@@ -184,54 +246,24 @@ class KimiModel(BasePlatform):
                 return False
             print("✅ 创建聊天会话成功")
 
-        uploaded_files = []
-        for index, file_path in enumerate(file_list, 1):
-            file_name = os.path.basename(file_path)
-            log_lines: List[str] = [f"处理文件 [{index}/{len(file_list)}]: {file_name}"]
-            try:
-                mime_type, _ = mimetypes.guess_type(file_path)
-                action = (
-                    "image" if mime_type and mime_type.startswith("image/") else "file"
+        # 各文件的上传互不依赖且以网络等待为主，用线程池并行处理，
+        # 批量上传耗时从各文件延迟之和降为接近最慢一个文件的延迟；
+        # ex.map保持结果顺序与file_list一致
+        total = len(file_list)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    self._upload_one,
+                    range(1, total + 1),
+                    [total] * total,
+                    file_list,
                 )
+            )
 
-                # 获取预签名URL
-                log_lines.append(f"获取上传URL: {file_name}")
-                presigned_data = self._get_presigned_url(file_path, action)
-
-                # 上传文件
-                log_lines.append(f"上传文件: {file_name}")
-                if self._upload_file(file_path, presigned_data["url"]):
-                    # 获取文件信息
-                    log_lines.append(f"获取文件信息: {file_name}")
-                    file_info = self._get_file_info(presigned_data, file_name, action)
-
-                    # 只有文件需要解析
-                    if action == "file":
-                        log_lines.append(f"等待文件解析: {file_name}")
-                        if self._wait_for_parse(file_info["id"]):
-                            uploaded_files.append(file_info)
-                            log_lines.append(f"文件处理完成: {file_name}")
-                        else:
-                            log_lines.append(f"文件解析失败: {file_name}")
-                            print(f"❌ {'\n'.join(log_lines)}")
-                            return False
-                    else:
-                        uploaded_files.append(file_info)
-                        log_lines.append(f"图片处理完成: {file_name}")
-                else:
-                    log_lines.append(f"文件上传失败: {file_name}")
-                    print(f"❌ {'\n'.join(log_lines)}")
-                    return False
-
-                # 成功路径统一输出本文件的处理日志
-                print(f"ℹ️ {'\n'.join(log_lines)}")
-
-            except Exception as e:
-                log_lines.append(f"处理文件出错 {file_path}: {str(e)}")
-                print(f"❌ {'\n'.join(log_lines)}")
-                return False
+        if any(file_info is None for file_info in results):
+            return False
 
-        self.uploaded_files = uploaded_files
+        self.uploaded_files = results
         return True
 
     def chat(self, message: str) -> Generator[str, None, None]:
@@ -271,10 +303,7 @@ class KimiModel(BasePlatform):
             "model": self.model_name,
         }
 
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
 
         try:
             # 使用新的stream_post接口发送消息请求，获取流式响应
@@ -290,7 +319,7 @@ class KimiModel(BasePlatform):
                 # SSE格式的行通常以"data: "开头
                 if line.startswith("data: "):
                     try:
-                        data = json.loads(line[6:])
+                        data = json_loads(line[6:])
                         event = data.get("event")
 
                         if event == "cmpl":
@@ -312,10 +341,7 @@ class KimiModel(BasePlatform):
             return True  # 如果没有会话ID，视为删除成功
 
         url = f"https://kimi.moonshot.cn/api/chat/{self.chat_id}"
-        headers = {
-            "Authorization": self.auth_header,
-            "Content-Type": "application/json",
-        }
+        headers = self._json_headers
 
         try:
             response = while_success(
@@ -12,6 +12,10 @@ from jarvis.jarvis_utils.config import (
     get_normal_platform_name,
 )
 
+# 平台目录扫描缓存：同一进程内创建多个Registry实例（如子Agent）时，
+# 共享已完成的目录扫描与模块导入结果
+_platform_dir_cache: Dict[str, Dict[str, Type[BasePlatform]]] = {}
+
 REQUIRED_METHODS = [
     ("chat", ["message"]),  # 方法名和参数列表
     ("name", []),
@@ -67,12 +71,18 @@ class PlatformRegistry:
                 missing_methods.append(method_name)
                 continue
 
-            # 检查方法参数
-            import inspect
-
-            sig = inspect.signature(method)
-            method_params = [p for p in sig.parameters if p != "self"]
-            if len(method_params) != len(params):
+            # 检查方法参数：优先走__code__的参数计数，比构建完整的
+            # inspect.signature快一个数量级；带*args/**kwargs或无__code__
+            # （C实现、装饰器包裹）的方法才回退到signature
+            code = getattr(method, "__code__", None)
+            if code is None or code.co_flags & (
+                inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+            ):
+                sig = inspect.signature(method)
+                param_count = len([p for p in sig.parameters if p != "self"])
+            else:
+                param_count = code.co_argcount + code.co_kwonlyargcount - 1  # 去掉self
+            if param_count != len(params):
                 missing_methods.append(f"{method_name}(parameter mismatch)")
 
         if missing_methods:
@@ -108,8 +118,11 @@ class PlatformRegistry:
             sys.path.append(directory)
 
         error_lines = []
-        # 遍历目录下的所有.py文件
-        for filename in os.listdir(directory):
+        # 遍历目录下的所有.py文件（scandir一次系统调用拿到目录项，
+        # 用户目录为空时直接走完循环，不产生额外开销）
+        with os.scandir(directory) as entries:
+            filenames = [e.name for e in entries]
+        for filename in filenames:
             if filename.endswith(".py") and not filename.startswith("__"):
                 module_name = filename[:-3]  # 移除.py后缀
                 try:
@@ -155,6 +168,15 @@ class PlatformRegistry:
             PlatformRegistry.global_platform_registry = PlatformRegistry()
         return PlatformRegistry.global_platform_registry
 
+    @staticmethod
+    def _load_platform_dir_cached(directory: str) -> Dict[str, Type[BasePlatform]]:
+        """带进程级缓存的目录扫描，避免每个Registry实例重复导入平台模块"""
+        cached = _platform_dir_cache.get(directory)
+        if cached is None:
+            cached = PlatformRegistry.load_platform_from_dir(directory)
+            _platform_dir_cache[directory] = cached
+        return cached
+
     def __init__(self) -> None:
         """Initialize platform registry"""
         self.platforms: Dict[str, Type[BasePlatform]] = {}
@@ -164,14 +186,14 @@ class PlatformRegistry:
             for (
                 platform_name,
                 platform_class,
-            ) in PlatformRegistry.load_platform_from_dir(platform_dir).items():
+            ) in PlatformRegistry._load_platform_dir_cached(platform_dir).items():
                 self.register_platform(platform_name, platform_class)
         platform_dir = os.path.dirname(__file__)
         if platform_dir and os.path.exists(platform_dir):
             for (
                 platform_name,
                 platform_class,
-            ) in PlatformRegistry.load_platform_from_dir(platform_dir).items():
+            ) in PlatformRegistry._load_platform_dir_cached(platform_dir).items():
                 self.register_platform(platform_name, platform_class)
 
     def get_normal_platform(self) -> BasePlatform:
@@ -7,6 +7,7 @@ from typing import Any, Dict, Generator, List, Tuple
 
 from jarvis.jarvis_platform.base import BasePlatform
 from jarvis.jarvis_utils import http
+from jarvis.jarvis_utils.json_compat import loads as json_loads
 from jarvis.jarvis_utils.tag import ot, ct
 from jarvis.jarvis_utils.utils import while_success
 
@@ -28,8 +29,11 @@ class TongyiPlatform(BasePlatform):
         self.uploaded_file_info = []
         self.system_message = ""  # System message for initialization
         self.first_chat = True  # Flag for first chat
+        # 基础请求头在整个会话期间不变，构造一次后各请求直接复用
+        self._base_headers = self._build_base_headers()
 
-    def _get_base_headers(self):
+    def _build_base_headers(self):
+        """构造API请求的基础头部信息（仅在初始化时调用一次）"""
         return {
             "Host": "api.tongyi.com",
             "Connection": "keep-alive",
@@ -51,6 +55,10 @@ class TongyiPlatform(BasePlatform):
             "Cookie": self.cookies,
         }
 
+    def _get_base_headers(self):
+        """获取API请求的基础头部信息（共享字典，调用方不得原地修改）"""
+        return self._base_headers
+
     def set_model_name(self, model_name: str):
         """Set model name
 
@@ -70,9 +78,8 @@ class TongyiPlatform(BasePlatform):
         if not self.request_id:
             self._generate_request_id()
         url = "https://api.tongyi.com/dialog/conversation"
-        headers = self._get_base_headers()
-
-        headers["accept"] = "text/event-stream"
+        # 基础头部是共享字典，流式请求需要改accept时使用副本
+        headers = {**self._get_base_headers(), "accept": "text/event-stream"}
 
         # Prepare contents array with message
         contents = [
@@ -176,7 +183,7 @@ class TongyiPlatform(BasePlatform):
                 # SSE格式的行通常以"data: "开头
                 if line.startswith("data: "):
                     try:
-                        data = json.loads(line[6:])
+                        data = json_loads(line[6:])
                         # 记录消息ID和会话ID
                         if "msgId" in data:
                             msg_id = data["msgId"]
@@ -190,13 +197,13 @@ class TongyiPlatform(BasePlatform):
                                         yield f"{ot('think')}\n\n"
                                         in_thinking = True
                                     if content.get("incremental"):
-                                        tmp_content = json.loads(
+                                        tmp_content = json_loads(
                                             content.get("content")
                                         )["content"]
                                         thinking_content += tmp_content
                                         yield tmp_content
                                     else:
-                                        tmp_content = json.loads(
+                                        tmp_content = json_loads(
                                             content.get("content")
                                         )["content"]
                                         if len(thinking_content) < len(tmp_content):
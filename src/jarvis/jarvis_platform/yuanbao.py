@@ -5,12 +5,13 @@ import json
 import os
 import time
 import urllib.parse
-from typing import Dict, Generator, List, Tuple
+from typing import Dict, Generator, List, Optional, Tuple
 
 from PIL import Image  # type: ignore
 
 from jarvis.jarvis_platform.base import BasePlatform
 from jarvis.jarvis_utils import http
+from jarvis.jarvis_utils.json_compat import loads as json_loads
 from jarvis.jarvis_utils.tag import ot, ct
 from jarvis.jarvis_utils.utils import while_success
 
@@ -18,6 +19,9 @@ from jarvis.jarvis_utils.utils import while_success
 class YuanbaoPlatform(BasePlatform):
     """Hunyuan模型实现"""
 
+    # 支持的模型ID集合，首次校验时从get_model_list构建并缓存
+    _model_id_set: Optional[frozenset] = None
+
     def get_model_list(self) -> List[Tuple[str, str]]:
         """获取支持的模型列表"""
         return [
@@ -46,22 +50,26 @@ class YuanbaoPlatform(BasePlatform):
         self.first_chat = True  # 标识是否为第一次对话
         self.model_name = "deep_seek_v3"  # 默认模型名称，使用下划线保持一致
         self.multimedia = []
+        # 基础请求头在整个会话期间不变，构造一次后各请求直接复用
+        self._base_headers = self._build_base_headers()
 
     def set_system_prompt(self, message: str):
         """设置系统消息"""
         self.system_message = message
 
     def set_model_name(self, model_name: str):
-        # 模型映射表，可以根据需要扩展
-        model_mapping = [m[0] for m in self.get_model_list()]
+        # 模型映射表缓存在类属性上，O(1)查找且不必每次调用都重建列表
+        cls = type(self)
+        if cls._model_id_set is None:
+            cls._model_id_set = frozenset(m[0] for m in self.get_model_list())
 
-        if model_name in model_mapping:
+        if model_name in cls._model_id_set:
             self.model_name = model_name
         else:
             print(f"❌ 错误：不支持的模型: {model_name}")
 
-    def _get_base_headers(self):
-        """获取API请求的基础头部信息"""
+    def _build_base_headers(self):
+        """构造API请求的基础头部信息（仅在初始化时调用一次）"""
         return {
             "Host": "yuanbao.tencent.com",
             "X-Language": "zh-CN",
@@ -84,6 +92,10 @@ class YuanbaoPlatform(BasePlatform):
             "Cookie": self.cookies,
         }
 
+    def _get_base_headers(self):
+        """获取API请求的基础头部信息（共享字典，调用方不得原地修改）"""
+        return self._base_headers
+
     def _create_conversation(self) -> bool:
         """创建一个新的对话会话"""
         url = "https://yuanbao.tencent.com/api/user/agent/conversation/create"
@@ -294,17 +306,17 @@ class YuanbaoPlatform(BasePlatform):
             expired_time = upload_info.get("expiredTime", start_time + 600)
             key_time = f"{start_time};{expired_time}"
 
-            # Read file content
-            with open(file_path, "rb") as file:
-                file_content = file.read()
+            # 签名只依赖Content-Length，用stat拿大小即可，
+            # 文件内容随请求流式发送而不整体读入内存
+            file_size = os.path.getsize(file_path)
 
-            print(f"ℹ️ 上传文件大小: {len(file_content)}")
+            print(f"ℹ️ 上传文件大小: {file_size}")
 
             # Prepare headers for PUT request
             host = f"{upload_info['bucketName']}.{upload_info.get('accelerateDomain', 'cos.accelerate.myqcloud.com')}"
             headers = {
                 "Host": host,
-                "Content-Length": str(len(file_content)),
+                "Content-Length": str(file_size),
                 "Content-Type": "application/octet-stream",
                 "x-cos-security-token": token,
             }
@@ -327,7 +339,8 @@ class YuanbaoPlatform(BasePlatform):
             )
 
             # Upload the file
-            response = http.put(url, headers=headers, data=file_content)
+            with open(file_path, "rb") as file:
+                response = http.put(url, headers=headers, data=file)
 
             if response.status_code not in [200, 204]:
                 print(f"❌ 文件上传到COS失败，状态码: {response.status_code}")
@@ -483,7 +496,7 @@ class YuanbaoPlatform(BasePlatform):
                             self.first_chat = False
                             return
 
-                        data = json.loads(data_str)
+                        data = json_loads(data_str)
 
                         # 处理文本类型的消息
                         if data.get("type") == "text":
@@ -507,7 +520,7 @@ class YuanbaoPlatform(BasePlatform):
                         pass
                 else:
                     try:
-                        data = json.loads(line)
+                        data = json_loads(line)
                         if "msg" in data:
                             yield data["msg"]
                     except Exception:
@@ -527,11 +540,11 @@ class YuanbaoPlatform(BasePlatform):
         # Hunyuan使用专门的clear API来清除会话
         url = "https://yuanbao.tencent.com/api/user/agent/conversation/v1/clear"
 
-        # 为这个请求获取基础头部
-        headers = self._get_base_headers()
-
-        # 更新X-AgentID头部，需要包含会话ID
-        headers.update({"X-AgentID": f"{self.agent_id}/{self.conversation_id}"})
+        # 基础头部是共享字典，需要追加X-AgentID时使用副本
+        headers = {
+            **self._get_base_headers(),
+            "X-AgentID": f"{self.agent_id}/{self.conversation_id}",
+        }
 
         # 创建请求体，包含要删除的会话ID
         payload = {"conversationIds": [self.conversation_id]}
@@ -18,6 +18,7 @@ from jarvis.jarvis_utils.input import get_multiline_input, get_single_line_input
 from jarvis.jarvis_utils.utils import init_env
 from jarvis.jarvis_platform_manager.service import start_service
 from jarvis.jarvis_utils.fzf import fzf_select
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 
 app = typer.Typer(help="Jarvis AI 平台")
 
@@ -47,14 +48,14 @@ def list_platforms(
             # Print platform name
             print(f"✅ {platform_name}")
 
-            output = ""
             # Print model list
             if models:
-                for model_name, description in models:
-                    if description:
-                        output += f"  • {model_name} - {description}\n"
-                    else:
-                        output += f"  • {model_name}\n"
+                output = "".join(
+                    f"  • {model_name} - {description}\n"
+                    if description
+                    else f"  • {model_name}\n"
+                    for model_name, description in models
+                )
                 print(f"✅ {output}")
             else:
                 print("⚠️   • 没有可用的模型信息")
@@ -398,7 +399,7 @@ def load_role_config(config_path: str) -> Dict[str, Any]:
 
     with open(config_path, "r", encoding="utf-8", errors="ignore") as file_obj:
         try:
-            config = yaml.safe_load(file_obj)
+            config = yaml_safe_load(file_obj)
             return config if config else {}
         except yaml.YAMLError as exc:
             print(f"❌ 角色配置文件解析失败: {str(exc)}")
@@ -63,7 +63,11 @@ class EmbeddingCache:
         返回:
             一个列表，其中包含缓存的嵌入，对于缓存未命中的情况则为None。
         """
-        return [self.get(text) for text in texts]
+        if not texts:
+            return []
+        # 在单个事务中批量读取，避免每个文本一次独立的磁盘往返
+        with self.cache.transact():
+            return [self.get(text) for text in texts]
 
     def set_batch(self, texts: List[str], embeddings: List[Any]) -> None:
         """
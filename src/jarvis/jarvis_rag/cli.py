@@ -130,6 +130,31 @@ def _load_ragignore_spec() -> Tuple[Optional[pathspec.PathSpec], Optional[Path]]
     return None, None
 
 
+def _iter_files_pruned(root: Path):
+    """深度优先遍历目录，原地剪枝'.'开头的隐藏目录（如.git、.venv）
+
+    相比Path.rglob("*")，被剪枝的目录完全不会被下探，
+    且复用scandir自带的类型信息，省去逐项stat。
+    """
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
 @app.command(
     "add",
     help="从文件、目录或glob模式（例如 'src/**/*.py'）添加文档。",
@@ -177,8 +202,8 @@ def add_documents(
 
             if path.is_dir():
                 print(f"ℹ️ 正在扫描目录: {path}")
-                for item in path.rglob("*"):
-                    if item.is_file() and is_likely_text_file(item):
+                for item in _iter_files_pruned(path):
+                    if is_likely_text_file(item):
                         files_to_process.add(item)
             elif path.is_file():
                 if is_likely_text_file(path):
@@ -1,12 +1,17 @@
 import torch
 import os
-from typing import List, cast
+from collections import OrderedDict
+from typing import Dict, List, cast
 from langchain_huggingface import HuggingFaceEmbeddings
 from huggingface_hub import snapshot_download
 
 
 from .cache import EmbeddingCache
 
+# 进程级模型缓存：按模型名共享已加载的权重，
+# 避免同一进程内多个管道/子代理重复加载模型
+_EMBED_MODEL_CACHE: Dict[str, HuggingFaceEmbeddings] = {}
+
 
 class EmbeddingManager:
     """
@@ -32,7 +37,22 @@ class EmbeddingManager:
 
         # 缓存的salt是模型名称，以防止冲突
         self.cache = EmbeddingCache(cache_dir=cache_dir, salt=self.model_name)
-        self.model = self._load_model()
+        # 查询嵌入的小型LRU缓存：重复/重试的查询无需再次前向计算
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_cache_size = 32
+        # 模型惰性加载：仅在首次实际计算嵌入时才加载权重
+        self._model: "HuggingFaceEmbeddings | None" = None
+
+    @property
+    def model(self) -> HuggingFaceEmbeddings:
+        """惰性加载的嵌入模型，进程内按模型名共享。"""
+        if self._model is None:
+            cached_model = _EMBED_MODEL_CACHE.get(self.model_name)
+            if cached_model is None:
+                cached_model = self._load_model()
+                _EMBED_MODEL_CACHE[self.model_name] = cached_model
+            self._model = cached_model
+        return self._model
 
     def _load_model(self) -> HuggingFaceEmbeddings:
         """根据配置加载Hugging Face嵌入模型。"""
@@ -228,6 +248,15 @@ class EmbeddingManager:
     def embed_query(self, text: str) -> List[float]:
         """
         为单个查询计算嵌入。
-        查询通常不被缓存，但如果需要可以添加。
+        使用小型LRU缓存，相同或近期重复的查询直接复用已计算的向量。
         """
-        return self.model.embed_query(text)
+        cached = self._query_cache.get(text)
+        if cached is not None:
+            self._query_cache.move_to_end(text)
+            return cached
+
+        embedding = self.model.embed_query(text)
+        self._query_cache[text] = embedding
+        if len(self._query_cache) > self._query_cache_size:
+            self._query_cache.popitem(last=False)
+        return embedding
@@ -48,6 +48,9 @@ class ChromaRetriever:
         # BM25索引设置
         self.bm25_index_path = os.path.join(self.db_path, f"{collection_name}_bm25.pkl")
         self._load_or_initialize_bm25()
+        # 集合全量快照缓存：BM25打分需要全部文档，避免每次查询都拉取整个集合
+        self._collection_snapshot: Optional[Any] = None
+        self._collection_snapshot_count = -1
         # 清单文件用于检测源文件的变更/删除
         self.manifest_path = os.path.join(
             self.db_path, f"{collection_name}_manifest.json"
@@ -60,7 +63,10 @@ class ChromaRetriever:
             with open(self.bm25_index_path, "rb") as f:
                 data = pickle.load(f)
                 self.bm25_corpus = data["corpus"]
-                self.bm25_index = BM25Okapi(self.bm25_corpus)
+                # 优先复用已序列化的索引，避免每次启动都从语料重建
+                self.bm25_index = data.get("index") or (
+                    BM25Okapi(self.bm25_corpus) if self.bm25_corpus else None
+                )
             print("✅ BM25 索引加载成功。")
         else:
             print(
@@ -69,6 +75,23 @@ class ChromaRetriever:
             self.bm25_corpus = []
             self.bm25_index = None
 
+    def _get_collection_snapshot(self) -> Any:
+        """获取集合的全量文档快照（带缓存）。
+
+        BM25打分需要与集合中全部文档对齐；缓存结果并在文档数量变化或
+        索引被修改时失效，避免每次查询都从ChromaDB拉取整个集合。
+        """
+        count = self.collection.count()
+        if self._collection_snapshot is None or count != self._collection_snapshot_count:
+            self._collection_snapshot = self.collection.get()
+            self._collection_snapshot_count = count
+        return self._collection_snapshot
+
+    def _invalidate_collection_snapshot(self) -> None:
+        """在集合发生写操作后使快照缓存失效。"""
+        self._collection_snapshot = None
+        self._collection_snapshot_count = -1
+
     def _save_bm25_index(self):
         """将BM25索引保存到磁盘。"""
         if self.bm25_index:
@@ -283,6 +306,7 @@ class ChromaRetriever:
                 print(f"❌ 添加变更文档到索引时出错: {e}")
 
         # 重建BM25索引，确保删除后的语料被清理
+        self._invalidate_collection_snapshot()
         try:
             all_docs_in_collection = self.collection.get()
             all_documents = all_docs_in_collection.get("documents") or []
@@ -340,6 +364,7 @@ class ChromaRetriever:
         print(
             f"✅ 成功将 {len(chunks)} 个块添加到 ChromaDB 集合中。"
         )
+        self._invalidate_collection_snapshot()
 
         # 更新并保存BM25索引
         tokenized_chunks = [doc.split() for doc in chunk_texts]
@@ -376,8 +401,8 @@ class ChromaRetriever:
             tokenized_query = query.split()
             doc_scores = self.bm25_index.get_scores(tokenized_query)
 
-            # 从Chroma获取所有文档以匹配BM25分数
-            all_docs_in_collection = self.collection.get()
+            # 从Chroma获取所有文档以匹配BM25分数（使用快照缓存）
+            all_docs_in_collection = self._get_collection_snapshot()
             all_documents = all_docs_in_collection.get("documents")
             all_metadatas = all_docs_in_collection.get("metadatas")
 
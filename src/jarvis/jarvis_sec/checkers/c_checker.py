@@ -63,6 +63,18 @@ RE_OPEN_PERMISSIVE = re.compile(r"\bopen\s*\(\s*[^,]+,\s*[^,]*O_CREAT[^,]*,\s*(0
 RE_FOPEN_MODE = re.compile(r'\bfopen\s*\(\s*[^,]+,\s*"([^"]+)"\s*\)', re.IGNORECASE)
 RE_GENERIC_ASSIGN = re.compile(r"\b([A-Za-z_]\w*)\s*=\s*")
 RE_FREE_CALL_ANY = re.compile(r"\bfree\s*\(\s*([^)]+?)\s*\)", re.IGNORECASE)
+# 逐行扫描的高频模式：预编译省去每行一次re模块缓存查找
+RE_PP_IF0 = re.compile(r"^\s*#\s*if\s+0\b")
+RE_PP_IF = re.compile(r"^\s*#\s*if\b")
+RE_PP_ELSE = re.compile(r"^\s*#\s*else\b")
+RE_PP_ENDIF = re.compile(r"^\s*#\s*endif\b")
+RE_TYPEDEF_EXTERN = re.compile(r"\b(typedef|extern)\b")
+RE_FREE_STMT = re.compile(r"free\s*\(\s*([A-Za-z_]\w*)\s*\)\s*;")
+RE_COND_KEYWORD = re.compile(r"\b(if|while|for)\s*\(")
+RE_COMPARISON = re.compile(r"(>=|<=|==|!=|<|>)")
+RE_WHILE_PAREN = re.compile(r"\bwhile\s*\(")
+RE_MALLOC_CALL = re.compile(r"\bmalloc\s*\(", re.IGNORECASE)
+RE_DEREF_VAR = re.compile(r"\*\s*([A-Za-z_]\w*)\b")
 # 扩展：更多危险用法相关
 RE_ALLOCA = re.compile(r"\balloca\s*\(\s*([^)]+)\s*\)", re.IGNORECASE)
 RE_VLA_DECL = re.compile(
@@ -343,17 +355,17 @@ def _strip_if0_blocks(text: str) -> str:
         return any(frame.get("skipping", False) for frame in stack)
 
     for line in lines:
-        if re.match(r"^\s*#\s*if\s+0\b", line):
+        if RE_PP_IF0.match(line):
             # 进入 #if 0：主体跳过
             stack.append({"kind": "if0", "skipping": True, "in_else": False})
             out.append("\n" if line.endswith("\n") else "")
             continue
-        if re.match(r"^\s*#\s*if\b", line):
+        if RE_PP_IF.match(line):
             # 其他 #if：不求值，仅记录，继承外层 skipping
             stack.append({"kind": "if", "skipping": any_skipping(), "in_else": False})
             out.append(line if not any_skipping() else ("\n" if line.endswith("\n") else ""))
             continue
-        if re.match(r"^\s*#\s*else\b", line):
+        if RE_PP_ELSE.match(line):
             if stack:
                 top = stack[-1]
                 if top["kind"] == "if0":
@@ -362,7 +374,7 @@ def _strip_if0_blocks(text: str) -> str:
                     top["in_else"] = True
             out.append(line if not any_skipping() else ("\n" if line.endswith("\n") else ""))
             continue
-        if re.match(r"^\s*#\s*endif\b", line):
+        if RE_PP_ENDIF.match(line):
             if stack:
                 stack.pop()
             out.append(line if not any_skipping() else ("\n" if line.endswith("\n") else ""))
@@ -430,7 +442,7 @@ def _rule_unsafe_api(lines: Sequence[str], relpath: str) -> List[Issue]:
     for idx, s in enumerate(lines, start=1):
         # 跳过预处理行与声明行，减少原型/宏中的误报
         t = s.lstrip()
-        if t.startswith("#") or re.search(r"\b(typedef|extern)\b", s):
+        if t.startswith("#") or RE_TYPEDEF_EXTERN.search(s):
             continue
         m = RE_UNSAFE_API.search(s)
         if not m:
@@ -467,7 +479,7 @@ def _rule_boundary_funcs(lines: Sequence[str], relpath: str) -> List[Issue]:
     for idx, s in enumerate(lines, start=1):
         # 跳过预处理行与声明行，避免在 typedef/extern 原型中误报
         t = s.lstrip()
-        if t.startswith("#") or re.search(r"\b(typedef|extern)\b", s):
+        if t.startswith("#") or RE_TYPEDEF_EXTERN.search(s):
             continue
         m = RE_BOUNDARY_FUNCS.search(s)
         if not m:
@@ -596,7 +608,7 @@ def _rule_uaf_suspect(lines: Sequence[str], relpath: str) -> List[Issue]:
     # 收集所有 free(var) 位置
     free_calls: List[Tuple[str, int]] = []
     for idx, s in enumerate(lines, start=1):
-        for m in re.finditer(r"free\s*\(\s*([A-Za-z_]\w*)\s*\)\s*;", s):
+        for m in RE_FREE_STMT.finditer(s):
             free_calls.append((m.group(1), idx))
 
     # 针对每个 free(var)，在后续窗口中寻找“危险使用”
@@ -659,7 +671,7 @@ def _rule_unchecked_io(lines: Sequence[str], relpath: str) -> List[Issue]:
     for idx, s in enumerate(lines, start=1):
         # 排除预处理与声明
         t = s.lstrip()
-        if t.startswith("#") or re.search(r"\b(typedef|extern)\b", s):
+        if t.startswith("#") or RE_TYPEDEF_EXTERN.search(s):
             continue
         m = RE_IO_API.search(s)
         if not m:
@@ -667,7 +679,7 @@ def _rule_unchecked_io(lines: Sequence[str], relpath: str) -> List[Issue]:
 
         # 若本行/紧随其后 2 行出现条件判断，认为已检查（直接跳过）
         nearby = " ".join(_safe_line(lines, i) for i in range(idx, min(idx + 2, len(lines)) + 1))
-        if re.search(r"\b(if|while|for)\s*\(", nearby) or re.search(r"(>=|<=|==|!=|<|>)", nearby):
+        if RE_COND_KEYWORD.search(nearby) or RE_COMPARISON.search(nearby):
             continue
 
         # 若赋值给变量，则在后续窗口内寻找对该变量的检查
@@ -1099,7 +1111,7 @@ def _rule_alloc_size_overflow(lines: Sequence[str], relpath: str) -> List[Issue]
     """
     issues: List[Issue] = []
     for idx, s in enumerate(lines, start=1):
-        m = re.search(r"\bmalloc\s*\(", s, re.IGNORECASE)
+        m = RE_MALLOC_CALL.search(s)
         if not m:
             continue
         try:
@@ -1206,7 +1218,7 @@ def _rule_uninitialized_ptr_use(lines: Sequence[str], relpath: str) -> List[Issu
         if not type_prefix.search(s):
             continue
         # 提取形如 *p, *q
-        for m in re.finditer(r"\*\s*([A-Za-z_]\w*)\b", s):
+        for m in RE_DEREF_VAR.finditer(s):
             v = m.group(1)
             candidates.append((v, idx))
 
@@ -1668,10 +1680,10 @@ def _rule_cond_wait_no_loop(lines: Sequence[str], relpath: str) -> List[Issue]:
             continue
         # 回看 2 行内是否有 while( ... )
         prev_text = " ".join(_safe_line(lines, j) for j in range(max(1, idx - 2), idx))
-        has_prev_while = re.search(r"\bwhile\s*\(", prev_text) is not None
+        has_prev_while = RE_WHILE_PAREN.search(prev_text) is not None
         # 同一行（调用前半部分）若包含 while(...)，也视为正确用法
         same_line_before = s[: m.start()]
-        has_same_line_while = re.search(r"\bwhile\s*\(", same_line_before) is not None
+        has_same_line_while = RE_WHILE_PAREN.search(same_line_before) is not None
 
         if has_prev_while or has_same_line_while:
             continue
@@ -5,6 +5,16 @@ import time
 from typing import Any, Dict, List, Optional, Tuple
 
 
+def _ensure_parent_dir(abs_path: str) -> None:
+    """确保父目录存在
+
+    父目录已存在时只做一次stat即返回，避免makedirs逐级检查祖先目录；
+    路径位于当前目录时dirname为空，直接跳过。
+    """
+    parent = os.path.dirname(abs_path)
+    if parent and not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
+
 
 class EditFileTool:
     """文件编辑工具，用于对文件进行结构化编辑"""
@@ -387,7 +397,7 @@ class EditFileTool:
             (文件内容, 备份文件路径或None)
         """
         abs_path = os.path.abspath(file_path)
-        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+        _ensure_parent_dir(abs_path)
         
         file_content = ""
         backup_path = None
@@ -540,11 +550,16 @@ class EditFileTool:
                 return (False, "edit操作需要提供replace参数")
             
             current_content = block.get('content', '')
-            if search not in current_content:
+            # 用find的结果直接切片替换，存在性检查与替换共用同一次扫描，
+            # 避免"in + replace"对大块内容扫描两遍
+            idx = current_content.find(search)
+            if idx < 0:
                 return (False, f"在块 {block_id} 中未找到要搜索的文本: {search[:100]}...")
-            
+
             # 在块内进行替换（只替换第一次出现）
-            block['content'] = current_content.replace(search, replace, 1)
+            block['content'] = (
+                current_content[:idx] + replace + current_content[idx + len(search):]
+            )
             return (True, None)
         
         else:
@@ -622,15 +637,15 @@ class EditFileTool:
     def _write_file_with_rollback(
         abs_path: str,
         content: str,
-        backup_path: Optional[str]
+        original_content: Optional[str]
     ) -> Tuple[bool, Optional[str]]:
         """写入文件，失败时回滚
-        
+
         Args:
             abs_path: 文件绝对路径
             content: 要写入的内容
-            backup_path: 备份文件路径或None
-            
+            original_content: 回滚用的原始内容，None表示无需回滚
+
         Returns:
             (是否成功, 错误信息或None)
         """
@@ -640,10 +655,10 @@ class EditFileTool:
             return (True, None)
         except Exception as write_error:
             # 写入失败，尝试回滚
-            if backup_path and os.path.exists(backup_path):
+            if original_content is not None:
                 try:
-                    shutil.copy2(backup_path, abs_path)
-                    os.remove(backup_path)
+                    with open(abs_path, "w", encoding="utf-8") as f:
+                        f.write(original_content)
                 except Exception:
                     pass
             error_msg = f"文件写入失败: {str(write_error)}"
@@ -671,8 +686,8 @@ class EditFileTool:
                 第二个元素为结果信息，全部成功时为修改后的文件内容，部分或全部失败时为错误信息
         """
         abs_path = os.path.abspath(file_path)
-        backup_path = None
-        
+        rollback_content: Optional[str] = None
+
         try:
             # 检查缓存有效性
             cache_info = EditFileTool._get_file_cache(agent, abs_path)
@@ -694,14 +709,11 @@ class EditFileTool:
                 "file_ends_with_newline": cache_info.get("file_ends_with_newline", False),
             }
             
-            # 创建备份
+            # 回滚内容直接从未修改的缓存恢复，避免把整个文件复制到磁盘
+            # 再删除的.bak备份往返（每次编辑节省一读一写一删）
             if os.path.exists(abs_path):
-                backup_path = abs_path + ".bak"
-                try:
-                    shutil.copy2(abs_path, backup_path)
-                except Exception:
-                    backup_path = None
-            
+                rollback_content = EditFileTool._restore_file_from_cache(cache_info)
+
             # 对补丁进行排序
             ordered_patches = EditFileTool._order_patches_by_range(patches)
             patch_count = len(ordered_patches)
@@ -738,11 +750,6 @@ class EditFileTool:
             
             # 如果有失败的补丁，且没有成功的补丁，则不写入文件
             if failed_patches and successful_patches == 0:
-                if backup_path and os.path.exists(backup_path):
-                    try:
-                        os.remove(backup_path)
-                    except Exception:
-                        pass
                 summary = EditFileTool._generate_error_summary(
                     abs_path, failed_patches, patch_count, successful_patches
                 )
@@ -753,15 +760,10 @@ class EditFileTool:
             modified_content = EditFileTool._restore_file_from_cache(cache_copy)
             if not modified_content:
                 error_msg = "从缓存恢复文件内容失败"
-                if backup_path and os.path.exists(backup_path):
-                    try:
-                        os.remove(backup_path)
-                    except Exception:
-                        pass
                 return False, error_msg
-            
+
             # 写入文件
-            success, error_msg = EditFileTool._write_file_with_rollback(abs_path, modified_content, backup_path)
+            success, error_msg = EditFileTool._write_file_with_rollback(abs_path, modified_content, rollback_content)
             if not success:
                 return False, error_msg
             
@@ -775,13 +777,6 @@ class EditFileTool:
                     EditFileTool._update_cache_timestamp(agent, abs_path)
                     agent.set_user_data("read_code_cache", cache)
             
-            # 写入成功，删除备份文件
-            if backup_path and os.path.exists(backup_path):
-                try:
-                    os.remove(backup_path)
-                except Exception:
-                    pass
-            
             # 如果有失败的补丁，返回部分成功信息
             if failed_patches:
                 summary = EditFileTool._generate_error_summary(
@@ -794,10 +789,10 @@ class EditFileTool:
             
         except Exception as e:
             # 发生异常时，尝试回滚
-            if backup_path and os.path.exists(backup_path):
+            if rollback_content is not None:
                 try:
-                    shutil.copy2(backup_path, abs_path)
-                    os.remove(backup_path)
+                    with open(abs_path, "w", encoding="utf-8") as f:
+                        f.write(rollback_content)
                 except Exception:
                     pass
             error_msg = f"文件修改失败: {str(e)}"
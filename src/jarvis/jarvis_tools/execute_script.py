@@ -76,6 +76,52 @@ class ScriptTool:
                 cleaned.append(stripped)
         return "\n".join(cleaned[1:-1])
 
+    def _execute_via_stdin(
+        self, interpreter: str, script_content: str
+    ) -> Dict[str, Any]:
+        """通过stdin直接喂给解释器执行，不落盘
+
+        跳过临时脚本文件、script命令包装和pyte终端渲染，
+        适用于非交互模式下支持从stdin读脚本的解释器（bash/sh）。
+
+        Args:
+            interpreter: 解释器命令
+            script_content: 脚本内容
+
+        Returns:
+            Dictionary with execution results
+        """
+        import subprocess
+
+        from jarvis.jarvis_utils.config import get_script_execution_timeout
+
+        try:
+            proc = subprocess.run(
+                [interpreter, "-s"],
+                input=script_content,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,  # 与script命令行为一致：合并输出流
+                text=True,
+                timeout=get_script_execution_timeout(),
+            )
+            return {
+                "success": True,
+                "stdout": proc.stdout or "",
+                "stderr": "",
+            }
+        except subprocess.TimeoutExpired as e:
+            partial = e.output or ""
+            if isinstance(partial, bytes):
+                partial = partial.decode("utf-8", errors="replace")
+            return {
+                "success": False,
+                "stdout": partial,
+                "stderr": f"执行超时（超过{get_script_execution_timeout()}秒），进程已被终止（非交互模式）。",
+            }
+        except Exception as e:
+            print(f"❌ {str(e)}")
+            return {"success": False, "stdout": "", "stderr": str(e)}
+
     def _execute_script_with_interpreter(
         self, interpreter: str, script_content: str
     ) -> Dict[str, Any]:
@@ -89,6 +135,13 @@ class ScriptTool:
             Dictionary with execution results
         """
         try:
+            # 非交互模式下bash/sh可直接从stdin读脚本，省去临时文件和终端捕获；
+            # 其他解释器（gcc、javac等）依赖带扩展名的真实文件，走原路径
+            from jarvis.jarvis_utils.config import is_non_interactive as _non_interactive
+
+            if interpreter in ("bash", "sh") and _non_interactive():
+                return self._execute_via_stdin(interpreter, script_content)
+
             # Get file extension for the interpreter
             extension = self.INTERPRETER_EXTENSIONS.get(interpreter, "script")
 
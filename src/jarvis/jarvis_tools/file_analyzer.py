@@ -27,7 +27,7 @@ class FileAnalyzerTool:
 
     @staticmethod
     def check() -> bool:
-        return PlatformRegistry().get_normal_platform().support_upload_files()
+        return PlatformRegistry.get_global_platform_registry().get_normal_platform().support_upload_files()
 
     def execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """执行文件分析操作
@@ -59,7 +59,7 @@ class FileAnalyzerTool:
                 return {"success": False, "stdout": "", "stderr": "没有找到有效的文件"}
 
             # 创建平台实例
-            platform = PlatformRegistry().get_normal_platform()
+            platform = PlatformRegistry.get_global_platform_registry().get_normal_platform()
 
             if not platform:
                 return {
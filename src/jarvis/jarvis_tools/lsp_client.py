@@ -5,9 +5,15 @@
 辅助CodeAgent进行代码分析和生成。
 """
 
+import atexit
+import functools
 import os
 import subprocess
 import json
+import threading
+from collections import deque
+from concurrent.futures import Future
+from urllib.parse import unquote, urlparse
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
@@ -17,6 +23,100 @@ from dataclasses import dataclass
 _treesitter_available = None
 _symbol_extractor_module = None
 
+# JSON-RPC编解码：LSP响应（符号树、诊断）可达数MB，orjson比stdlib快数倍；
+# 未安装时回退到标准库
+try:
+    import orjson  # type: ignore
+
+    _json_dumps = orjson.dumps  # 直接返回bytes
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+def _read_text_fast(path: str) -> str:
+    """一次性读入整个文件并解码。
+
+    用os.open+fstat+os.read按实际大小单次读取，跳过文本IO层的
+    universal-newlines处理和分块读取，大文件下明显更快。
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", errors="replace")
+
+
+def _clangd_command(base_command: List[str], project_root: str) -> List[str]:
+    """根据工作区现状调整clangd启动参数。
+
+    工作区已有预构建的索引分片时开启后台索引——此时clangd只需加载
+    分片而不是全量解析代码库——并把优先级调低，避免启动时的重索引
+    风暴；没有现成索引时不开后台扫描（会话未必活到受益那天），
+    并把PCH放内存，省去每次预编译头落盘的磁盘IO。
+    """
+    for rel_path in (".cache/clangd/index", ".clangd/index"):
+        if os.path.isdir(os.path.join(project_root, rel_path)):
+            return base_command + [
+                "--background-index",
+                "--background-index-priority=low",
+            ]
+    return base_command + ["--pch-storage=memory"]
+
+
+@functools.lru_cache(maxsize=1024)
+def _uri_to_path(uri: str) -> str:
+    """将LSP的file:// URI转换为本地路径。
+
+    同一URI在一次会话中反复出现（定义、引用结果），lru_cache避免
+    重复解析；非file URI原样返回。
+    """
+    if not uri.startswith("file://"):
+        return uri
+    parsed = urlparse(uri)
+    path = unquote(parsed.path)
+    # Windows下路径形如/C:/...，去掉前导斜杠
+    if os.name == "nt" and len(path) > 2 and path[0] == "/" and path[2] == ":":
+        path = path[1:]
+    return path
+
+
+# 文件目录 -> 工作区根目录 的记忆化缓存
+_workspace_root_cache: Dict[str, str] = {}
+
+
+def _resolve_workspace_root(file_path: str) -> str:
+    """解析文件所属的工作区根目录（最近的含.git祖先目录）。
+
+    同一目录下的文件共享缓存结果，避免重复向上遍历；
+    找不到.git时退回文件所在目录。同一仓库内的所有文件由此
+    解析到同一根目录，使按(根目录, 语言)键控的客户端缓存真正命中，
+    而不是每个子目录各起一个服务器进程。
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    cached = _workspace_root_cache.get(directory)
+    if cached is not None:
+        return cached
+
+    root = directory
+    probe = directory
+    while True:
+        if os.path.isdir(os.path.join(probe, ".git")):
+            root = probe
+            break
+        parent = os.path.dirname(probe)
+        if parent == probe:
+            break
+        probe = parent
+    _workspace_root_cache[directory] = root
+    return root
+
+
 def _check_treesitter_available():
     """检查 Tree-sitter 是否可用"""
     global _treesitter_available, _symbol_extractor_module
@@ -114,7 +214,11 @@ LSP_SERVERS = {
 
 class LSPClient:
     """LSP客户端，用于与LSP服务器通信。"""
-    
+
+    # 服务器可用性检测结果缓存（按检测命令），同一进程内只探测一次，
+    # 避免每创建一个客户端就spawn一次--version子进程
+    _availability_cache: Dict[Tuple[str, ...], bool] = {}
+
     def __init__(self, project_root: str, server_config: LSPServerConfig):
         """初始化LSP客户端。
         
@@ -129,6 +233,19 @@ class LSPClient:
         self.server_config = server_config
         self.process: Optional[subprocess.Popen] = None
         self.request_id = 0
+        # 查询结果缓存：键中带文件mtime，文件未修改时重复查询直接命中，
+        # 免去一次LSP往返；文件一旦改动mtime变化，旧键自然失效
+        self._result_cache: Dict[Tuple, Any] = {}
+        self._max_result_cache_size = 256
+        # 服务器主动推送的通知（诊断、进度、日志等），读响应时顺带缓存
+        self._notifications: deque = deque(maxlen=64)
+        # 已打开文档：绝对路径 -> mtime_ns，避免重复推送全文didOpen
+        self._open_docs: Dict[str, int] = {}
+        # 流水线支持：在途请求按id分发，常驻读线程统一收响应
+        self._pending: Dict[int, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reader_thread: Optional[threading.Thread] = None
         
         # 验证LSP服务器是否可用
         if not self._check_server_available():
@@ -148,7 +265,25 @@ class LSPClient:
         """
         # 如果没有配置检测命令，尝试直接运行主命令
         check_cmd = self.server_config.check_command or self.server_config.command
-        
+
+        cache_key = tuple(check_cmd)
+        cached = LSPClient._availability_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        available = self._probe_server(check_cmd)
+        LSPClient._availability_cache[cache_key] = available
+        return available
+
+    def _probe_server(self, check_cmd: List[str]) -> bool:
+        """实际执行检测命令探测服务器是否可用。
+
+        Args:
+            check_cmd: 检测命令
+
+        Returns:
+            bool: 如果服务器可用返回True，否则返回False
+        """
         try:
             # 尝试运行检测命令
             subprocess.run(
@@ -185,14 +320,18 @@ class LSPClient:
         """初始化LSP连接。"""
         try:
             # 启动LSP服务器进程
+            command = self.server_config.command
+            if self.server_config.name == "clangd":
+                command = _clangd_command(command, self.project_root)
+
+            # 二进制管道：LSP消息按Content-Length字节数定帧，
+            # 文本模式下字符数与字节数不一致会破坏定帧
             self.process = subprocess.Popen(
-                self.server_config.command,
+                command,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 cwd=self.project_root,
-                text=True,
-                bufsize=0
             )
             
             # 发送初始化请求
@@ -231,81 +370,183 @@ class LSPClient:
         Returns:
             响应结果
         """
+        future = self._send_request_async(method, params)
+        if future is None:
+            return None
+        return self._await_result(future)
+
+    def _send_request_async(self, method: str, params: Dict) -> Optional[Future]:
+        """发出LSP请求但不等待响应，返回Future。
+
+        写入后立即返回，响应由常驻读线程按id分发到对应Future；
+        调用方可连续发出多个请求再统一等待，总耗时约等于最慢的
+        一个而不是逐个往返之和。
+
+        Args:
+            method: 方法名
+            params: 参数
+
+        Returns:
+            响应Future，发送失败时返回None
+        """
         if not self.process:
             return None
-        
-        self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "id": self.request_id,
-            "method": method,
-            "params": params
-        }
-        
+
         try:
-            # 发送请求
-            request_str = json.dumps(request) + "\n"
-            self.process.stdin.write(request_str)
-            self.process.stdin.flush()
-            
-            # 读取响应（简化实现，实际应该使用异步或线程）
-            # 这里使用超时读取
-            import threading
-            import queue
-            
-            # 使用队列在线程中读取响应
-            response_queue = queue.Queue()
-            
-            def read_response():
-                try:
-                    response_line = self.process.stdout.readline()
-                    if response_line:
-                        response = json.loads(response_line)
-                        response_queue.put(response)
-                except Exception as e:
-                    print(f"❌ Error reading LSP response: {e}")
-                    response_queue.put(None)
-            
-            # 启动读取线程
-            read_thread = threading.Thread(target=read_response, daemon=True)
-            read_thread.start()
-            read_thread.join(timeout=5.0)
-            
-            try:
-                response = response_queue.get(timeout=0.1)
-                if response and "result" in response:
-                    return response["result"]
-            except queue.Empty:
-                pass
-            
-            return None
+            self._ensure_reader()
+            future: Future = Future()
+            with self._pending_lock:
+                self.request_id += 1
+                request_id = self.request_id
+                self._pending[request_id] = future
+            request = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params
+            }
+            self._write_message(request)
+            return future
         except Exception as e:
             print(f"❌ Error sending LSP request: {e}")
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
             return None
-    
+
+    def _await_result(self, future: Future, timeout: float = 5.0) -> Optional[Dict]:
+        """等待Future并提取响应中的result字段。
+
+        超时后从在途表中移除该请求，避免服务器永不响应时
+        _pending无限增长。
+        """
+        try:
+            response = future.result(timeout=timeout)
+        except Exception:
+            with self._pending_lock:
+                for request_id, pending in list(self._pending.items()):
+                    if pending is future:
+                        self._pending.pop(request_id, None)
+                        break
+            return None
+        if response and "result" in response:
+            return response["result"]
+        return None
+
+    def _ensure_reader(self):
+        """确保常驻读线程已启动。"""
+        if self._reader_thread is not None and self._reader_thread.is_alive():
+            return
+        self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader_thread.start()
+
+    def _read_loop(self):
+        """常驻读循环：响应按id分发给在途Future，通知进缓存队列。"""
+        try:
+            while True:
+                message = self._read_message()
+                if message is None:
+                    break  # 流已关闭
+                if "id" in message:
+                    with self._pending_lock:
+                        future = self._pending.pop(message["id"], None)
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                elif "method" in message:
+                    # 服务器通知（诊断、进度、日志等）
+                    self._notifications.append(message)
+        except Exception as e:
+            print(f"❌ Error reading LSP response: {e}")
+        finally:
+            # 流断开后让所有等待方立刻返回而不是等到超时
+            with self._pending_lock:
+                pending = list(self._pending.values())
+                self._pending.clear()
+            for future in pending:
+                if not future.done():
+                    future.set_result(None)
+
+    def _write_message(self, payload: Dict):
+        """按LSP规范写入一条Content-Length定帧的消息。
+
+        Args:
+            payload: JSON-RPC消息体
+        """
+        body = _json_dumps(payload)
+        header = f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+        with self._write_lock:
+            self.process.stdin.write(header + body)
+            self.process.stdin.flush()
+
+    def _read_message(self) -> Optional[Dict]:
+        """读取一条Content-Length定帧的LSP消息。
+
+        先逐行读取头部直到空行，取Content-Length后精确读取消息体。
+
+        Returns:
+            解析后的JSON-RPC消息，流关闭或格式错误时返回None
+        """
+        stdout = self.process.stdout
+        content_length = None
+        while True:
+            line = stdout.readline()
+            if not line:
+                return None  # 流已关闭
+            line = line.strip()
+            if not line:
+                break  # 头部结束
+            if line.lower().startswith(b"content-length:"):
+                content_length = int(line.split(b":", 1)[1])
+
+        if content_length is None:
+            return None
+
+        body = b""
+        while len(body) < content_length:
+            chunk = stdout.read(content_length - len(body))
+            if not chunk:
+                return None  # 流已关闭
+            body += chunk
+        return _json_loads(body)
+
     def _send_notification(self, method: str, params: Dict):
         """发送LSP通知（无响应）。
-        
+
         Args:
             method: 方法名
             params: 参数
         """
         if not self.process:
             return
-        
+
         notification = {
             "jsonrpc": "2.0",
             "method": method,
             "params": params
         }
-        
+
         try:
-            notification_str = json.dumps(notification) + "\n"
-            self.process.stdin.write(notification_str)
-            self.process.stdin.flush()
+            self._write_message(notification)
         except Exception as e:
             print(f"❌ Error sending LSP notification: {e}")
     
+    def _file_stamp(self, file_path: str) -> Tuple[str, int]:
+        """返回(绝对路径, mtime_ns)作为缓存键的文件部分。
+
+        文件不存在或无法stat时mtime记为-1，保证键仍然可用。
+        """
+        abs_path = os.path.abspath(file_path)
+        try:
+            mtime = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            mtime = -1
+        return (abs_path, mtime)
+
+    def _store_result(self, key: Tuple, value: Any) -> None:
+        """写入结果缓存，超出容量时按FIFO淘汰最旧条目。"""
+        if len(self._result_cache) >= self._max_result_cache_size:
+            self._result_cache.pop(next(iter(self._result_cache)))
+        self._result_cache[key] = value
+
     def get_completion(self, file_path: str, line: int, character: int) -> List[Dict]:
         """获取代码补全。
         
@@ -355,11 +596,18 @@ class LSPClient:
         Returns:
             定义位置
         """
+        key = ("definition",) + self._file_stamp(file_path) + (line, character)
+        if key in self._result_cache:
+            return self._result_cache[key]
+
         uri = Path(file_path).as_uri()
-        return self._send_request("textDocument/definition", {
+        result = self._send_request("textDocument/definition", {
             "textDocument": {"uri": uri},
             "position": {"line": line, "character": character}
         })
+        if result:
+            self._store_result(key, result)
+        return result
     
     def get_references(self, file_path: str, line: int, character: int) -> List[Dict]:
         """获取引用位置。
@@ -372,14 +620,19 @@ class LSPClient:
         Returns:
             引用位置列表
         """
+        key = ("references",) + self._file_stamp(file_path) + (line, character)
+        if key in self._result_cache:
+            return self._result_cache[key]
+
         uri = Path(file_path).as_uri()
         result = self._send_request("textDocument/references", {
             "textDocument": {"uri": uri},
             "position": {"line": line, "character": character},
             "context": {"includeDeclaration": False}
         })
-        
+
         if result:
+            self._store_result(key, result)
             return result
         return []
     
@@ -392,12 +645,17 @@ class LSPClient:
         Returns:
             符号列表
         """
+        key = ("documentSymbol",) + self._file_stamp(file_path)
+        if key in self._result_cache:
+            return self._result_cache[key]
+
         uri = Path(file_path).as_uri()
         result = self._send_request("textDocument/documentSymbol", {
             "textDocument": {"uri": uri}
         })
-        
+
         if result:
+            self._store_result(key, result)
             return result
         return []
     
@@ -456,14 +714,27 @@ class LSPClient:
         line = start.get("line", 0)
         character = start.get("character", 0)
         
-        # 获取悬停信息
-        hover_info = self.get_hover(file_path, line, character)
-        
-        # 获取定义位置
-        definition = self.get_definition(file_path, line, character)
-        
-        # 获取引用
-        references = self.get_references(file_path, line, character)
+        # 三个查询互相独立，流水线并发发出再统一等待，
+        # 总耗时约等于最慢的一个而不是三次往返之和
+        uri = Path(file_path).as_uri()
+        position = {"line": line, "character": character}
+        hover_future = self._send_request_async("textDocument/hover", {
+            "textDocument": {"uri": uri},
+            "position": position
+        })
+        definition_future = self._send_request_async("textDocument/definition", {
+            "textDocument": {"uri": uri},
+            "position": position
+        })
+        references_future = self._send_request_async("textDocument/references", {
+            "textDocument": {"uri": uri},
+            "position": position,
+            "context": {"includeDeclaration": False}
+        })
+
+        hover_info = self._await_result(hover_future) if hover_future else None
+        definition = self._await_result(definition_future) if definition_future else None
+        references = (self._await_result(references_future) if references_future else None) or []
         
         return {
             "name": symbol.get("name"),
@@ -480,6 +751,20 @@ class LSPClient:
             "reference_count": len(references) if references else 0
         }
     
+    def open_document(self, file_path: str):
+        """确保文档已在服务器端打开并与磁盘内容同步。
+
+        文档已打开且未修改（mtime一致）时直接返回，连文件都不再读；
+        只有首次打开或内容变化时才做一次全量读取。
+
+        Args:
+            file_path: 文件路径
+        """
+        abs_path, mtime = self._file_stamp(file_path)
+        if self._open_docs.get(abs_path) == mtime:
+            return
+        self.notify_did_open(file_path, _read_text_fast(abs_path))
+
     def notify_did_open(self, file_path: str, content: str):
         """通知文档打开。
         
@@ -487,6 +772,17 @@ class LSPClient:
             file_path: 文件路径
             content: 文件内容
         """
+        abs_path, mtime = self._file_stamp(file_path)
+        prev_mtime = self._open_docs.get(abs_path)
+        if prev_mtime == mtime:
+            # 文档已打开且未修改，重复的全文didOpen只会让服务器重新解析
+            return
+        if prev_mtime is not None:
+            # 已打开但内容有变化，用didChange同步而不是再次didOpen
+            self._open_docs[abs_path] = mtime
+            self.notify_did_change(file_path, content)
+            return
+
         uri = Path(file_path).as_uri()
         self._send_notification("textDocument/didOpen", {
             "textDocument": {
@@ -496,6 +792,7 @@ class LSPClient:
                 "text": content
             }
         })
+        self._open_docs[abs_path] = mtime
     
     def notify_did_change(self, file_path: str, content: str):
         """通知文档变更。
@@ -520,13 +817,16 @@ class LSPClient:
     
     def close(self):
         """关闭LSP连接。"""
+        self._result_cache.clear()
+        self._open_docs.clear()
         if self.process:
             try:
-                # 尝试优雅关闭
-                try:
-                    self._send_notification("shutdown", {})
-                except Exception:
-                    pass  # 如果发送失败，直接终止进程
+                # 尝试优雅关闭（进程已退出时跳过，避免写入已关闭的管道）
+                if self.process.poll() is None:
+                    try:
+                        self._send_notification("shutdown", {})
+                    except Exception:
+                        pass  # 如果发送失败，直接终止进程
                 
                 # 关闭标准输入，通知服务器可以退出
                 if self.process.stdin:
@@ -606,7 +906,8 @@ class TreeSitterFallback:
         self.project_root = os.path.abspath(project_root)
         self.language = language
         self._extractor = None
-        self._symbols_cache: Dict[str, List[Dict]] = {}  # 文件路径 -> 符号列表
+        # 文件路径 -> (mtime_ns, 符号列表)，文件修改后自动失效重新提取
+        self._symbols_cache: Dict[str, Tuple[int, List[Dict]]] = {}
     
     def _get_extractor(self):
         """获取符号提取器（延迟加载）"""
@@ -623,22 +924,22 @@ class TreeSitterFallback:
         Returns:
             符号列表
         """
-        # 检查缓存
-        if file_path in self._symbols_cache:
-            return self._symbols_cache[file_path]
-        
+        # 检查缓存（mtime一致才命中，文件修改后重新提取）
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._symbols_cache.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
         extractor = self._get_extractor()
         if not extractor:
             return []
-        
+
         try:
-            # 读取文件内容
-            if not os.path.exists(file_path):
-                return []
-            
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            
+            content = _read_text_fast(file_path)
+
             # 提取符号
             symbols = extractor.extract_symbols(file_path, content)
             
@@ -664,7 +965,7 @@ class TreeSitterFallback:
                 lsp_symbols.append(lsp_symbol)
             
             # 缓存结果
-            self._symbols_cache[file_path] = lsp_symbols
+            self._symbols_cache[file_path] = (mtime, lsp_symbols)
             return lsp_symbols
         except Exception as e:
             print(f"⚠️ Tree-sitter 提取符号失败: {e}")
@@ -1024,8 +1325,8 @@ class LSPClientTool:
                     "stderr": "缺少必需参数: action 和 file_path"
                 }
             
-            # 获取项目根目录（从agent获取，或使用文件所在目录）
-            project_root = args.get("project_root") or os.path.dirname(os.path.abspath(file_path))
+            # 获取项目根目录（从agent获取，或解析文件所属的工作区根目录）
+            project_root = args.get("project_root") or _resolve_workspace_root(file_path)
             
             # 获取或创建LSP客户端
             client = self._get_or_create_client(project_root, file_path)
@@ -1054,11 +1355,9 @@ class LSPClientTool:
                     "stderr": error_msg
                 }
             
-            # 确保文件已打开（仅对 LSP 客户端需要）
+            # 确保文件已打开（仅对 LSP 客户端需要），未变化时跳过重读
             if isinstance(client, LSPClient) and os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                client.notify_did_open(file_path, content)
+                client.open_document(file_path)
             
             # 执行操作（完全基于符号名称，无需行列号）
             symbol_name = args.get("symbol_name")
@@ -1220,7 +1519,7 @@ class LSPClientTool:
                     definition = definition[0] if definition else {}
                 uri = definition.get("uri", "")
                 if uri:
-                    file_path = Path(uri).path if uri.startswith("file://") else uri
+                    file_path = _uri_to_path(uri)
                     range_info = definition.get("range", {})
                     start = range_info.get("start", {})
                     line = start.get("line", 0) + 1
@@ -1267,7 +1566,7 @@ class LSPClientTool:
             start = range.get("start", {})
             line = start.get("line", 0) + 1  # 转换为1-based
             
-            file_path = Path(uri).path if uri.startswith("file://") else uri
+            file_path = _uri_to_path(uri)
             return f"定义位置: {file_path}:{line}"
         
         elif action == "references":
@@ -1282,7 +1581,7 @@ class LSPClientTool:
                 start = range.get("start", {})
                 line = start.get("line", 0) + 1
                 
-                file_path = Path(uri).path if uri.startswith("file://") else uri
+                file_path = _uri_to_path(uri)
                 lines.append(f"  - {file_path}:{line}")
             return "\n".join(lines)
         
@@ -1298,8 +1597,13 @@ class LSPClientTool:
                 range = symbol.get("range", {})
                 start = range.get("start", {})
                 line = start.get("line", 0) + 1
-                
+
                 lines.append(f"  - {name} ({kind}) at line {line}")
             return "\n".join(lines)
-        
-        return str(result)
\ No newline at end of file
+
+        return str(result)
+
+
+# 进程退出时统一关闭所有LSP服务器进程。客户端在工具调用间保持存活复用，
+# 避免每次查询都重新冷启动服务器（重新解析preamble和加载索引）
+atexit.register(LSPClientTool.cleanup_all_clients)
\ No newline at end of file
@@ -674,10 +674,32 @@ class ReadCodeTool:
                     "stderr": "文件过大 (>10MB)",
                 }
 
-            # 读取文件内容
-            # 第一遍流式读取，仅统计总行数，避免一次性读入内存
-            with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
-                total_lines = sum(1 for _ in f)
+            # 获取文件修改时间
+            file_mtime = os.path.getmtime(abs_path)
+
+            # 检查缓存是否有效
+            cache_info = self._get_file_cache(agent, abs_path)
+            use_cache = self._is_cache_valid(cache_info, abs_path)
+
+            # 读取完整文件内容用于语法分析和token计算
+            # 内容后面必然会用到，直接读一遍并由其推导总行数，
+            # 避免先为统计行数单独扫描一遍磁盘
+            if use_cache:
+                # 从缓存恢复文件内容
+                full_content = self._restore_file_from_cache(cache_info)
+                # 如果恢复失败，重新读取文件
+                if not full_content:
+                    with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
+                        full_content = f.read()
+            else:
+                # 读取文件内容
+                with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
+                    full_content = f.read()
+
+            # 与逐行迭代语义一致：末行无换行符也计为一行
+            total_lines = full_content.count("\n")
+            if full_content and not full_content.endswith("\n"):
+                total_lines += 1
 
             # 处理空文件情况
             if total_lines == 0:
@@ -711,26 +733,6 @@ class ReadCodeTool:
                     "stderr": f"无效的行范围 [{start_line}-{end_line}] (总行数: {total_lines})",
                 }
 
-            # 获取文件修改时间
-            file_mtime = os.path.getmtime(abs_path)
-            
-            # 检查缓存是否有效
-            cache_info = self._get_file_cache(agent, abs_path)
-            use_cache = self._is_cache_valid(cache_info, abs_path)
-
-            # 读取完整文件内容用于语法分析和token计算
-            if use_cache:
-                # 从缓存恢复文件内容
-                full_content = self._restore_file_from_cache(cache_info)
-                # 如果恢复失败，重新读取文件
-                if not full_content:
-                    with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
-                        full_content = f.read()
-            else:
-                # 读取文件内容
-                with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
-                    full_content = f.read()
-            
             # 读取要读取的行范围内容
             selected_content_lines = []
             lines = full_content.split('\n')
@@ -1065,13 +1067,19 @@ class ReadCodeTool:
                     continue
                 
                 try:
-                    # 统计总行数
+                    # token估算总会用到完整内容，读一遍后直接从内容推导总行数，
+                    # 避免为统计行数再扫描一遍磁盘
                     with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
-                        total_lines = sum(1 for _ in f)
-                    
+                        file_content = f.read()
+
+                    # 与逐行迭代语义一致：末行无换行符也计为一行
+                    total_lines = file_content.count("\n")
+                    if file_content and not file_content.endswith("\n"):
+                        total_lines += 1
+
                     if total_lines == 0:
                         continue
-                    
+
                     # 计算实际要读取的行范围
                     if end_line == -1:
                         actual_end_line = total_lines
@@ -1081,18 +1089,14 @@ class ReadCodeTool:
                             if end_line >= 0
                             else total_lines + end_line + 1
                         )
-                    
+
                     actual_start_line = (
                         max(1, min(start_line, total_lines))
                         if start_line >= 0
                         else total_lines + start_line + 1
                     )
-                    
+
                     if actual_start_line <= actual_end_line:
-                        # 读取完整文件内容用于token估算
-                        with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
-                            file_content = f.read()
-                        
                         # 估算结构化输出的token数
                         raw_mode = file_info.get("raw_mode", False)
                         content_tokens = self._estimate_structured_tokens(
@@ -43,7 +43,7 @@ class WebpageTool:
             web_search_platform = get_web_search_platform_name()
             web_search_model = get_web_search_model_name()
             if web_search_platform and web_search_model:
-                model = PlatformRegistry().create_platform(web_search_platform)
+                model = PlatformRegistry.get_global_platform_registry().create_platform(web_search_platform)
                 if model:
                     model.set_model_name(web_search_model)
                     if model.support_web():
@@ -61,7 +61,7 @@ class WebpageTool:
                             return {"success": True, "stdout": response, "stderr": ""}
 
             # 2) 然后尝试使用默认平台（normal）的 web 能力
-            model = PlatformRegistry().get_normal_platform()
+            model = PlatformRegistry.get_global_platform_registry().get_normal_platform()
             if model.support_web():
 
                 model.set_web(True)
@@ -108,7 +108,7 @@ class WebpageTool:
 - 包含网页标题（若可推断）
 - 提供准确、完整的信息"""
 
-            model = PlatformRegistry().get_normal_platform()
+            model = PlatformRegistry.get_global_platform_registry().get_normal_platform()
             model.set_suppress_output(False)  # type: ignore
             summary = model.chat_until_success(summary_prompt)  # type: ignore
 
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 
 import yaml  # type: ignore[import-untyped]
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 
 from jarvis.jarvis_mcp import McpClient
 from jarvis.jarvis_mcp.sse_mcp_client import SSEMcpClient
@@ -72,6 +73,15 @@ Jsonnet格式特性：
 """
 
 
+# 工具调用标签是常量，预编译正则避免在每个模型响应上重复构造/编译模式
+_TOOL_CALL_OPEN_RE = re.compile(rf'(?mi){re.escape(ot("TOOL_CALL"))}')
+_TOOL_CALL_CLOSE_BOL_RE = re.compile(rf'(?mi)^{re.escape(ct("TOOL_CALL"))}')
+_TOOL_CALL_CLOSE_END_RE = re.compile(rf'{re.escape(ct("TOOL_CALL"))}$', re.IGNORECASE)
+_TOOL_CALL_BLOCK_RE = re.compile(
+    rf'(?msi){re.escape(ot("TOOL_CALL"))}(.*?)^{re.escape(ct("TOOL_CALL"))}'
+)
+
+
 class OutputHandlerProtocol(Protocol):
     def name(self) -> str: ...
 
@@ -89,22 +99,37 @@ class ToolRegistry(OutputHandlerProtocol):
     def can_handle(self, response: str) -> bool:
         # 仅当 {ot("TOOL_CALL")} 出现在行首时才认为可以处理（忽略大小写）
         print("🛠️ 检测到工具调用")  # 增加工具emoji
-        return re.search(rf'(?mi){re.escape(ot("TOOL_CALL"))}', response) is not None
+        return _TOOL_CALL_OPEN_RE.search(response) is not None
 
     def prompt(self) -> str:
         """加载工具"""
+        # 工具集未变化时直接复用上次构建的提示，避免每轮对话重复序列化参数
+        cache_key = tuple(self.tools.keys())
+        if self._prompt_cache is not None and self._prompt_cache[0] == cache_key:
+            return self._prompt_cache[1]
+        result = self._build_prompt()
+        self._prompt_cache = (cache_key, result)
+        return result
+
+    def _build_prompt(self) -> str:
+        """构建工具列表提示文本"""
         tools = self.get_all_tools()
         if tools:
-            tools_prompt = "<tools_section>\n"
-            tools_prompt += "  <header>## 可用工具:</header>\n"
-            tools_prompt += "  <tools_list>\n"
+            # 使用列表累积 + join，避免循环内字符串拼接的重复拷贝
+            parts = [
+                "<tools_section>\n",
+                "  <header>## 可用工具:</header>\n",
+                "  <tools_list>\n",
+            ]
             for tool in tools:
                 try:
-                    tools_prompt += "    <tool>\n"
-                    tools_prompt += f"      <name>名称: {tool['name']}</name>\n"
-                    tools_prompt += f"      <description>描述: {tool['description']}</description>\n"
-                    tools_prompt += "      <parameters>\n"
-                    tools_prompt += "        <json>|\n"
+                    tool_parts = [
+                        "    <tool>\n",
+                        f"      <name>名称: {tool['name']}</name>\n",
+                        f"      <description>描述: {tool['description']}</description>\n",
+                        "      <parameters>\n",
+                        "        <json>|\n",
+                    ]
 
                     # 生成格式化的JSON参数
                     json_params = json.dumps(
@@ -116,20 +141,21 @@ class ToolRegistry(OutputHandlerProtocol):
 
                     # 添加缩进并移除尾部空格
                     for line in json_params.split("\n"):
-                        tools_prompt += f"          {line.rstrip()}\n"
+                        tool_parts.append(f"          {line.rstrip()}\n")
 
-                    tools_prompt += "        </json>\n"
-                    tools_prompt += "      </parameters>\n"
-                    tools_prompt += "    </tool>\n"
+                    tool_parts.append("        </json>\n")
+                    tool_parts.append("      </parameters>\n")
+                    tool_parts.append("    </tool>\n")
+                    parts.extend(tool_parts)
 
                 except Exception as e:
                     print(f"❌ 工具 {tool['name']} 参数序列化失败: {str(e)}")
                     continue
 
-            tools_prompt += "  </tools_list>\n"
-            tools_prompt += "</tools_section>\n"
-            tools_prompt += tool_call_help.rstrip()  # 移除帮助文本尾部空格
-            return tools_prompt
+            parts.append("  </tools_list>\n")
+            parts.append("</tools_section>\n")
+            parts.append(tool_call_help.rstrip())  # 移除帮助文本尾部空格
+            return "".join(parts)
         return ""
 
     def handle(self, response: str, agent_: Any) -> Tuple[bool, Any]:
@@ -163,6 +189,8 @@ class ToolRegistry(OutputHandlerProtocol):
     def __init__(self) -> None:
         """初始化工具注册表"""
         self.tools: Dict[str, Tool] = {}
+        # prompt() 结果缓存：(工具名元组, 提示文本)
+        self._prompt_cache: Optional[Tuple[Tuple[str, ...], str]] = None
         # 加载内置工具和外部工具
         self._load_builtin_tools()
         self._load_external_tools()
@@ -283,7 +311,7 @@ class ToolRegistry(OutputHandlerProtocol):
         for file_path in mcp_tools_dir.glob("*.yaml"):
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
+                    config = yaml_safe_load(f)
                 self.register_mcp_tool_by_config(config)
             except Exception as e:
                 error_lines.append(f"文件 {file_path} 加载失败: {str(e)}")
@@ -557,8 +585,7 @@ class ToolRegistry(OutputHandlerProtocol):
     @staticmethod
     def _has_tool_calls_block(content: str) -> bool:
         """从内容中提取工具调用块（仅匹配行首标签，忽略大小写）"""
-        pattern = rf'(?msi){re.escape(ot("TOOL_CALL"))}(.*?)^{re.escape(ct("TOOL_CALL"))}'
-        return re.search(pattern, content) is not None
+        return _TOOL_CALL_BLOCK_RE.search(content) is not None
 
     @staticmethod
     def _extract_tool_calls(
@@ -579,33 +606,26 @@ class ToolRegistry(OutputHandlerProtocol):
             Exception: 如果工具调用缺少必要字段
         """
         # 如果</TOOL_CALL>出现在响应的末尾，但是前面没有换行符，自动插入一个换行符进行修复（忽略大小写）
-        close_tag = ct("TOOL_CALL")
-        # 使用正则表达式查找结束标签（忽略大小写），以获取实际位置和原始大小写
-        close_tag_pattern = re.escape(close_tag)
-        match = re.search(rf'{close_tag_pattern}$', content.rstrip(), re.IGNORECASE)
+        match = _TOOL_CALL_CLOSE_END_RE.search(content.rstrip())
         if match:
             pos = match.start()
             if pos > 0 and content[pos - 1] not in ("\n", "\r"):
                 content = content[:pos] + "\n" + content[pos:]
 
         # 将内容拆分为行（忽略大小写）
-        pattern = rf'(?msi){re.escape(ot("TOOL_CALL"))}(.*?)^{re.escape(ct("TOOL_CALL"))}'
-        data = re.findall(pattern, content)
+        data = _TOOL_CALL_BLOCK_RE.findall(content)
         auto_completed = False
         if not data:
             # can_handle 确保 ot("TOOL_CALL") 在内容中（行首）。
             # 如果数据为空，则表示行首的 ct("TOOL_CALL") 可能丢失。
-            has_open_at_bol = re.search(rf'(?mi){re.escape(ot("TOOL_CALL"))}', content) is not None
-            has_close_at_bol = re.search(rf'(?mi)^{re.escape(ct("TOOL_CALL"))}', content) is not None
+            has_open_at_bol = _TOOL_CALL_OPEN_RE.search(content) is not None
+            has_close_at_bol = _TOOL_CALL_CLOSE_BOL_RE.search(content) is not None
             if has_open_at_bol and not has_close_at_bol:
                 # 尝试通过附加结束标签来修复它（确保结束标签位于行首）
                 fixed_content = content.strip() + f"\n{ct('TOOL_CALL')}"
 
                 # 再次提取，并检查JSON是否有效
-                temp_data = re.findall(
-                    pattern,
-                    fixed_content,
-                )
+                temp_data = _TOOL_CALL_BLOCK_RE.findall(fixed_content)
 
                 if temp_data:
                     try:
@@ -674,6 +694,8 @@ class ToolRegistry(OutputHandlerProtocol):
         if name in self.tools:
             print(f"⚠️ 警告: 工具 '{name}' 已存在，将被覆盖")
         self.tools[name] = Tool(name, description, parameters, func, protocol_version)
+        # 工具定义可能被覆盖，使提示缓存失效
+        self._prompt_cache = None
 
     def get_tool(self, name: str) -> Optional[Tool]:
         """获取工具
@@ -3,6 +3,16 @@ import os
 from typing import Any, Dict
 
 
+def _ensure_parent_dir(abs_path: str) -> None:
+    """确保父目录存在
+
+    父目录已存在时只做一次stat即返回，避免makedirs逐级检查祖先目录；
+    路径位于当前目录时dirname为空，直接跳过。
+    """
+    parent = os.path.dirname(abs_path)
+    if parent and not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
+
 
 class RewriteFileTool:
     """文件重写工具，用于完全重写文件内容"""
@@ -59,7 +69,7 @@ class RewriteFileTool:
                     with open(abs_path, "r", encoding="utf-8") as rf:
                         original_content = rf.read()
 
-                os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+                _ensure_parent_dir(abs_path)
                 with open(abs_path, "w", encoding="utf-8") as wf:
                     wf.write(content)
                 processed = True
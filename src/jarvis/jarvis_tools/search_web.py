@@ -89,7 +89,7 @@ class SearchWebTool:
             platform_name = agent.model.platform_name()
             model_name = agent.model.name()
 
-            model = PlatformRegistry().create_platform(platform_name)
+            model = PlatformRegistry.get_global_platform_registry().create_platform(platform_name)
             if not model:
                 return {
                     "stdout": "",
@@ -137,7 +137,7 @@ class SearchWebTool:
 
         # 如果配置了专门的 Web 搜索平台和模型，优先使用
         if web_search_platform and web_search_model:
-            model = PlatformRegistry().create_platform(web_search_platform)
+            model = PlatformRegistry.get_global_platform_registry().create_platform(web_search_platform)
             if model:
                 model.set_model_name(web_search_model)
                 if model.support_web():
@@ -153,7 +153,7 @@ class SearchWebTool:
 
         # 否则使用现有的模型选择流程
         if agent.model.support_web():
-            model = PlatformRegistry().create_platform(agent.model.platform_name())
+            model = PlatformRegistry.get_global_platform_registry().create_platform(agent.model.platform_name())
             if not model:
                 return {"stdout": "", "stderr": "无法创建模型。", "success": False}
             model.set_model_name(agent.model.name())
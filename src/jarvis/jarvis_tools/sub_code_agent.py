@@ -110,7 +110,8 @@ class SubCodeAgentTool:
             # 依据父Agent已启用工具集，推导 append_tools（作为在 CodeAgent 基础工具上的增量）
             append_tools = None
             try:
-                base_tools = [
+                # 使用集合做成员判断，避免对每个工具名线性扫描列表
+                base_tools = {
                     "execute_script",
                     "search_web",
                     "ask_user",
@@ -120,7 +121,7 @@ class SubCodeAgentTool:
                     "retrieve_memory",
                     "clear_memory",
                     "sub_code_agent",
-                ]
+                }
                 if use_tools:
                     extras = [t for t in use_tools if t not in base_tools]
                     append_tools = ",".join(extras) if extras else None
@@ -4,6 +4,7 @@ from functools import lru_cache
 from typing import Any, Dict, List, Optional, cast
 
 import yaml
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 
 from jarvis.jarvis_utils.builtin_replace_map import BUILTIN_REPLACE_MAP
 
@@ -11,16 +12,28 @@ from jarvis.jarvis_utils.builtin_replace_map import BUILTIN_REPLACE_MAP
 
 GLOBAL_CONFIG_DATA: Dict[str, Any] = {}
 
+# 已解析模型配置的缓存（按model_group_override区分）。
+# get_normal_platform_name等访问器在热路径上被反复调用，而配置
+# 只在set_global_env_data/set_config时变化，无须每次重新扫描模型组
+_resolved_config_cache: Dict[Optional[str], Dict[str, Any]] = {}
+
+
+def clear_config_cache() -> None:
+    """清空已解析模型配置的缓存（配置变更或测试时调用）"""
+    _resolved_config_cache.clear()
+
 
 def set_global_env_data(env_data: Dict[str, Any]) -> None:
     """设置全局环境变量数据"""
     global GLOBAL_CONFIG_DATA
     GLOBAL_CONFIG_DATA = env_data
+    clear_config_cache()
 
 
 def set_config(key: str, value: Any) -> None:
     """设置配置"""
     GLOBAL_CONFIG_DATA[key] = value
+    clear_config_cache()
 
 
 """配置管理模块。
@@ -66,7 +79,7 @@ def get_replace_map() -> dict:
     print("⚠️ 警告：使用replace_map.yaml进行配置的方式已被弃用，将在未来版本中移除。请迁移到使用GLOBAL_CONFIG_DATA中的JARVIS_REPLACE_MAP配置。")
 
     with open(replace_map_path, "r", encoding="utf-8", errors="ignore") as file:
-        file_map = yaml.safe_load(file) or {}
+        file_map = yaml_safe_load(file) or {}
         return {**BUILTIN_REPLACE_MAP, **file_map}
 
 
@@ -125,6 +138,10 @@ def _get_resolved_model_config(
     返回:
         Dict[str, Any]: 解析后的模型配置字典
     """
+    cached = _resolved_config_cache.get(model_group_override)
+    if cached is not None:
+        return cached
+
     group_config = {}
     model_group_name = model_group_override or GLOBAL_CONFIG_DATA.get(
         "JARVIS_LLM_GROUP"
@@ -176,6 +193,7 @@ def _get_resolved_model_config(
                 if key not in resolved_config:
                     resolved_config[key] = GLOBAL_CONFIG_DATA[key]
 
+    _resolved_config_cache[model_group_override] = resolved_config
     return resolved_config
 
 
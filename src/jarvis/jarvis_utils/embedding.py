@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional
 
 
 # 设置tiktoken缓存目录
@@ -10,6 +10,19 @@ tiktoken_cache_dir = script_dir / "../jarvis_data/tiktoken"
 os.makedirs(tiktoken_cache_dir, exist_ok=True)
 os.environ["TIKTOKEN_CACHE_DIR"] = str(tiktoken_cache_dir.absolute())
 
+# 模块级缓存的编码器，避免每次计算token都重新获取
+_encoding: Optional[Any] = None
+
+
+def _get_encoding() -> Any:
+    """获取缓存的tiktoken编码器（首次调用时初始化）。"""
+    global _encoding
+    if _encoding is None:
+        import tiktoken
+
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    return _encoding
+
 
 def get_context_token_count(text: str) -> int:
     """使用tiktoken获取文本的token数量。
@@ -24,10 +37,7 @@ def get_context_token_count(text: str) -> int:
     if text is None or text == "":
         return 0
     try:
-        import tiktoken
-
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
+        return len(_get_encoding().encode(text))
     except Exception as e:
         print(f"⚠️ 计算token失败: {str(e)}")
         return len(text) // 4  # 每个token大约4个字符的粗略估计
@@ -38,6 +48,9 @@ def split_text_into_chunks(
 ) -> List[str]:
     """将文本分割成块，基于token数量进行切割。
 
+    对整段文本只做一次tokenize，然后按真实的token边界切分，
+    避免逐小段重复编码带来的开销与边界误差。
+
     参数：
         text: 要分割的输入文本
         max_length: 每个块的最大token数量
@@ -50,31 +63,30 @@ def split_text_into_chunks(
         return []
 
     try:
-        chunks = []
-        current_chunk = ""
-        current_tokens = 0
-
-        # 按较大的块处理文本，避免破坏token边界
-        chunk_size = 50  # 每次处理50个字符
-        for i in range(0, len(text), chunk_size):
-            chunk = text[i : i + chunk_size]
-            chunk_tokens = get_context_token_count(chunk)
-
-            # 如果当前块加上新块会超过最大长度，且当前块已经达到最小长度，则保存当前块
-            if (
-                current_tokens + chunk_tokens > max_length
-                and current_tokens >= min_length
-            ):
-                chunks.append(current_chunk)
-                current_chunk = chunk
-                current_tokens = chunk_tokens
-            else:
-                current_chunk += chunk
-                current_tokens += chunk_tokens
-
-        # 处理最后一个块
-        if current_chunk:
-            chunks.append(current_chunk)  # 直接添加最后一个块，无论长度如何
+        encoding = _get_encoding()
+        tokens = encoding.encode(text)
+        if len(tokens) <= max_length:
+            return [text]
+
+        chunks: List[str] = []
+        start = 0
+        total = len(tokens)
+        while start < total:
+            end = min(start + max_length, total)
+            piece = encoding.decode_bytes(tokens[start:end])
+            # 避免在多字节字符中间切分：向后扩展边界直到字节序列可解码
+            while True:
+                try:
+                    chunk_str = piece.decode("utf-8")
+                    break
+                except UnicodeDecodeError:
+                    if end >= total:
+                        chunk_str = piece.decode("utf-8", errors="replace")
+                        break
+                    end += 1
+                    piece = encoding.decode_bytes(tokens[start:end])
+            chunks.append(chunk_str)
+            start = end
 
         return chunks
 
@@ -20,6 +20,22 @@ from jarvis.jarvis_utils.config import get_data_dir, is_confirm_before_apply_pat
 from jarvis.jarvis_utils.input import user_confirm
 from jarvis.jarvis_utils.utils import is_rag_installed
 
+# diff解析相关正则：模块导入时编译一次，逐行匹配时直接用编译对象，
+# 避免每行都经过re模块的缓存查找
+_DIFF_FILE_RE = re.compile(r"^\+\+\+ b/(.*)")
+_DIFF_HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+_SHORTSTAT_INSERTIONS_RE = re.compile(r"(\d+)\s+insertions?\(\+\)")
+_SHORTSTAT_DELETIONS_RE = re.compile(r"(\d+)\s+deletions?\(\-\)")
+_VERSION_SPLIT_RE = re.compile(r"([0-9]+)")
+
+# 只读git查询共用的环境：GIT_OPTIONAL_LOCKS=0跳过可选的index.lock，
+# 并发读取时互不阻塞；LC_ALL=C省去locale初始化开销
+_GIT_RO_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
+# 起始目录到Git根目录的缓存：同一目录的归属在进程内基本不变，
+# 命中时用一次.git存在性检查代替一次git子进程调用
+_git_root_cache: Dict[str, str] = {}
+
 
 def find_git_root_and_cd(start_dir: str = ".") -> str:
     """
@@ -31,6 +47,12 @@ def find_git_root_and_cd(start_dir: str = ".") -> str:
     返回:
         str: Git仓库根目录路径。如果目录不是Git仓库，则会初始化一个新的Git仓库。
     """
+    abs_start = os.path.abspath(start_dir)
+    cached = _git_root_cache.get(abs_start)
+    # .git可能是目录（普通仓库）或文件（worktree/submodule），用exists校验
+    if cached is not None and os.path.exists(os.path.join(cached, ".git")):
+        os.chdir(cached)
+        return cached
     os.chdir(start_dir)
     try:
         result = subprocess.run(
@@ -48,6 +70,7 @@ def find_git_root_and_cd(start_dir: str = ".") -> str:
         subprocess.run(["git", "init"], check=True)
         git_root = os.path.abspath(".")
     os.chdir(git_root)
+    _git_root_cache[abs_start] = git_root
     return git_root
 
 
@@ -57,37 +80,16 @@ def has_uncommitted_changes() -> bool:
     返回:
         bool: 如果有未提交的更改返回True，否则返回False
     """
-    # 静默添加所有更改
-    subprocess.run(
-        ["git", "add", "."], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-    )
-
-    # 检查工作目录更改
-    working_changes = (
-        subprocess.run(
-            ["git", "diff", "--exit-code"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        ).returncode
-        != 0
-    )
-
-    # 检查暂存区更改
-    staged_changes = (
-        subprocess.run(
-            ["git", "diff", "--cached", "--exit-code"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        ).returncode
-        != 0
-    )
-
-    # 静默重置更改
-    subprocess.run(
-        ["git", "reset"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    # 单次只读status即可覆盖工作区、暂存区和未跟踪文件，
+    # 避免"git add ." + 两次diff + "git reset"的全量索引重写
+    result = subprocess.run(
+        ["git", "status", "--porcelain"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env=_GIT_RO_ENV,
     )
-
-    return working_changes or staged_changes
+    return bool(result.stdout.strip())
 
 
 def get_commits_between(start_hash: str, end_hash: str) -> List[Tuple[str, str]]:
@@ -107,6 +109,7 @@ def get_commits_between(start_hash: str, end_hash: str) -> List[Tuple[str, str]]
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=False,  # 禁用自动文本解码
+            env=_GIT_RO_ENV,
         )
         if result.returncode != 0:
             error_msg = result.stderr.decode("utf-8", errors="replace")
@@ -141,24 +144,53 @@ def get_diff() -> str:
             ["git", "rev-parse", "--verify", "HEAD"],
             stderr=subprocess.PIPE,
             stdout=subprocess.PIPE,
+            env=_GIT_RO_ENV,
         )
         confirm_add_new_files()
         if head_check.returncode != 0:
             # 空仓库情况，直接获取工作区差异
             result = subprocess.run(
-                ["git", "diff"], capture_output=True, text=False, check=True
+                ["git", "diff"],
+                capture_output=True,
+                text=False,
+                check=True,
+                env=_GIT_RO_ENV,
             )
         else:
-            # 暂存新增文件
-            subprocess.run(["git", "add", "-N", "."], check=True)
+            # 仅对未跟踪文件做intent-to-add，让它们出现在diff中；
+            # 避免"git add -N ." + "git reset"对整个工作树的索引重写，
+            # 没有未跟踪文件时完全不碰索引
+            untracked_result = subprocess.run(
+                ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+                capture_output=True,
+                text=False,
+                env=_GIT_RO_ENV,
+            )
+            untracked = [
+                p
+                for p in untracked_result.stdout.decode(
+                    "utf-8", errors="replace"
+                ).split("\0")
+                if p
+            ]
+            if untracked:
+                subprocess.run(["git", "add", "-N", "--"] + untracked, check=True)
 
             # 获取所有差异（包括新增文件）
             result = subprocess.run(
-                ["git", "diff", "HEAD"], capture_output=True, text=False, check=True
+                ["git", "diff", "HEAD"],
+                capture_output=True,
+                text=False,
+                check=True,
+                env=_GIT_RO_ENV,
             )
 
-            # 重置暂存区
-            subprocess.run(["git", "reset"], check=True)
+            if untracked:
+                subprocess.run(
+                    ["git", "reset", "-q", "--"] + untracked,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                )
 
         try:
             return result.stdout.decode("utf-8")
@@ -171,28 +203,54 @@ def get_diff() -> str:
         return f"发生意外错误: {str(e)}"
 
 
-def revert_file(filepath: str) -> None:
-    """增强版git恢复，处理新文件"""
-    import subprocess
+def revert_files(filepaths: List[str]) -> None:
+    """批量git恢复，处理新文件
+
+    单文件恢复需要3次git子进程调用，逐个恢复N个文件时进程启动开销
+    占主导；这里一次ls-files区分出已跟踪/未跟踪文件，再各用一条
+    命令批量恢复。
+
+    参数:
+        filepaths: 要恢复的文件路径列表
+    """
+    if not filepaths:
+        return
 
     try:
-        # 检查文件是否在版本控制中
+        # 一次性区分已跟踪与未跟踪文件（-z避免特殊文件名转义问题）
         result = subprocess.run(
-            ["git", "ls-files", "--error-unmatch", filepath],
+            ["git", "ls-files", "-z", "--"] + filepaths,
+            stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=False,  # 禁用自动文本解码
+            env=_GIT_RO_ENV,
         )
-        if result.returncode == 0:
-            subprocess.run(["git", "checkout", "HEAD", "--", filepath], check=True)
-        else:
+        tracked = set()
+        if result.returncode == 0 and result.stdout:
+            tracked = {
+                p
+                for p in result.stdout.decode("utf-8", errors="replace").split("\0")
+                if p
+            }
+        tracked_files = [f for f in filepaths if f in tracked]
+        untracked_files = [f for f in filepaths if f not in tracked]
+
+        if tracked_files:
+            subprocess.run(["git", "checkout", "HEAD", "--"] + tracked_files, check=True)
+        for filepath in untracked_files:
             if os.path.exists(filepath):
                 os.remove(filepath)
-        subprocess.run(["git", "clean", "-f", "--", filepath], check=True)
+        subprocess.run(["git", "clean", "-f", "--"] + filepaths, check=True)
     except subprocess.CalledProcessError as e:
         error_msg = e.stderr.decode("utf-8", errors="replace") if e.stderr else str(e)
         print(f"❌ 恢复文件失败: {error_msg}")
 
 
+def revert_file(filepath: str) -> None:
+    """增强版git恢复，处理新文件"""
+    revert_files([filepath])
+
+
 # 修改后的恢复函数
 
 
@@ -249,6 +307,7 @@ def detect_large_code_deletion(threshold: int = 30) -> Optional[Dict[str, int]]:
                 encoding="utf-8",
                 errors="replace",
                 check=False,
+                env=_GIT_RO_ENV,
             )
         else:
             # 空仓库，获取工作区diff统计
@@ -259,6 +318,7 @@ def detect_large_code_deletion(threshold: int = 30) -> Optional[Dict[str, int]]:
                 encoding="utf-8",
                 errors="replace",
                 check=False,
+                env=_GIT_RO_ENV,
             )
         
         # 重置暂存区
@@ -268,8 +328,8 @@ def detect_large_code_deletion(threshold: int = 30) -> Optional[Dict[str, int]]:
         if diff_result.returncode == 0 and diff_result.stdout:
             insertions = 0
             deletions = 0
-            insertions_match = re.search(r"(\d+)\s+insertions?\(\+\)", diff_result.stdout)
-            deletions_match = re.search(r"(\d+)\s+deletions?\(\-\)", diff_result.stdout)
+            insertions_match = _SHORTSTAT_INSERTIONS_RE.search(diff_result.stdout)
+            deletions_match = _SHORTSTAT_DELETIONS_RE.search(diff_result.stdout)
             if insertions_match:
                 insertions = int(insertions_match.group(1))
             if deletions_match:
@@ -360,22 +420,13 @@ def get_latest_commit_hash() -> str:
         str: 提交哈希值，如果不在Git仓库、空仓库或发生错误则返回空字符串
     """
     try:
-        # 首先检查是否存在HEAD引用
-        head_check = subprocess.run(
-            ["git", "rev-parse", "--verify", "HEAD"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=False,
-        )
-        if head_check.returncode != 0:
-            return ""  # 空仓库或无效HEAD
-
-        # 获取HEAD的完整哈希值
+        # rev-parse --verify 校验与取值一步完成，空仓库/无效HEAD时返回非零
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
+            ["git", "rev-parse", "--verify", "HEAD"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=False,
+            env=_GIT_RO_ENV,
         )
         return (
             result.stdout.decode("utf-8", errors="replace").strip()
@@ -394,35 +445,42 @@ def get_modified_line_ranges() -> Dict[str, List[Tuple[int, int]]]:
         行号从1开始。
     """
     # 获取所有文件的Git差异
-    # 仅用于解析修改行范围，减少上下文以降低输出体积和解析成本
-    proc = subprocess.run(
-        ["git", "show", "--no-color"],
-        capture_output=True,
+    # -U0去掉上下文行，只保留hunk头和文件头；流式逐行消费，
+    # 避免把整个diff缓冲成一个大字符串（大提交时峰值内存与diff同量级）
+    proc = subprocess.Popen(
+        ["git", "show", "--no-color", "-U0"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
+        env=_GIT_RO_ENV,
     )
-    diff_output = proc.stdout
 
     # 解析差异以获取修改的文件及其行范围
     result: Dict[str, List[Tuple[int, int]]] = {}
     current_file = None
 
-    for line in diff_output.splitlines():
-        # 匹配类似"+++ b/path/to/file"的行
-        file_match = re.match(r"^\+\+\+ b/(.*)", line)
-        if file_match:
-            current_file = file_match.group(1)
-            continue
-
-        # 匹配类似"@@ -100,5 +100,7 @@"的行，其中+部分显示新行
-        range_match = re.match(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", line)
-        if range_match and current_file:
-            start_line = int(range_match.group(1))  # 保持从1开始
-            line_count = int(range_match.group(2)) if range_match.group(2) else 1
-            end_line = start_line + line_count - 1
-            if current_file not in result:
-                result[current_file] = []
-            result[current_file].append((start_line, end_line))
-
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        # 先看首字符再进正则：绝大多数行是+/-内容行，单字符判断
+        # 比每行跑一次正则便宜得多
+        first_char = line[:1]
+        if first_char == "+":
+            # 匹配类似"+++ b/path/to/file"的行
+            file_match = _DIFF_FILE_RE.match(line)
+            if file_match:
+                current_file = file_match.group(1)
+        elif first_char == "@" and current_file:
+            # 匹配类似"@@ -100,5 +100,7 @@"的行，其中+部分显示新行
+            range_match = _DIFF_HUNK_RE.match(line)
+            if range_match:
+                start_line = int(range_match.group(1))  # 保持从1开始
+                line_count = int(range_match.group(2)) if range_match.group(2) else 1
+                end_line = start_line + line_count - 1
+                if current_file not in result:
+                    result[current_file] = []
+                result[current_file].append((start_line, end_line))
+
+    proc.wait()
     return result
 
 
@@ -492,7 +550,7 @@ def check_and_update_git_repo(repo_path: str) -> bool:
             tags = sorted(
                 tags,
                 key=lambda x: [
-                    int(i) if i.isdigit() else i for i in re.split(r"([0-9]+)", x)
+                    int(i) if i.isdigit() else i for i in _VERSION_SPLIT_RE.split(x)
                 ],
             )
             remote_tag = tags[-1] if tags else ""
@@ -1,23 +1,47 @@
 # -*- coding: utf-8 -*-
 
+import threading
+
 import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
 from typing import Any, Dict, Optional, Generator
+from urllib3.util.retry import Retry  # type: ignore[import-untyped]
+
+# 进程级共享Session：保持HTTP keep-alive连接池，避免每个请求
+# 重新做TCP+TLS握手（对流式对话这类高频请求开销明显）
+_shared_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
 
 
 def get_requests_session() -> requests.Session:
     """
-    获取一个配置好的 requests.Session 对象
+    获取进程级共享的 requests.Session 对象（带连接池和重试）
 
     返回:
         requests.Session 对象
+
+    注意:
+        Retry默认只重试幂等方法（GET/PUT/DELETE等），POST失败不会自动重发。
     """
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
-        }
-    )
-    return session
+    global _shared_session
+    if _shared_session is None:
+        with _session_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                session.headers.update(
+                    {
+                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
+                    }
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=2, backoff_factor=0.2),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _shared_session = session
+    return _shared_session
 
 
 # 增强版本的 HTTP 请求方法（使用 requests 实现）
@@ -44,10 +68,10 @@ def post(
         永不超时通过 timeout=None 设置。
     """
     kwargs.setdefault("timeout", None)
-    with get_requests_session() as session:
-        response = session.post(url=url, data=data, json=json, **kwargs)
-        response.raise_for_status()
-        return response
+    session = get_requests_session()
+    response = session.post(url=url, data=data, json=json, **kwargs)
+    response.raise_for_status()
+    return response
 
 
 def get(url: str, **kwargs) -> requests.Response:
@@ -66,10 +90,10 @@ def get(url: str, **kwargs) -> requests.Response:
         永不超时通过 timeout=None 设置。
     """
     kwargs.setdefault("timeout", None)
-    with get_requests_session() as session:
-        response = session.get(url=url, **kwargs)
-        response.raise_for_status()
-        return response
+    session = get_requests_session()
+    response = session.get(url=url, **kwargs)
+    response.raise_for_status()
+    return response
 
 
 def put(url: str, data: Optional[Any] = None, **kwargs) -> requests.Response:
@@ -89,10 +113,10 @@ def put(url: str, data: Optional[Any] = None, **kwargs) -> requests.Response:
         永不超时通过 timeout=None 设置。
     """
     kwargs.setdefault("timeout", None)
-    with get_requests_session() as session:
-        response = session.put(url=url, data=data, **kwargs)
-        response.raise_for_status()
-        return response
+    session = get_requests_session()
+    response = session.put(url=url, data=data, **kwargs)
+    response.raise_for_status()
+    return response
 
 
 def delete(url: str, **kwargs) -> requests.Response:
@@ -111,10 +135,10 @@ def delete(url: str, **kwargs) -> requests.Response:
         永不超时通过 timeout=None 设置。
     """
     kwargs.setdefault("timeout", None)
-    with get_requests_session() as session:
-        response = session.delete(url=url, **kwargs)
-        response.raise_for_status()
-        return response
+    session = get_requests_session()
+    response = session.delete(url=url, **kwargs)
+    response.raise_for_status()
+    return response
 
 
 # 同步流式POST请求方法
@@ -140,9 +164,17 @@ def stream_post(
         此方法使用 requests 实现流式请求，适用于处理大文件下载或流式响应
     """
     kwargs.setdefault("timeout", None)
-    with get_requests_session() as session:
-        with session.post(url, data=data, json=json, stream=True, **kwargs) as response:
-            response.raise_for_status()
-            for line in response.iter_lines(chunk_size=1):
-                if line:
-                    yield line.decode("utf-8", errors="ignore")
+    session = get_requests_session()
+    with session.post(url, data=data, json=json, stream=True, **kwargs) as response:
+        response.raise_for_status()
+        # chunked传输（SSE服务端的标准行为）下，urllib3按服务端发出的
+        # chunk边界及时返回数据，大chunk_size不增加首字节延迟，却能把
+        # 逐字节读取的解码开销降低几个数量级；只有罕见的定长流式响应
+        # 才退回逐字节读取以保证低延迟
+        if "chunked" in response.headers.get("Transfer-Encoding", "").lower():
+            chunk_size = 8192
+        else:
+            chunk_size = 1
+        for line in response.iter_lines(chunk_size=chunk_size):
+            if line:
+                yield line.decode("utf-8", errors="ignore")
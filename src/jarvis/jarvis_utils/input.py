@@ -15,7 +15,11 @@ from typing import Iterable, List, Optional
 import wcwidth
 from colorama import Fore
 from colorama import Style as ColoramaStyle
-from fuzzywuzzy import process
+try:
+    # rapidfuzz为C++实现，逐键打分的吞吐远高于纯Python的fuzzywuzzy
+    from rapidfuzz import process
+except ImportError:
+    from fuzzywuzzy import process  # type: ignore
 from prompt_toolkit import PromptSession
 from prompt_toolkit.application import Application, run_in_terminal
 from prompt_toolkit.completion import CompleteEvent
@@ -233,8 +237,54 @@ class FileCompleter(Completer):
         # Caches for file lists to avoid repeated expensive scans
         self._git_files_cache = None
         self._all_files_cache = None
+        # 全量文件缓存对应的根目录mtime，目录变化时自动失效
+        self._all_files_cache_mtime: Optional[int] = None
         self._max_walk_files = 10000
 
+    def _walk_all_files(self) -> List[str]:
+        """用os.scandir深度优先遍历当前目录，原地剪枝'.'开头的目录（如.git/.venv）
+
+        相比os.walk，scandir复用目录项自带的类型信息，免去每个文件的stat，
+        且被剪枝的隐藏目录完全不会被下探。
+        """
+        files: List[str] = []
+        prefix_len = len("." + os.sep)
+
+        def _walk(dirpath: str) -> bool:
+            try:
+                entries = os.scandir(dirpath)
+            except OSError:
+                return True
+            with entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name.startswith("."):
+                            continue
+                        if not _walk(entry.path):
+                            return False
+                    else:
+                        # 直接切掉'./'前缀，避免每个文件一次os.path.relpath
+                        files.append(entry.path[prefix_len:])
+                        if len(files) > self._max_walk_files:
+                            return False
+            return True
+
+        _walk(".")
+        return files
+
+    @staticmethod
+    def _is_subsequence(token: str, candidate: str) -> bool:
+        """线性双指针子序列判断：token中的字符按序出现在candidate中即命中
+
+        作为fuzzywuzzy打分前的廉价预筛，token需已转为小写。
+        """
+        it = iter(candidate.lower())
+        return all(ch in it for ch in token)
+
     def get_completions(
         self, document: Document, _: CompleteEvent
     ) -> Iterable[Completion]:
@@ -295,35 +345,40 @@ class FileCompleter(Completer):
                         self._git_files_cache = []
                 paths = self._git_files_cache or []
             else:
-                import os as _os
-
-                if self._all_files_cache is None:
-                    files: List[str] = []
-                    for root, dirs, fnames in _os.walk(".", followlinks=False):
-                        # Exclude .git directory
-                        dirs[:] = [d for d in dirs if d != ".git"]
-                        for name in fnames:
-                            files.append(
-                                _os.path.relpath(_os.path.join(root, name), ".")
-                            )
-                            if len(files) > self._max_walk_files:
-                                break
-                        if len(files) > self._max_walk_files:
-                            break
-                    self._all_files_cache = files
+                # 以根目录mtime为缓存键：目录未变化时跳过整棵树的重新扫描
+                try:
+                    root_mtime: Optional[int] = os.stat(".").st_mtime_ns
+                except OSError:
+                    root_mtime = None
+                if (
+                    self._all_files_cache is None
+                    or root_mtime is None
+                    or root_mtime != self._all_files_cache_mtime
+                ):
+                    self._all_files_cache = self._walk_all_files()
+                    self._all_files_cache_mtime = root_mtime
                 paths = self._all_files_cache or []
             all_completions.extend([(path, "File") for path in paths])
         except Exception:
             pass
 
         if token:
+            candidates = [item[0] for item in all_completions]
+            # 先用子序列测试粗筛，只把命中的候选交给昂贵的模糊打分；
+            # 全部未命中时回退到完整列表，保留容错匹配能力
+            lowered = token.lower()
+            filtered = [c for c in candidates if self._is_subsequence(lowered, c)]
             scored_items = process.extract(
                 token,
-                [item[0] for item in all_completions],
+                filtered or candidates,
                 limit=self.max_suggestions,
             )
+            # rapidfuzz返回(choice, score, index)三元组且分数为浮点数，
+            # 统一收窄为(choice, int_score)二元组
             scored_items = [
-                (item[0], item[1]) for item in scored_items if item[1] > self.min_score
+                (item[0], int(item[1]))
+                for item in scored_items
+                if item[1] > self.min_score
             ]
             completion_map = {item[0]: item[1] for item in all_completions}
             for t, score in scored_items:
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""JSON 兼容层 - 优先使用 orjson 加速解析
+
+平台的SSE流式响应每收到一行都要做一次JSON解码，orjson 的原生实现
+比标准库快数倍。此模块在导入时选择可用的最快实现，并提供与
+json.loads 接口一致的 loads 函数；orjson 未安装时静默回退标准库。
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """等价于 json.loads，但优先使用 orjson 解析器。
+
+        参数:
+            data: JSON字符串或字节串
+
+        返回:
+            Any: 解析后的Python对象
+        """
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - 取决于orjson是否安装
+    import json
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """等价于 json.loads（orjson未安装时的标准库回退）。
+
+        参数:
+            data: JSON字符串或字节串
+
+        返回:
+            Any: 解析后的Python对象
+        """
+        return json.loads(data)
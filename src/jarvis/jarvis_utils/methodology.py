@@ -10,7 +10,7 @@
 import json
 import os
 import tempfile
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from jarvis.jarvis_platform.base import BasePlatform
 from jarvis.jarvis_platform.registry import PlatformRegistry
@@ -40,6 +40,12 @@ def _get_methodology_directory() -> str:
     return methodology_dir
 
 
+# 方法论解析结果缓存：键为所有方法论文件的(路径, mtime_ns, 大小)快照，
+# 文件未变化时跳过重复的JSON解析
+_methodology_cache_key: Optional[Tuple[Tuple[str, int, int], ...]] = None
+_methodology_cache: Dict[str, str] = {}
+
+
 def _load_all_methodologies() -> Dict[str, str]:
     """
     从默认目录和配置的外部目录加载所有方法论文件。
@@ -84,30 +90,51 @@ def _load_all_methodologies() -> Dict[str, str]:
     warn_dirs: List[str] = []
     error_lines: List[str] = []
 
+    filepaths: List[str] = []
     for directory in set(methodology_dirs):  # Use set to avoid duplicates
         if not os.path.isdir(directory):
             warn_dirs.append(f"警告: 方法论目录不存在或不是一个目录: {directory}")
             continue
+        filepaths.extend(glob.glob(os.path.join(directory, "*.json")))
 
-        for filepath in glob.glob(os.path.join(directory, "*.json")):
-            try:
-                with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-                    methodology = json.load(f)
-                    problem_type = methodology.get("problem_type", "")
-                    content = methodology.get("content", "")
-                    if problem_type and content:
-                        if problem_type in all_methodologies:
-                            pass
-                        all_methodologies[problem_type] = content
-            except Exception as e:
-                filename = os.path.basename(filepath)
-                error_lines.append(f"加载方法论文件 {filename} 失败: {str(e)}")
+    # 构建文件状态快照，内容未变化时直接复用上次的解析结果
+    global _methodology_cache_key
+    snapshot: List[Tuple[str, int, int]] = []
+    for filepath in filepaths:
+        try:
+            st = os.stat(filepath)
+            snapshot.append((filepath, st.st_mtime_ns, st.st_size))
+        except OSError:
+            snapshot.append((filepath, -1, -1))
+    cache_key = tuple(sorted(snapshot))
+    if _methodology_cache_key is not None and cache_key == _methodology_cache_key:
+        if warn_dirs:
+            print("⚠️ " + "\n⚠️ ".join(warn_dirs))
+        return dict(_methodology_cache)
+
+    for filepath in filepaths:
+        try:
+            with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+                methodology = json.load(f)
+                problem_type = methodology.get("problem_type", "")
+                content = methodology.get("content", "")
+                if problem_type and content:
+                    if problem_type in all_methodologies:
+                        pass
+                    all_methodologies[problem_type] = content
+        except Exception as e:
+            filename = os.path.basename(filepath)
+            error_lines.append(f"加载方法论文件 {filename} 失败: {str(e)}")
 
     # 统一打印目录警告与文件加载失败信息
     if warn_dirs:
         print("⚠️ " + "\n⚠️ ".join(warn_dirs))
     if error_lines:
         print("⚠️ " + "\n⚠️ ".join(error_lines))
+
+    _methodology_cache_key = cache_key
+    _methodology_cache.clear()
+    _methodology_cache.update(all_methodologies)
     return all_methodologies
 
 
@@ -215,11 +242,11 @@ def load_methodology(
         print(f"✅ 加载方法论文件完成 (共 {len(methodologies)} 个)")
 
         if platform_name:
-            platform = PlatformRegistry().create_platform(platform_name)
+            platform = PlatformRegistry.get_global_platform_registry().create_platform(platform_name)
             if platform and model_name:
                 platform.set_model_name(model_name)
         else:
-            platform = PlatformRegistry().get_normal_platform()
+            platform = PlatformRegistry.get_global_platform_registry().get_normal_platform()
 
         if not platform:
             print("❌ 无法创建平台实例")
@@ -234,8 +261,9 @@ def load_methodology(
         selection_prompt = """以下是所有可用的方法论标题：
 
 """
-        for i, title in enumerate(methodology_titles, 1):
-            selection_prompt += f"{i}. {title}\n"
+        selection_prompt += "".join(
+            f"{i}. {title}\n" for i, title in enumerate(methodology_titles, 1)
+        )
 
         selection_prompt += f"""
 以下是可用的工具列表：
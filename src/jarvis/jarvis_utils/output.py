@@ -89,6 +89,89 @@ class OutputSink(ABC):
         raise NotImplementedError
 
 
+# 各输出类型的样式定义不随调用变化，模块加载时构造一次，
+# 避免每次打印都重建十余个RichStyle对象
+_BG_STYLES: Dict[OutputType, Dict[str, Any]] = {
+    OutputType.SYSTEM: dict(bgcolor="#1e2b3c"),
+    OutputType.CODE: dict(bgcolor="#1c2b1c"),
+    OutputType.RESULT: dict(bgcolor="#1c1c2b"),
+    OutputType.ERROR: dict(bgcolor="#2b1c1c"),
+    OutputType.INFO: dict(bgcolor="#2b2b1c", meta={"icon": "ℹ️"}),
+    OutputType.PLANNING: dict(bgcolor="#2b1c2b"),
+    OutputType.PROGRESS: dict(bgcolor="#1c1c1c"),
+    OutputType.SUCCESS: dict(bgcolor="#1c2b1c"),
+    OutputType.WARNING: dict(bgcolor="#2b2b1c"),
+    OutputType.DEBUG: dict(bgcolor="#1c1c1c"),
+    OutputType.USER: dict(bgcolor="#1c2b2b"),
+    OutputType.TOOL: dict(bgcolor="#1c2b2b"),
+}
+
+_HEADER_STYLES: Dict[OutputType, RichStyle] = {
+    OutputType.SYSTEM: RichStyle(
+        color="bright_cyan", bgcolor="#1e2b3c", frame=True, meta={"icon": "🤖"}
+    ),
+    OutputType.CODE: RichStyle(
+        color="green", bgcolor="#1c2b1c", frame=True, meta={"icon": "📝"}
+    ),
+    OutputType.RESULT: RichStyle(
+        color="bright_blue", bgcolor="#1c1c2b", frame=True, meta={"icon": "✨"}
+    ),
+    OutputType.ERROR: RichStyle(
+        color="red", frame=True, bgcolor="#2b1c1c", meta={"icon": "❌"}
+    ),
+    OutputType.INFO: RichStyle(
+        color="bright_cyan", frame=True, bgcolor="#2b2b1c", meta={"icon": "ℹ️"}
+    ),
+    OutputType.PLANNING: RichStyle(
+        color="purple",
+        bold=True,
+        frame=True,
+        bgcolor="#2b1c2b",
+        meta={"icon": "📋"},
+    ),
+    OutputType.PROGRESS: RichStyle(
+        color="white",
+        encircle=True,
+        frame=True,
+        bgcolor="#1c1c1c",
+        meta={"icon": "⏳"},
+    ),
+    OutputType.SUCCESS: RichStyle(
+        color="bright_green",
+        bold=True,
+        strike=False,
+        bgcolor="#1c2b1c",
+        meta={"icon": "✅"},
+    ),
+    OutputType.WARNING: RichStyle(
+        color="yellow",
+        bold=True,
+        blink2=True,
+        bgcolor="#2b2b1c",
+        meta={"icon": "⚠️"},
+    ),
+    OutputType.DEBUG: RichStyle(
+        color="grey58",
+        dim=True,
+        conceal=True,
+        bgcolor="#1c1c1c",
+        meta={"icon": "🔍"},
+    ),
+    OutputType.USER: RichStyle(
+        color="spring_green2",
+        frame=True,
+        bgcolor="#1c2b2b",
+        meta={"icon": "👤"},
+    ),
+    OutputType.TOOL: RichStyle(
+        color="dark_sea_green4",
+        bgcolor="#1c2b2b",
+        frame=True,
+        meta={"icon": "🔧"},
+    ),
+}
+
+
 class ConsoleOutputSink(OutputSink):
     """
     默认控制台输出实现，保持与原 PrettyOutput 行为一致。
@@ -112,101 +195,16 @@ class ConsoleOutputSink(OutputSink):
             else PrettyOutput._detect_language(event.text, default_lang="markdown")
         )
 
-        # 与原实现保持一致的样式定义
-        styles: Dict[OutputType, Dict[str, Any]] = {
-            OutputType.SYSTEM: dict(bgcolor="#1e2b3c"),
-            OutputType.CODE: dict(bgcolor="#1c2b1c"),
-            OutputType.RESULT: dict(bgcolor="#1c1c2b"),
-            OutputType.ERROR: dict(bgcolor="#2b1c1c"),
-            OutputType.INFO: dict(bgcolor="#2b2b1c", meta={"icon": "ℹ️"}),
-            OutputType.PLANNING: dict(bgcolor="#2b1c2b"),
-            OutputType.PROGRESS: dict(bgcolor="#1c1c1c"),
-            OutputType.SUCCESS: dict(bgcolor="#1c2b1c"),
-            OutputType.WARNING: dict(bgcolor="#2b2b1c"),
-            OutputType.DEBUG: dict(bgcolor="#1c1c1c"),
-            OutputType.USER: dict(bgcolor="#1c2b2b"),
-            OutputType.TOOL: dict(bgcolor="#1c2b2b"),
-        }
-
-        header_styles = {
-            OutputType.SYSTEM: RichStyle(
-                color="bright_cyan", bgcolor="#1e2b3c", frame=True, meta={"icon": "🤖"}
-            ),
-            OutputType.CODE: RichStyle(
-                color="green", bgcolor="#1c2b1c", frame=True, meta={"icon": "📝"}
-            ),
-            OutputType.RESULT: RichStyle(
-                color="bright_blue", bgcolor="#1c1c2b", frame=True, meta={"icon": "✨"}
-            ),
-            OutputType.ERROR: RichStyle(
-                color="red", frame=True, bgcolor="#2b1c1c", meta={"icon": "❌"}
-            ),
-            OutputType.INFO: RichStyle(
-                color="bright_cyan", frame=True, bgcolor="#2b2b1c", meta={"icon": "ℹ️"}
-            ),
-            OutputType.PLANNING: RichStyle(
-                color="purple",
-                bold=True,
-                frame=True,
-                bgcolor="#2b1c2b",
-                meta={"icon": "📋"},
-            ),
-            OutputType.PROGRESS: RichStyle(
-                color="white",
-                encircle=True,
-                frame=True,
-                bgcolor="#1c1c1c",
-                meta={"icon": "⏳"},
-            ),
-            OutputType.SUCCESS: RichStyle(
-                color="bright_green",
-                bold=True,
-                strike=False,
-                bgcolor="#1c2b1c",
-                meta={"icon": "✅"},
-            ),
-            OutputType.WARNING: RichStyle(
-                color="yellow",
-                bold=True,
-                blink2=True,
-                bgcolor="#2b2b1c",
-                meta={"icon": "⚠️"},
-            ),
-            OutputType.DEBUG: RichStyle(
-                color="grey58",
-                dim=True,
-                conceal=True,
-                bgcolor="#1c1c1c",
-                meta={"icon": "🔍"},
-            ),
-            OutputType.USER: RichStyle(
-                color="spring_green2",
-                frame=True,
-                bgcolor="#1c2b2b",
-                meta={"icon": "👤"},
-            ),
-            OutputType.TOOL: RichStyle(
-                color="dark_sea_green4",
-                bgcolor="#1c2b2b",
-                frame=True,
-                meta={"icon": "🔧"},
-            ),
-        }
-
-        Text(
-            PrettyOutput._format(event.output_type, event.timestamp),
-            style=header_styles[event.output_type],
-        )
         content = Syntax(
             event.text,
             lang,
             theme="monokai",
             word_wrap=True,
-            background_color=styles[event.output_type]["bgcolor"],
+            background_color=_BG_STYLES[event.output_type]["bgcolor"],
         )
         panel = Panel(
             content,
-            border_style=header_styles[event.output_type],
+            border_style=_HEADER_STYLES[event.output_type],
             padding=(0, 0),
             highlight=True,
         )
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import functools
 import hashlib
 import json
 import os
@@ -14,6 +15,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, date
 
 import yaml  # type: ignore
+from jarvis.jarvis_utils.yaml_compat import safe_load as yaml_safe_load
 from rich.align import Align
 from rich.console import RenderableType
 
@@ -349,7 +351,8 @@ def _check_pip_updates() -> bool:
         url = "https://pypi.org/pypi/jarvis-ai-assistant/json"
         try:
             with urllib.request.urlopen(url, timeout=5) as response:
-                data = json.loads(response.read().decode())
+                # json.loads直接接受bytes，省一次中间str拷贝
+                data = json.loads(response.read())
                 latest_version = data["info"]["version"]
         except (urllib.error.URLError, KeyError, ValueError):
             return False
@@ -1135,7 +1138,7 @@ def _load_config_file(config_file: str) -> Tuple[str, dict]:
     """
     with open(config_file, "r", encoding="utf-8") as f:
         content = f.read()
-        config_data = yaml.safe_load(content) or {}
+        config_data = yaml_safe_load(content) or {}
         return content, config_data
 
 
@@ -2064,6 +2067,25 @@ def get_file_md5(filepath: str) -> str:
     return h.hexdigest()
 
 
+@functools.lru_cache(maxsize=4096)
+def _line_count_cached(filename: str, _mtime_ns: int, _size: int) -> int:
+    """按stat标识缓存的行数统计，文件未变化时直接复用结果"""
+    # 按1MiB二进制块统计换行符，免去逐行解码，内存占用与文件大小无关
+    count = 0
+    last_chunk = b""
+    with open(filename, "rb") as f:
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            count += chunk.count(b"\n")
+            last_chunk = chunk
+    # 末尾无换行符的非空文件仍算最后一行
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        count += 1
+    return count
+
+
 def get_file_line_count(filename: str) -> int:
     """计算文件中的行数
 
@@ -2074,9 +2096,8 @@ def get_file_line_count(filename: str) -> int:
         int: 文件中的行数，如果文件无法读取则返回0
     """
     try:
-        # 使用流式逐行计数，避免将整个文件读入内存
-        with open(filename, "r", encoding="utf-8", errors="ignore") as f:
-            return sum(1 for _ in f)
+        st = os.stat(filename)
+        return _line_count_cached(filename, st.st_mtime_ns, st.st_size)
     except Exception:
         return 0
 
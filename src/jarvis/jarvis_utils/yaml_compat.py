@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""YAML 兼容层 - 优先使用 libyaml C 扩展加速解析
+
+PyYAML 的 yaml.safe_load 在未绑定 libyaml 时会静默回退到纯 Python
+解析器，速度相差约一个数量级。此模块在导入时选择可用的最快 Loader，
+并提供与 yaml.safe_load 接口一致的 safe_load 函数。
+"""
+
+from typing import Any
+
+import yaml  # type: ignore[import-untyped]
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - 取决于PyYAML是否绑定libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeDumper as SafeDumper  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - 取决于PyYAML是否绑定libyaml
+    from yaml import SafeDumper  # type: ignore[assignment]
+
+
+def safe_load(stream: Any) -> Any:
+    """等价于 yaml.safe_load，但优先使用 libyaml C 解析器。
+
+    参数:
+        stream: 字符串、字节串或文件对象
+
+    返回:
+        Any: 解析后的Python对象
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """等价于 yaml.safe_dump，但优先使用 libyaml C 序列化器。
+
+    参数:
+        data: 要序列化的Python对象
+        stream: 可选的输出流，省略时返回字符串
+
+    返回:
+        Any: stream为None时返回序列化后的字符串，否则返回None
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
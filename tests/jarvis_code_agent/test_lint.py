@@ -30,7 +30,7 @@ class TestLintTools:
     
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open)
-    @patch('yaml.safe_load')
+    @patch('jarvis.jarvis_code_agent.lint.yaml_safe_load')
     def test_load_lint_tools_config_with_file(self, mock_yaml_load, mock_file, mock_exists):
         """测试从yaml文件加载配置"""
         mock_exists.return_value = True
@@ -59,7 +59,7 @@ class TestLintTools:
     
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open)
-    @patch('yaml.safe_load')
+    @patch('jarvis.jarvis_code_agent.lint.yaml_safe_load')
     def test_load_lint_tools_config_empty_file(self, mock_yaml_load, mock_file, mock_exists):
         """测试空配置文件的情况"""
         mock_exists.return_value = True
@@ -110,7 +110,7 @@ class TestLintTools:
     @patch('jarvis.jarvis_code_agent.lint.get_data_dir')
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open)
-    @patch('yaml.safe_load')
+    @patch('jarvis.jarvis_code_agent.lint.yaml_safe_load')
     def test_config_merge(self, mock_yaml_load, mock_file, mock_exists, mock_get_data_dir):
         """测试配置合并功能"""
         # 设置mock返回值
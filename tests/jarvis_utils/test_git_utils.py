@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """jarvis_utils.git_utils 模块单元测试"""
 
+import io
+
 from unittest.mock import patch, MagicMock
 
 from jarvis.jarvis_utils.git_utils import (
@@ -81,8 +83,8 @@ class TestDetectLargeCodeDeletion:
 class TestGetModifiedLineRanges:
     """测试 get_modified_line_ranges 函数"""
 
-    @patch("jarvis.jarvis_utils.git_utils.subprocess.run")
-    def test_single_file_single_range(self, mock_run):
+    @patch("jarvis.jarvis_utils.git_utils.subprocess.Popen")
+    def test_single_file_single_range(self, mock_popen):
         """测试单个文件的单个范围"""
         diff_output = """diff --git a/test.py b/test.py
 index 1234567..abcdefg 100644
@@ -94,9 +96,9 @@ index 1234567..abcdefg 100644
 +new line 2
  line 11
 """
-        mock_run.return_value = MagicMock(
+        mock_popen.return_value = MagicMock(
             returncode=0,
-            stdout=diff_output
+            stdout=io.StringIO(diff_output)
         )
         
         result = get_modified_line_ranges()
@@ -105,8 +107,8 @@ index 1234567..abcdefg 100644
         # @@ -10,5 +10,7 @@ 表示从第10行开始，新增7行，所以结束行是 10 + 7 - 1 = 16
         assert result["test.py"][0] == (10, 16)
 
-    @patch("jarvis.jarvis_utils.git_utils.subprocess.run")
-    def test_multiple_files_multiple_ranges(self, mock_run):
+    @patch("jarvis.jarvis_utils.git_utils.subprocess.Popen")
+    def test_multiple_files_multiple_ranges(self, mock_popen):
         """测试多个文件的多个范围"""
         diff_output = """diff --git a/file1.py b/file1.py
 +++ b/file1.py
@@ -120,9 +122,9 @@ diff --git a/file2.py b/file2.py
  line 20
 +new line
 """
-        mock_run.return_value = MagicMock(
+        mock_popen.return_value = MagicMock(
             returncode=0,
-            stdout=diff_output
+            stdout=io.StringIO(diff_output)
         )
         
         result = get_modified_line_ranges()
@@ -131,12 +133,12 @@ diff --git a/file2.py b/file2.py
         assert len(result["file1.py"]) >= 1
         assert len(result["file2.py"]) >= 1
 
-    @patch("jarvis.jarvis_utils.git_utils.subprocess.run")
-    def test_no_changes(self, mock_run):
+    @patch("jarvis.jarvis_utils.git_utils.subprocess.Popen")
+    def test_no_changes(self, mock_popen):
         """测试没有变更的情况"""
-        mock_run.return_value = MagicMock(
+        mock_popen.return_value = MagicMock(
             returncode=0,
-            stdout=""
+            stdout=io.StringIO("")
         )
         
         result = get_modified_line_ranges()